@@ -5,63 +5,43 @@ from conflowgen.api.container_flow_generation_manager import ContainerFlowGenera
 from conflowgen.api.container_dwell_time_distribution_manager import ContainerDwellTimeDistributionManager
 from conflowgen.api.database_chooser import DatabaseChooser
 from conflowgen.api.export_container_flow_manager import ExportContainerFlowManager
+from conflowgen.api.export_reports_manager import ExportReportsManager
 from conflowgen.api.mode_of_transport_distribution_manager import ModeOfTransportDistributionManager
 from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.api.scenario_sweep_manager import ScenarioSweepManager
 from conflowgen.api.truck_arrival_distribution_manager import TruckArrivalDistributionManager
 from conflowgen.api.storage_requirement_distribution_manager import \
     StorageRequirementDistributionManager
 
-# Previews and their reports
-from conflowgen.previews.inbound_and_outbound_vehicle_capacity_preview_report import \
-    InboundAndOutboundVehicleCapacityPreviewReport
+# Previews
 from conflowgen.previews.inbound_and_outbound_vehicle_capacity_preview import \
     InboundAndOutboundVehicleCapacityPreview
 from conflowgen.previews.container_flow_by_vehicle_type_preview import \
     ContainerFlowByVehicleTypePreview
-from conflowgen.previews.container_flow_by_vehicle_type_preview_report import \
-    ContainerFlowByVehicleTypePreviewReport
 from conflowgen.previews.vehicle_capacity_exceeded_preview import VehicleCapacityExceededPreview
-from conflowgen.previews.vehicle_capacity_exceeded_preview_report import \
-    VehicleCapacityUtilizationOnOutboundJourneyPreviewReport
 from conflowgen.previews.modal_split_preview import ModalSplitPreview
-from conflowgen.previews.modal_split_preview_report import ModalSplitPreviewReport
 from conflowgen.previews.truck_gate_throughput_preview import TruckGateThroughputPreview
-from conflowgen.previews.truck_gate_throughput_preview_report import TruckGateThroughputPreviewReport
+from conflowgen.previews.batched_hypotheses_preview import BatchedHypothesesPreview, BatchedPreviewMetrics
+from conflowgen.previews.yard_capacity_preview import YardCapacityPreview
+from conflowgen.previews.quay_side_throughput_preview import QuaySideThroughputPreview
 
-# Analyses and their reports
+# Analyses
 from conflowgen.analyses.inbound_and_outbound_vehicle_capacity_analysis import \
     InboundAndOutboundVehicleCapacityAnalysis
-from conflowgen.analyses.inbound_and_outbound_vehicle_capacity_analysis_report import \
-    InboundAndOutboundVehicleCapacityAnalysisReport
 from conflowgen.analyses.inbound_to_outbound_vehicle_capacity_utilization_analysis import \
     InboundToOutboundVehicleCapacityUtilizationAnalysis
-from conflowgen.analyses.inbound_to_outbound_vehicle_capacity_utilization_analysis_report import \
-    InboundToOutboundVehicleCapacityUtilizationAnalysisReport
 from conflowgen.analyses.container_flow_by_vehicle_type_analysis import ContainerFlowByVehicleTypeAnalysis
-from conflowgen.analyses.container_flow_by_vehicle_type_analysis_report import \
-    ContainerFlowByVehicleTypeAnalysisReport
 from conflowgen.analyses.modal_split_analysis import ModalSplitAnalysis
-from conflowgen.analyses.modal_split_analysis_report import ModalSplitAnalysisReport
 from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis import \
     ContainerFlowAdjustmentByVehicleTypeAnalysis
-from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis_report import \
-    ContainerFlowAdjustmentByVehicleTypeAnalysisReport
 from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis_summary import \
     ContainerFlowAdjustmentByVehicleTypeAnalysisSummary
-from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis_summary_report import \
-    ContainerFlowAdjustmentByVehicleTypeAnalysisSummaryReport
 from conflowgen.analyses.yard_capacity_analysis import YardCapacityAnalysis
-from conflowgen.analyses.yard_capacity_analysis_report import YardCapacityAnalysisReport
 from conflowgen.analyses.quay_side_throughput_analysis import QuaySideThroughputAnalysis
-from conflowgen.analyses.quay_side_throughput_analysis_report import QuaySideThroughputAnalysisReport
 from conflowgen.analyses.truck_gate_throughput_analysis import TruckGateThroughputAnalysis
-from conflowgen.analyses.truck_gate_throughput_analysis_report import TruckGateThroughputAnalysisReport
 from conflowgen.analyses.container_dwell_time_analysis import ContainerDwellTimeAnalysis
-from conflowgen.analyses.container_dwell_time_analysis_report import ContainerDwellTimeAnalysisReport
 from conflowgen.analyses.container_flow_vehicle_type_adjustment_per_vehicle_analysis import \
     ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysis
-from conflowgen.analyses.container_flow_vehicle_type_adjustment_per_vehicle_analysis_report import \
-    ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysisReport
 
 # Cache for analyses and previews
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
@@ -75,7 +55,9 @@ from conflowgen.domain_models.distribution_models.container_dwell_time_distribut
     ContainerDwellTimeDistributionInterface
 
 # List of enums
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
 from conflowgen.application.data_types.export_file_format import ExportFileFormat
+from conflowgen.application.data_types.report_file_format import ReportFileFormat
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
@@ -96,6 +78,10 @@ from conflowgen.descriptive_datatypes import UsedYardCapacityOverTime
 from conflowgen.analyses.inbound_to_outbound_vehicle_capacity_utilization_analysis import \
     VehicleIdentifier
 from conflowgen.descriptive_datatypes import ContainerVolumeByVehicleType
+from conflowgen.application.services.scenario_sweep_service import ScenarioSweepResult
+from conflowgen.flow_generator.generation_statistics import GenerationStats, PhaseStats
+from conflowgen.database_connection.sql_query_tracer import SqlQueryTracer, QueryStatistics
+from conflowgen.tools.profiler import Profiler
 
 # Add metadata constants
 from .metadata import __version__
@@ -103,3 +89,43 @@ from .metadata import __author__
 from .metadata import __email__
 from .metadata import __license__
 from .metadata import __description__ as __doc__
+
+# The reports of the previews and analyses are imported on first access, see PEP 562.
+# They depend on matplotlib and plotly which take long to import and are not needed for generating or exporting data.
+_lazy_attributes = {
+    report_name: "conflowgen.previews" for report_name in (
+        "ContainerFlowByVehicleTypePreviewReport",
+        "InboundAndOutboundVehicleCapacityPreviewReport",
+        "ModalSplitPreviewReport",
+        "TruckGateThroughputPreviewReport",
+        "VehicleCapacityUtilizationOnOutboundJourneyPreviewReport",
+    )
+}
+_lazy_attributes.update({
+    report_name: "conflowgen.analyses" for report_name in (
+        "ContainerDwellTimeAnalysisReport",
+        "ContainerFlowAdjustmentByVehicleTypeAnalysisReport",
+        "ContainerFlowAdjustmentByVehicleTypeAnalysisSummaryReport",
+        "ContainerFlowByVehicleTypeAnalysisReport",
+        "ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysisReport",
+        "InboundAndOutboundVehicleCapacityAnalysisReport",
+        "InboundToOutboundVehicleCapacityUtilizationAnalysisReport",
+        "ModalSplitAnalysisReport",
+        "QuaySideThroughputAnalysisReport",
+        "TruckGateThroughputAnalysisReport",
+        "YardCapacityAnalysisReport",
+    )
+})
+
+
+def __getattr__(name: str):
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib  # pylint: disable=import-outside-toplevel
+    value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attributes))
@@ -1,41 +1,47 @@
 import datetime
+import importlib
 import logging
 import typing
 
-from .container_dwell_time_analysis_report import ContainerDwellTimeAnalysisReport
-from .container_flow_adjustment_by_vehicle_type_analysis_report import \
-    ContainerFlowAdjustmentByVehicleTypeAnalysisReport
-from .container_flow_adjustment_by_vehicle_type_analysis_summary_report import \
-    ContainerFlowAdjustmentByVehicleTypeAnalysisSummaryReport
-from .container_flow_by_vehicle_type_analysis_report import ContainerFlowByVehicleTypeAnalysisReport
-from .container_flow_vehicle_type_adjustment_per_vehicle_analysis_report import \
-    ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysisReport
-from .inbound_and_outbound_vehicle_capacity_analysis_report import InboundAndOutboundVehicleCapacityAnalysisReport
-from .inbound_to_outbound_vehicle_capacity_utilization_analysis_report import \
-    InboundToOutboundVehicleCapacityUtilizationAnalysisReport
-from .modal_split_analysis_report import ModalSplitAnalysisReport
-from .quay_side_throughput_analysis_report import QuaySideThroughputAnalysisReport
-from .truck_gate_throughput_analysis_report import TruckGateThroughputAnalysisReport
-from .yard_capacity_analysis_report import YardCapacityAnalysisReport
-from ..reporting import AbstractReport
 from ..reporting.auto_reporter import AutoReporter
 from ..reporting.output_style import DisplayAsMarkupLanguage
 
 logger = logging.getLogger("conflowgen")
 
-reports: typing.Iterable[typing.Type[AbstractReport]] = [
-    InboundAndOutboundVehicleCapacityAnalysisReport,
-    ContainerFlowByVehicleTypeAnalysisReport,
-    ContainerFlowAdjustmentByVehicleTypeAnalysisReport,
-    ContainerFlowAdjustmentByVehicleTypeAnalysisSummaryReport,
-    ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysisReport,
-    ModalSplitAnalysisReport,
-    ContainerDwellTimeAnalysisReport,
-    QuaySideThroughputAnalysisReport,
-    TruckGateThroughputAnalysisReport,
-    YardCapacityAnalysisReport,
-    InboundToOutboundVehicleCapacityUtilizationAnalysisReport
-]
+#: The reports of the analyses in the order in which they are presented, each with the module that defines it.
+#: They are only imported on first access because the reports depend on the plotting libraries.
+_report_modules: typing.Dict[str, str] = {
+    "InboundAndOutboundVehicleCapacityAnalysisReport": ".inbound_and_outbound_vehicle_capacity_analysis_report",
+    "ContainerFlowByVehicleTypeAnalysisReport": ".container_flow_by_vehicle_type_analysis_report",
+    "ContainerFlowAdjustmentByVehicleTypeAnalysisReport":
+        ".container_flow_adjustment_by_vehicle_type_analysis_report",
+    "ContainerFlowAdjustmentByVehicleTypeAnalysisSummaryReport":
+        ".container_flow_adjustment_by_vehicle_type_analysis_summary_report",
+    "ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysisReport":
+        ".container_flow_vehicle_type_adjustment_per_vehicle_analysis_report",
+    "ModalSplitAnalysisReport": ".modal_split_analysis_report",
+    "ContainerDwellTimeAnalysisReport": ".container_dwell_time_analysis_report",
+    "QuaySideThroughputAnalysisReport": ".quay_side_throughput_analysis_report",
+    "TruckGateThroughputAnalysisReport": ".truck_gate_throughput_analysis_report",
+    "YardCapacityAnalysisReport": ".yard_capacity_analysis_report",
+    "InboundToOutboundVehicleCapacityUtilizationAnalysisReport":
+        ".inbound_to_outbound_vehicle_capacity_utilization_analysis_report"
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "reports":
+        value = [__getattr__(report_name) for report_name in _report_modules]
+    elif name in _report_modules:
+        value = getattr(importlib.import_module(_report_modules[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_report_modules) + ["reports"])
 
 
 def run_all_analyses(
@@ -76,6 +82,9 @@ def run_all_analyses(
         end_date:
             Only include containers that depart before the given end time (if supported by the report).
     """
+    # The lazy lookup of this module imports the reports, importing them from this module itself would be circular
+    reports = __getattr__("reports")
+
     auto_reporter = AutoReporter(
         as_text=as_text,
         as_graph=as_graph,
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import datetime
 import statistics
-import typing  # noqa, pylint: disable=unused-import  # lgtm [py/unused-import]  # used in the docstring
+import typing
 
-import matplotlib.axis
 import pandas as pd
 
 from conflowgen.analyses.container_dwell_time_analysis import ContainerDwellTimeAnalysis
 from conflowgen.reporting import AbstractReportWithMatplotlib
 from conflowgen.reporting.no_data_plot import no_data_graph
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axis
+
 
 class ContainerDwellTimeAnalysisReport(AbstractReportWithMatplotlib):
     """
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import itertools
 import logging
-
-import plotly.graph_objs
+import typing
 
 from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis import \
     ContainerFlowAdjustmentByVehicleTypeAnalysis
 from conflowgen.reporting import AbstractReportWithPlotly
 
+if typing.TYPE_CHECKING:
+    import plotly.graph_objs
+
 
 class ContainerFlowAdjustmentByVehicleTypeAnalysisReport(AbstractReportWithPlotly):
     """
@@ -124,9 +126,11 @@ class ContainerFlowAdjustmentByVehicleTypeAnalysisReport(AbstractReportWithPlotl
                 round(to_adjusted_flow[i], 2)) + " " + unit
             for i, vehicle_type_adjusted in enumerate(initial_to_adjusted_outbound_flow_in_teu.keys())
         ]
-        fig = plotly.graph_objs.Figure(
+        from plotly import graph_objs  # pylint: disable=import-outside-toplevel
+
+        fig = graph_objs.Figure(
             data=[
-                plotly.graph_objs.Sankey(
+                graph_objs.Sankey(
                     arrangement='perpendicular',
                     node={
                         'pad': 15,
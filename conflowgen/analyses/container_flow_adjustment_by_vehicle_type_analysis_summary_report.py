@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import typing  # noqa, pylint: disable=unused-import  # lgtm [py/unused-import]  # used in the docstring
+import typing
 
-import matplotlib.axis
 import numpy as np
 import pandas as pd
 
@@ -11,6 +10,9 @@ from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis_summ
 from conflowgen.reporting import AbstractReportWithMatplotlib
 from conflowgen.reporting.no_data_plot import no_data_graph
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axis
+
 
 class ContainerFlowAdjustmentByVehicleTypeAnalysisSummaryReport(AbstractReportWithMatplotlib):
     """
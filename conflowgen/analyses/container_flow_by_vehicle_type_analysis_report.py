@@ -5,13 +5,14 @@ import logging
 from collections.abc import Collection
 import typing
 
-import plotly.graph_objects
-
 from conflowgen.descriptive_datatypes import ContainerVolumeFromOriginToDestination
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.analyses.container_flow_by_vehicle_type_analysis import ContainerFlowByVehicleTypeAnalysis
 from conflowgen.reporting import AbstractReportWithPlotly
 
+if typing.TYPE_CHECKING:
+    import plotly.graph_objects
+
 
 class ContainerFlowByVehicleTypeAnalysisReport(AbstractReportWithPlotly):
     """
@@ -154,9 +155,11 @@ class ContainerFlowByVehicleTypeAnalysisReport(AbstractReportWithPlotly):
                 round(to_outbound_flow[i], 2)) + " " + unit
             for i, outbound_vehicle_type in enumerate(inbound_to_outbound_flow.keys())
         ]
-        fig = plotly.graph_objects.Figure(
+        from plotly import graph_objects  # pylint: disable=import-outside-toplevel
+
+        fig = graph_objects.Figure(
             data=[
-                plotly.graph_objects.Sankey(
+                graph_objects.Sankey(
                     arrangement='perpendicular',
                     node={
                         "pad": 15,
@@ -3,10 +3,7 @@ from __future__ import annotations
 import datetime
 import typing
 
-import matplotlib.axes
 import pandas as pd
-from matplotlib import pyplot as plt
-from matplotlib.ticker import FuncFormatter
 
 from conflowgen.analyses.container_flow_vehicle_type_adjustment_per_vehicle_analysis import \
     ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysis
@@ -14,6 +11,9 @@ from conflowgen.analyses.inbound_to_outbound_vehicle_capacity_utilization_analys
 from conflowgen.reporting import AbstractReportWithMatplotlib
 from conflowgen.reporting.no_data_plot import no_data_graph
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axes
+
 
 class ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysisReport(AbstractReportWithMatplotlib):
     """
@@ -152,6 +152,9 @@ class ContainerFlowVehicleTypeAdjustmentPerVehicleAnalysisReport(AbstractReportW
         Returns:
              The matplotlib figure
         """
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+        from matplotlib.ticker import FuncFormatter  # pylint: disable=import-outside-toplevel
+
         (
             initial_vehicle_type, adjusted_vehicle_type, start_date, end_date, fraction_per_vehicle
         ) = self._get_analysis(kwargs)
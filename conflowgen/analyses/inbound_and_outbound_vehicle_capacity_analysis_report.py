@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import typing
 
-import matplotlib.axis
 import numpy as np
 import pandas as pd
 
@@ -11,6 +10,9 @@ from conflowgen.analyses.inbound_and_outbound_vehicle_capacity_analysis import \
     InboundAndOutboundVehicleCapacityAnalysis
 from conflowgen.reporting import AbstractReportWithMatplotlib
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axis
+
 
 class InboundAndOutboundVehicleCapacityAnalysisReport(AbstractReportWithMatplotlib):
     """
@@ -3,9 +3,6 @@ from __future__ import annotations
 import datetime
 import typing
 
-import matplotlib.pyplot as plt
-import matplotlib.ticker
-import matplotlib.figure
 import pandas as pd
 
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -14,6 +11,10 @@ from conflowgen.analyses.inbound_to_outbound_vehicle_capacity_utilization_analys
 from conflowgen.reporting import AbstractReportWithMatplotlib
 from conflowgen.reporting.no_data_plot import no_data_graph
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axes
+    import matplotlib.figure
+
 
 class UnsupportedPlotTypeException(Exception):
     pass
@@ -129,6 +130,8 @@ class InboundToOutboundVehicleCapacityUtilizationAnalysisReport(AbstractReportWi
         Returns:
              The matplotlib figure
         """
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         # kwargs for plot
         plot_type = kwargs.pop("plot_type", "all")
 
@@ -183,8 +186,8 @@ class InboundToOutboundVehicleCapacityUtilizationAnalysisReport(AbstractReportWi
 
     def _plot_absolute_values(
             self,
-            ax: typing.Optional[matplotlib.pyplot.axis] = None
-    ) -> matplotlib.pyplot.axis:
+            ax: typing.Optional[matplotlib.axes.Axes] = None
+    ) -> matplotlib.axes.Axes:
         ax = self._df.plot.scatter(x="inbound volume (in TEU)", y="outbound volume (in TEU)", ax=ax)
         slope = 1 + self.transportation_buffer
         ax.axline((0, 0), slope=slope, color='black', label='outbound capacity (in TEU)')
@@ -214,8 +217,8 @@ class InboundToOutboundVehicleCapacityUtilizationAnalysisReport(AbstractReportWi
 
     def _plot_relative_values(
             self,
-            ax: typing.Optional[matplotlib.pyplot.axis] = None
-    ) -> matplotlib.pyplot.axis:
+            ax: typing.Optional[matplotlib.axes.Axes] = None
+    ) -> matplotlib.axes.Axes:
         ax = self._df.plot.scatter(x="inbound volume (in TEU)", y="ratio", ax=ax)
         ax.axline((0, (1 + self.transportation_buffer)), slope=0, color='black', label='outbound capacity (in TEU)')
         ax.axline((0, 1), slope=0, color='gray', label='equilibrium')
@@ -227,8 +230,8 @@ class InboundToOutboundVehicleCapacityUtilizationAnalysisReport(AbstractReportWi
 
     def _plot_relative_values_over_time(
             self,
-            ax: typing.Optional[matplotlib.pyplot.axis] = None
-    ) -> matplotlib.pyplot.axis:
+            ax: typing.Optional[matplotlib.axes.Axes] = None
+    ) -> matplotlib.axes.Axes:
         ax = self._df.plot.scatter(x="arrival time", y="ratio", ax=ax)
         df_arrival_time = self._df.set_index("arrival time")
         df_arrival_time["ratio"].rename("ratio outbound to inbound volume (in TEU)", inplace=True)
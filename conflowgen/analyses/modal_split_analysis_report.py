@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import typing  # noqa, pylint: disable=unused-import  # lgtm [py/unused-import]  # used in the docstring
-import matplotlib.axes
+import typing
 
 from conflowgen.analyses.modal_split_analysis import ModalSplitAnalysis
 from conflowgen.reporting import AbstractReportWithMatplotlib, modal_split_report
 from conflowgen.reporting.modal_split_report import plot_modal_splits
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axes
+
 
 class ModalSplitAnalysisReport(AbstractReportWithMatplotlib):
     """
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import statistics
+import typing
+
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.axis
 
 from conflowgen.analyses.quay_side_throughput_analysis import QuaySideThroughputAnalysis
 from conflowgen.reporting import AbstractReportWithMatplotlib
 from conflowgen.reporting.no_data_plot import no_data_graph
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axis
+
 
 class QuaySideThroughputAnalysisReport(AbstractReportWithMatplotlib):
     """
@@ -74,6 +77,8 @@ class QuaySideThroughputAnalysisReport(AbstractReportWithMatplotlib):
         Returns:
              The matplotlib axis of the line chart over time.
         """
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         quay_side_throughput = self._get_analysis_result(kwargs)
         assert len(kwargs) == 0, f"Keyword(s) {list(kwargs.keys())} have not been processed."
 
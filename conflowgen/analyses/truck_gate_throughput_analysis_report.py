@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import statistics
-import typing  # noqa, pylint: disable=unused-import  # lgtm [py/unused-import]  # used in the docstring
-
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.axis
+import typing
 
 from conflowgen.analyses.truck_gate_throughput_analysis import TruckGateThroughputAnalysis
 from conflowgen.reporting import AbstractReportWithMatplotlib
 from conflowgen.reporting.no_data_plot import no_data_text
+from conflowgen.reporting.time_series import get_envelope_as_text, plot_time_series
+
+if typing.TYPE_CHECKING:
+    import matplotlib.axis
 
 
 class TruckGateThroughputAnalysisReport(AbstractReportWithMatplotlib):
@@ -24,8 +24,9 @@ class TruckGateThroughputAnalysisReport(AbstractReportWithMatplotlib):
     report_description = """
     Analyze the trucks entering through the truck gate at each hour. Based on this, the required truck gate capacity in
     containers boxes can be deduced.
-    In the text version of the report, only the statistics are reported.
+    In the text version of the report, only the statistics are reported unless an aggregation window is chosen.
     In the visual version of the report, the time series is plotted.
+    For long time series, the minimum, average, and maximum per aggregation window are plotted instead.
     """
 
     plot_tile = "Analysis of truck gate throughput"
@@ -45,6 +46,9 @@ class TruckGateThroughputAnalysisReport(AbstractReportWithMatplotlib):
                 Whether to check for trucks which deliver a container on their inbound journey
             outbound (bool):
                 Whether to check for trucks which pick up a container on their outbound journey
+            aggregation_window (datetime.timedelta):
+                If provided, the minimum, average, and maximum of the hourly throughput of each window of this length
+                are listed after the statistics.
 
         Returns:
             The report in text format.
@@ -53,6 +57,7 @@ class TruckGateThroughputAnalysisReport(AbstractReportWithMatplotlib):
         outbound = kwargs.pop("outbound", True)
         start_date = kwargs.pop("start_date", None)
         end_date = kwargs.pop("end_date", None)
+        aggregation_window = kwargs.pop("aggregation_window", None)
         assert len(kwargs) == 0, f"The following keys have not been processed: {list(kwargs.keys())}"
 
         truck_gate_throughput = self.analysis.get_throughput_over_time(
@@ -78,12 +83,15 @@ class TruckGateThroughputAnalysisReport(AbstractReportWithMatplotlib):
         report += f"average hourly truck gate throughput:         {average_truck_gate_throughput:>10.1f}\n"
         report += f"standard deviation:                           {stddev_truck_gate_throughput:>10.1f}\n"
         report += "(rounding errors might exist)\n"
+        if aggregation_window is not None and truck_gate_throughput:
+            report += "\n" + get_envelope_as_text(truck_gate_throughput, aggregation_window)
 
         return report
 
     def get_report_as_graph(self, **kwargs) -> matplotlib.axis.Axis:
         """
         The report as a graph is represented as a line graph using pandas.
+        Time series with more than 1000 hourly values are aggregated per 6 hours, day, or week.
 
         Keyword Args:
             start_date (datetime.datetime):
@@ -96,15 +104,22 @@ class TruckGateThroughputAnalysisReport(AbstractReportWithMatplotlib):
                 Whether to check for trucks which pick up a container on their outbound journey
             ax (matplotlib.axis.Axis):
                 Which matplotlib axis to plot on.
+            aggregation_window (datetime.timedelta):
+                The length of the windows the hourly values are aggregated in.
+                Defaults to one hour or, for longer time series, the first of 6 hours, one day, and one week that
+                yields at most 1000 windows.
 
         Returns:
              The matplotlib axis of the plot over time.
         """
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         inbound = kwargs.pop("inbound", True)
         outbound = kwargs.pop("outbound", True)
         start_date = kwargs.pop("start_date", None)
         end_date = kwargs.pop("end_date", None)
         ax = kwargs.pop("ax", None)
+        aggregation_window = kwargs.pop("aggregation_window", None)
         assert len(kwargs) == 0, f"The following keys have not been processed: {list(kwargs.keys())}"
 
         truck_gate_throughput = self.analysis.get_throughput_over_time(
@@ -117,11 +132,7 @@ class TruckGateThroughputAnalysisReport(AbstractReportWithMatplotlib):
         if len(truck_gate_throughput) == 0:
             ax = no_data_text(ax)
         else:
-            series = pd.Series(truck_gate_throughput)
-            if ax is None:
-                ax = series.plot()
-            else:
-                series.plot(ax=ax)
+            ax = plot_time_series(truck_gate_throughput, ax=ax, aggregation_window=aggregation_window)
             plt.xticks(rotation=45)
             ax.set_xlabel("Date")
             ax.set_ylabel("Number of boxes (hourly count)")
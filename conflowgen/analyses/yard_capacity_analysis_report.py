@@ -3,13 +3,15 @@ from __future__ import annotations
 import datetime
 import statistics
 import typing
-import pandas as pd
-import matplotlib.axis
 
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
 from conflowgen.analyses.yard_capacity_analysis import YardCapacityAnalysis
 from conflowgen.reporting import AbstractReportWithMatplotlib
 from conflowgen.reporting.no_data_plot import no_data_graph
+from conflowgen.reporting.time_series import get_envelope_as_text, plot_time_series
+
+if typing.TYPE_CHECKING:
+    import matplotlib.axis
 
 
 class YardCapacityAnalysisReport(AbstractReportWithMatplotlib):
@@ -25,8 +27,9 @@ class YardCapacityAnalysisReport(AbstractReportWithMatplotlib):
     Analyse the used capacity in the yard.
     For each hour, the containers entering and leaving the yard are checked.
     Based on this, the required yard capacity in TEU can be deduced.
-    In the text version of the report, only the statistics are reported.
+    In the text version of the report, only the statistics are reported unless an aggregation window is chosen.
     In the visual version of the report, the time series is plotted.
+    For long time series, the minimum, average, and maximum per aggregation window are plotted instead.
     There is no concept of handling times in the data generation process (as this is the task of the simulation or
     optimization model using this data on a later stage) and thus all containers are loaded and discharged at once.
     Thus, the yard utilization shows certain peaks that will most likely not occur, especially if the discharging and
@@ -35,7 +38,6 @@ class YardCapacityAnalysisReport(AbstractReportWithMatplotlib):
 
     def __init__(self):
         super().__init__()
-        self._series: pd.Series | None = None
         self.analysis = YardCapacityAnalysis()
 
     def get_report_as_text(self, **kwargs) -> str:
@@ -47,11 +49,14 @@ class YardCapacityAnalysisReport(AbstractReportWithMatplotlib):
                 collection of them, e.g., passed as a :class:`list` or :class:`set`.
                 For the exact interpretation of the parameter, check
                 :meth:`.YardCapacityAnalysis.get_used_yard_capacity_over_time`.
+            aggregation_window (datetime.timedelta): If provided, the minimum, average, and maximum of the used yard
+                capacity of each window of this length are listed after the statistics.
 
         Returns:
              The report in text format (possibly spanning over several lines).
         """
 
+        aggregation_window = kwargs.pop("aggregation_window", None)
         storage_requirement, used_yard_capacity_over_time = \
             self._get_used_yard_capacity_based_on_storage_requirement(kwargs)
 
@@ -72,29 +77,35 @@ class YardCapacityAnalysisReport(AbstractReportWithMatplotlib):
         report += f"average used yard capacity:                 {average_used_yard_capacity:>10.1f}\n"
         report += f"standard deviation:                         {stddev_used_yard_capacity:>10.1f}\n"
         report += "(rounding errors might exist)\n"
+        if aggregation_window is not None and used_yard_capacity_over_time:
+            report += "\n" + get_envelope_as_text(used_yard_capacity_over_time, aggregation_window)
         return report
 
     def get_report_as_graph(self, **kwargs) -> matplotlib.axis.Axis:
         """
         The report as a graph is represented as a line graph using pandas.
+        Time series with more than 1000 hourly values are aggregated per 6 hours, day, or week.
 
         Keyword Args:
             storage_requirement: Either a single storage requirement of type :class:`.StorageRequirement` or a whole
                 collection of them, e.g., passed as a :class:`list` or :class:`set`.
                 For the exact interpretation of the parameter, check
                 :meth:`.YardCapacityAnalysis.get_used_yard_capacity_over_time`.
+            aggregation_window (datetime.timedelta): The length of the windows the hourly values are aggregated in.
+                Defaults to one hour or, for longer time series, the first of 6 hours, one day, and one week that
+                yields at most 1000 windows.
 
         Returns:
              The matplotlib axis of the plot over time.
         """
 
+        aggregation_window = kwargs.pop("aggregation_window", None)
         storage_requirement, yard_capacity_over_time = self._get_used_yard_capacity_based_on_storage_requirement(kwargs)
 
         if len(yard_capacity_over_time) == 0:
             fig, ax = no_data_graph()
         else:
-            self._series = pd.Series(yard_capacity_over_time)
-            ax = self._series.plot()
+            ax = plot_time_series(yard_capacity_over_time, aggregation_window=aggregation_window)
         x_label = f"storage requirement = {self._get_storage_requirement_representation(storage_requirement)}"
         ax.set_xlabel(x_label)
         ax.set_ylabel("Used yard capacity (in TEU)")
@@ -2,11 +2,13 @@ import datetime
 import logging
 import typing
 
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 from conflowgen.application.repositories.container_flow_generation_properties_repository import \
     ContainerFlowGenerationPropertiesRepository
 from conflowgen.flow_generator.container_flow_generation_service import \
     ContainerFlowGenerationService
+from conflowgen.flow_generator.generation_statistics import GenerationStats, PhaseStats
 
 
 class ContainerFlowGenerationManager:
@@ -78,7 +80,30 @@ class ContainerFlowGenerationManager:
         """
         return self.container_flow_generation_service.container_flow_data_exists()
 
-    def generate(self, overwrite: bool = True) -> None:
+    def clear_container_flow(self, vacuum: bool = False) -> None:
+        """
+        Removes the generated container flow, i.e., all vehicles, containers, and truck arrival information, while the
+        schedules, the input distributions, and the properties remain.
+        All rows are removed within one transaction which is much faster than deleting them one by one.
+
+        Args:
+            vacuum: Whether to rebuild the SQLite database afterwards so that the file shrinks again.
+                This takes some time for large databases and is not possible within a transaction.
+                Defaults to :py:obj:`False`.
+        """
+        self.container_flow_generation_service.checkpoint_repository.delete_checkpoints(ContainerFlowGenerationPhase)
+        self.container_flow_generation_service.clear_previous_container_flow(vacuum=vacuum)
+        DataSummariesCache.reset_cache()
+
+    def generate(
+            self,
+            overwrite: bool = True,
+            resume: bool = False,
+            from_phase: typing.Optional[ContainerFlowGenerationPhase] = None,
+            on_phase_completed: typing.Optional[typing.Callable[[PhaseStats], None]] = None,
+            profile: bool = False,
+            profile_directory: typing.Optional[str] = None
+    ) -> typing.Optional[GenerationStats]:
         """
         Generate the synthetic container flow according to all the information stored in the database so far.
         This triggers a multistep procedure of generating vehicles and the containers which are delivered or picked up
@@ -90,12 +115,56 @@ class ContainerFlowGenerationManager:
         :meth:`.ContainerFlowGenerationManager.container_flow_data_exists`
         and skip invoking this method.
 
+        Each phase of the generation (see :class:`.ContainerFlowGenerationPhase`) is executed within one transaction.
+        Once a phase is completed, a checkpoint including the state of the random number generators is stored in the
+        database.
+
         Arguments:
             overwrite:
                 Whether to overwrite existing container flow data.
                 Defaults to :py:obj:`True`.
+            resume:
+                Whether to continue an interrupted generation after the last completed phase.
+                If all phases have been completed, nothing is done.
+                Defaults to :py:obj:`False`.
+            from_phase:
+                Only re-run the given phase and all phases that follow.
+                The data generated by these phases is removed first, while the data of the preceding phases is kept.
+                This is useful if only input data has been changed that affects later phases, e.g., only the truck
+                arrival distribution.
+                The preceding phase must have been completed.
+            on_phase_completed:
+                This function is called with the :class:`.PhaseStats` of each phase right after the phase has been
+                completed, e.g., to forward the numbers to a monitoring system.
+            profile:
+                Whether to profile each phase with the :class:`.Profiler`.
+                For each phase, a ``.pstats`` file and a ``.collapsed`` file with the sampled call stacks are saved.
+                Their names start with the name of the database, followed by ``generation_`` and the phase.
+            profile_directory:
+                The directory to save the profiles in.
+                Defaults to the directory of the current SQLite database.
+
+        Returns:
+            The resources used by the generation, in total and for each phase.
+            If the generation has been skipped because the data already exists, :py:obj:`None` is returned.
         """
-        if not overwrite and self.container_flow_data_exists():
+        if not overwrite and not resume and from_phase is None and self.container_flow_data_exists():
             self.logger.debug("Data already exists and it was not asked to overwrite existent data, skip this.")
-            return
-        self.container_flow_generation_service.generate()
+            return None
+        return self.container_flow_generation_service.generate(
+            resume=resume,
+            from_phase=from_phase,
+            on_phase_completed=on_phase_completed,
+            profile=profile,
+            profile_directory=profile_directory
+        )
+
+    def regenerate_truck_arrivals(self) -> None:
+        """
+        If only the :class:`.TruckArrivalDistributionManager` settings have been changed after the container flow has
+        been generated, the vehicles adhering to a schedule and the containers remain valid.
+        Then, it suffices to only re-create the trucks and their arrival times for the existing containers.
+        This is much faster than invoking :meth:`.ContainerFlowGenerationManager.generate` again.
+        The container flow must have been generated at least up to the containers delivered by trucks before.
+        """
+        self.container_flow_generation_service.regenerate_truck_arrivals()
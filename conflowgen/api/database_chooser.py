@@ -4,6 +4,7 @@ import typing
 from peewee import SqliteDatabase
 
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.database_connection.sql_query_tracer import SqlQueryTracer
 from conflowgen.database_connection.sqlite_database_connection import SqliteDatabaseConnection
 
 
@@ -81,6 +82,51 @@ class DatabaseChooser:
         )
         DataSummariesCache.reset_cache()
 
+    def clone_sqlite_database(
+            self,
+            source_file_name: str,
+            target_file_name: str,
+            include_flow: bool = False,
+            overwrite: bool = False
+    ) -> None:
+        """
+        Clone an SQLite database in the opened directory, e.g., to prepare a variant of a scenario without setting up
+        the schedules and the input distributions again.
+        The current connection is not changed, use :meth:`.DatabaseChooser.load_existing_sqlite_database` to open the
+        clone afterwards.
+
+        Args:
+            source_file_name: The file name of the SQLite database to clone
+            target_file_name: The file name of the clone
+            include_flow: Whether to also clone the generated container flow.
+                If :py:obj:`True`, the complete database is copied with the SQLite backup API.
+                Otherwise, only the input data such as the schedules, the input distributions, and the properties are
+                copied.
+                Defaults to :py:obj:`False`.
+            overwrite: Whether to overwrite an existing database with the same name as the clone
+        """
+        self.sqlite_database_connection.copy_database(
+            source_file_name, target_file_name, include_flow=include_flow, overwrite=overwrite
+        )
+
+    def trace_queries(self) -> SqlQueryTracer:
+        """
+        Record the SQL statements that are sent to the currently opened SQLite database, e.g., to find out which
+        statements dominate the container flow generation or an analysis.
+
+        .. code-block:: python
+
+            with database_chooser.trace_queries() as tracer:
+                ContainerFlowGenerationManager().generate()
+            tracer.print_report(top_n=10)
+
+        Returns:
+            The tracer, it records the statements while it is entered as a context manager
+        """
+        if self.peewee_sqlite_db is None:
+            raise NoCurrentConnectionException("You must first create a connection to an SQLite database.")
+        return self.sqlite_database_connection.trace_queries()
+
     def close_current_connection(self) -> None:
         """
         Close current connection, e.g., as a preparatory step to create a new SQLite database.
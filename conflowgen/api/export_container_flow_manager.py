@@ -4,6 +4,8 @@ import typing
 
 from conflowgen.application.services.export_container_flow_service import \
     ExportContainerFlowService
+from conflowgen.application.services.export_container_flow_to_sqlite_service import \
+    ExportContainerFlowToSqliteService
 from conflowgen.application.data_types.export_file_format import ExportFileFormat
 
 
@@ -16,23 +18,50 @@ class ExportContainerFlowManager:
 
     def __init__(self):
         self.service = ExportContainerFlowService()
+        self.sqlite_service = ExportContainerFlowToSqliteService()
 
     def export(
             self,
             folder_name: str,
             path_to_export_folder: typing.Optional[str] = None,
             file_format: typing.Optional[ExportFileFormat] = None,
-            overwrite: bool = False
+            overwrite: bool = False,
+            compression: typing.Optional[str] = None,
+            row_group_size: typing.Optional[int] = None,
+            chunk_size: typing.Optional[int] = None,
+            max_workers: int = 1
     ) -> str:
         """
         This extracts the container movement data from the SQL database to a folder of choice in a tabular data format.
+        Next to the files, a ``manifest.json`` lists the number of rows and a content hash of each table together with
+        the timestamps of the container flow generation properties.
+        When exporting to the same folder again with ``overwrite=True`` and the same file format settings, each table
+        whose content hash has not changed since the previous export is not written again.
 
         Args:
             folder_name: Name of folder that bundles the tabular data which belongs together
             path_to_export_folder: Path to directory where all exports are kept,
                 defaults to ``<project root>/data/exports/``
             file_format: Desired tabular format, defaults to :class:`ExportFileFormat.csv`.
-            overwrite: Whether to overwrite previously exported data, defaults to False
+            overwrite: Whether to overwrite previously exported data, defaults to False.
+                Unchanged tables are skipped (see above).
+            compression: Only for :class:`ExportFileFormat.parquet` and :class:`ExportFileFormat.feather`.
+                The compression codec, e.g., ``"snappy"``, ``"zstd"``, ``"lz4"``, or ``"uncompressed"``.
+                Defaults to ``"snappy"`` for Parquet and ``"lz4"`` for Feather.
+                Uncompressed Feather files can be memory-mapped.
+            row_group_size: Only for :class:`ExportFileFormat.parquet` and :class:`ExportFileFormat.feather`.
+                The maximum number of rows per row group (Parquet) or per record batch (Feather).
+                Defaults to the choice of pyarrow.
+            chunk_size: Only for :class:`ExportFileFormat.csv`.
+                If set, each table is read from the database in chunks of this many rows which are appended to the
+                file one after another.
+                This bounds the memory required for the export by the chunk size instead of the number of generated
+                containers.
+                Defaults to reading each table at once.
+            max_workers: The number of threads that export the tables concurrently.
+                Each thread reads its tables with its own read-only connection to the SQLite database.
+                If the database only exists in memory, the tables are always exported one after another.
+                Defaults to exporting one table after another.
 
         Returns:
             The path to the folder where the tabular data is located
@@ -43,6 +72,42 @@ class ExportContainerFlowManager:
             folder_name=folder_name,
             path_to_export_folder=path_to_export_folder,
             file_format=file_format,
-            overwrite=overwrite
+            overwrite=overwrite,
+            compression=compression,
+            row_group_size=row_group_size,
+            chunk_size=chunk_size,
+            max_workers=max_workers
         )
         return path_to_target_folder
+
+    def export_as_sqlite_database(
+            self,
+            file_name: str,
+            path_to_export_folder: typing.Optional[str] = None,
+            overwrite: bool = False
+    ) -> str:
+        """
+        This copies the container movement data into a compact SQLite database for tools that rather read a database
+        than tabular files.
+        The database contains the three tables ``containers``, ``vehicles``, and ``trucks``.
+        Next to the columns of the tabular export, each container also has the name of the delivering and picking up
+        vehicle as well as its arrival and departure time at the terminal.
+        The table ``vehicles`` contains the deep sea vessels, feeders, barges, and trains, distinguished by the column
+        ``vehicle_type``.
+        The data is copied by SQLite itself and never passes through Python, which makes this the fastest export for
+        large container flows.
+
+        Args:
+            file_name: The name of the SQLite database file. The suffix ``.sqlite`` is added if it is missing.
+            path_to_export_folder: Path to directory where all exports are kept,
+                defaults to ``<project root>/data/exports/``
+            overwrite: Whether to overwrite a previously exported database with the same name, defaults to False
+
+        Returns:
+            The path to the exported SQLite database
+        """
+        return self.sqlite_service.export(
+            file_name=file_name,
+            path_to_export_folder=path_to_export_folder,
+            overwrite=overwrite
+        )
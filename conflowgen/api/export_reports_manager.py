@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import typing
+
+from conflowgen.application.data_types.report_file_format import ReportFileFormat
+from conflowgen.application.services.export_reports_service import ExportReportsService
+from conflowgen.reporting import AbstractReport
+
+
+class ExportReportsManager:
+    """
+    Showing the reports one after another as with :func:`.run_all_previews` and :func:`.run_all_analyses` requires
+    someone to look at them.
+    This manager instead saves the reports to files, e.g., for comparing many scenarios in a nightly run.
+    """
+
+    def __init__(self):
+        self.service = ExportReportsService()
+
+    def export(
+            self,
+            folder_name: str,
+            path_to_export_folder: typing.Optional[str] = None,
+            file_format: typing.Optional[ReportFileFormat] = None,
+            overwrite: bool = False,
+            reports: typing.Optional[typing.Iterable[typing.Type[AbstractReport]]] = None,
+            max_workers: int = 1
+    ) -> str:
+        """
+        Each report is saved as a text file and its graph is saved in the chosen file format.
+        The graphs are drawn without showing them on screen.
+        An ``index.html`` lists all reports with their description, text, and graph.
+        If the graph of a report cannot be rendered, e.g., because an optional dependency is missing, the error is
+        logged and shown on the index page instead of the graph.
+
+        Args:
+            folder_name: Name of folder that bundles the reports which belong together
+            path_to_export_folder: Path to directory where all exports are kept,
+                defaults to ``<project root>/data/exports/``
+            file_format: The file format of the graphs, defaults to :class:`ReportFileFormat.png`.
+            overwrite: Whether to overwrite previously exported reports, defaults to False.
+            reports: The reports to export.
+                Defaults to all previews followed by all analyses, see :func:`.run_all_previews` and
+                :func:`.run_all_analyses`.
+            max_workers: The number of processes that render the reports concurrently.
+                Before the processes start, the arrival and departure times of all containers are determined once
+                and stored in the database.
+                Then each process opens the database with its own read-only connection.
+                As the processes render the reports independently of each other, this only pays off if the machine has
+                several processor cores to spare.
+                If the database only exists in memory, the reports are always rendered one after another.
+                Defaults to rendering one report after another.
+
+        Returns:
+            The path to the index page
+        """
+        if file_format is None:
+            file_format = ReportFileFormat.png
+        return self.service.export(
+            folder_name=folder_name,
+            path_to_export_folder=path_to_export_folder,
+            file_format=file_format,
+            overwrite=overwrite,
+            reports=reports,
+            max_workers=max_workers
+        )
@@ -2,6 +2,10 @@ import typing
 
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
 from conflowgen.api import AbstractDistributionManager
+from conflowgen.application.repositories.container_flow_generation_properties_repository import \
+    ContainerFlowGenerationPropertiesRepository
+from conflowgen.application.services.mode_of_transport_distribution_calibration_service import \
+    ModeOfTransportDistributionCalibrationService
 from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
     ModeOfTransportDistributionRepository
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
@@ -47,3 +51,43 @@ class ModeOfTransportDistributionManager(AbstractDistributionManager):
             sanitized_distribution
         )
         DataSummariesCache.reset_cache()
+
+    def calibrate_mode_of_transport_distribution(
+            self,
+            hinterland_modal_split: typing.Optional[typing.Dict[ModeOfTransport, float]] = None,
+            transshipment_share: typing.Optional[float] = None,
+            tolerance: float = 0.01,
+            keep_zero_entries: bool = True
+    ) -> typing.Dict[ModeOfTransport, typing.Dict[ModeOfTransport, float]]:
+        """
+        Searches for a mode of transport distribution for which the :class:`.VehicleCapacityExceededPreview` reports
+        no exceeded vehicle type and the :class:`.ModalSplitPreview` matches the targets.
+        The search is solved as a linear program over the capacity model of the previews and takes only milliseconds.
+        Among all distributions that meet the targets, the one closest to the current distribution is preferred.
+        The current distribution is not changed, use :meth:`.set_mode_of_transport_distribution` to apply the result.
+
+        Args:
+            hinterland_modal_split: The target shares of train, barge, and truck in the hinterland traffic, considering
+                both the inbound and the outbound journeys.
+            transshipment_share: The target share of the containers that are transshipped from vessel to vessel.
+            tolerance: The maximum deviation of each achieved share from its target.
+            keep_zero_entries: Whether the fractions that are zero in the current distribution must remain zero,
+                e.g., to rule out that containers are moved from barge to barge.
+
+        Returns:
+            The calibrated mode of transport distribution.
+            If the targets cannot be met without exceeding the outbound capacity of a vehicle type, a
+            ``NoFeasibleModeOfTransportDistributionException`` is raised.
+        """
+        properties = ContainerFlowGenerationPropertiesRepository().get_container_flow_generation_properties()
+        calibration_service = ModeOfTransportDistributionCalibrationService(
+            start_date=properties.start_date,
+            end_date=properties.end_date,
+            transportation_buffer=properties.transportation_buffer
+        )
+        return calibration_service.calibrate(
+            hinterland_modal_split=hinterland_modal_split,
+            transshipment_share=transshipment_share,
+            tolerance=tolerance,
+            keep_zero_entries=keep_zero_entries
+        )
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import typing
+
+from conflowgen.application.services.scenario_sweep_service import ScenarioSweepService, ScenarioSweepResult
+
+
+class ScenarioSweepManager:
+    """
+    This manager generates several variants of a scenario in parallel.
+    The scenario is described by a base SQLite database that contains the schedules, the input distributions, and the
+    properties of the container flow.
+    For each variant, the input data of the base database is cloned (see :meth:`.DatabaseChooser.clone_sqlite_database`)
+    and the variant-specific settings are applied to the clone.
+    Then, the container flow of each variant is generated in its own worker process against its own SQLite database.
+    This avoids any interference through the globally shared database connection and the cache of the data summaries.
+    """
+
+    def __init__(self, sqlite_databases_directory: typing.Optional[str] = None):
+        """
+        Args:
+            sqlite_databases_directory: The directory of the base database.
+                The databases of the variants are saved in the same directory.
+                It defaults to ``<project root>/data/databases/``.
+        """
+        self.service = ScenarioSweepService(sqlite_databases_directory=sqlite_databases_directory)
+
+    def run(
+            self,
+            base_file_name: str,
+            variants: typing.Dict[str, typing.Dict[str, typing.Any]],
+            max_workers: typing.Optional[int] = None,
+            overwrite: bool = False
+    ) -> typing.Dict[str, ScenarioSweepResult]:
+        """
+        Generate the container flow for each variant of the base scenario.
+        The database of a variant is saved as ``<base name>__<variant name>.sqlite`` next to the base database.
+
+        Args:
+            base_file_name: The file name of the SQLite database that contains the base scenario
+            variants: Maps the name of each variant to the settings that deviate from the base scenario.
+                The following settings are supported:
+
+                * ``transportation_buffer`` (:obj:`float`) - see
+                  :meth:`.ContainerFlowGenerationManager.set_properties`
+                * ``mode_of_transport_distribution`` - see
+                  :meth:`.ModeOfTransportDistributionManager.set_mode_of_transport_distribution`
+                * ``container_dwell_time_distribution`` - see
+                  :meth:`.ContainerDwellTimeDistributionManager.set_container_dwell_time_distribution`
+                * ``truck_arrival_distribution`` - see
+                  :meth:`.TruckArrivalDistributionManager.set_truck_arrival_distribution`
+
+            max_workers: The number of worker processes. Defaults to the number of available CPU cores, but never more
+                than the number of variants.
+            overwrite: Whether to overwrite the databases of previous runs of the same variants
+
+        Returns:
+            The summary of each variant, in the same order as the variants have been provided.
+        """
+        return self.service.run(
+            base_file_name=base_file_name,
+            variants=variants,
+            max_workers=max_workers,
+            overwrite=overwrite
+        )
@@ -0,0 +1,43 @@
+import enum
+
+import enum_tools
+
+
+@enum_tools.documentation.document_enum
+class ContainerFlowGenerationPhase(enum.Enum):
+    """
+    The container flow is generated in several consecutive phases.
+    After each phase, a checkpoint is stored in the database so that the generation can be resumed or only the
+    downstream phases can be re-run, see :meth:`.ContainerFlowGenerationManager.generate`.
+    The order of the members reflects the order in which the phases are executed.
+    """
+
+    fleet_creation = "fleet_creation"
+    """
+    The vehicles that adhere to a schedule are created together with the containers they deliver.
+    """
+
+    onward_transportation_assignment = "onward_transportation_assignment"
+    """
+    The containers that are picked up by a vehicle that adheres to a schedule are assigned to a specific vehicle.
+    """
+
+    trucks_for_import_containers = "trucks_for_import_containers"
+    """
+    The trucks that pick up containers are created.
+    """
+
+    containers_delivered_by_truck = "containers_delivered_by_truck"
+    """
+    The containers that are delivered by trucks are created and assigned to the vehicles they depart with.
+    """
+
+    trucks_for_export_containers = "trucks_for_export_containers"
+    """
+    The trucks that deliver containers are created.
+    """
+
+    destination_assignment = "destination_assignment"
+    """
+    The containers that are picked up by a vehicle that adheres to a schedule are assigned to their next destination.
+    """
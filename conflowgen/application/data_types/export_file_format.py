@@ -36,3 +36,21 @@ class ExportFileFormat(enum.Enum):
     which is less than what large terminals nowadays handle within a month. Even with a hypothetical TEU factor of 2,
     this only reaches 1,572,864 TEU throughput per year.
     """
+
+    parquet = "parquet"
+    """
+    The Apache Parquet file format stores the data column by column and compresses it.
+    The column types are kept, e.g., the enums are stored as categorical columns and the points in time as timestamps.
+    This is the recommended file format for large container flows that are read in by data analysis or simulation
+    tools.
+    It requires the optional dependency pyarrow.
+    """
+
+    feather = "feather"
+    """
+    The Feather file format is the Apache Arrow IPC format on disk.
+    Like Parquet, it keeps the column types.
+    If the file is not compressed, it can be memory-mapped by the reading tool.
+    The index of each table is stored as the column ``id``.
+    It requires the optional dependency pyarrow.
+    """
@@ -0,0 +1,31 @@
+import enum
+
+import enum_tools
+
+
+@enum_tools.documentation.document_enum
+class ReportFileFormat(enum.Enum):
+    """
+    The file format the graphs of the reports are saved in when exporting the reports.
+    The text version of each report is always saved as a plain text file.
+    """
+
+    png = "png"
+    """
+    Portable Network Graphics is a raster image format that can be displayed everywhere.
+    Plotly requires the optional dependency kaleido (and a browser it can use) for this.
+    """
+
+    svg = "svg"
+    """
+    Scalable Vector Graphics keep the graphs sharp at any zoom level.
+    Plotly requires the optional dependency kaleido (and a browser it can use) for this.
+    """
+
+    html = "html"
+    """
+    Each graph is saved as a web page.
+    The plotly graphs stay interactive, for this the plotly JavaScript library is loaded from a content delivery
+    network when the page is opened.
+    The matplotlib graphs are embedded as SVG.
+    """
@@ -0,0 +1,26 @@
+import datetime
+
+from peewee import AutoField, CharField, DateTimeField, TextField
+
+from conflowgen.domain_models.base_model import BaseModel
+
+
+class ContainerFlowGenerationCheckpoint(BaseModel):
+    """
+    Each entry marks a phase of the container flow generation that has been completed.
+    """
+    id = AutoField()
+
+    phase = CharField(
+        unique=True,
+        help_text="The value of the completed ContainerFlowGenerationPhase"
+    )
+
+    random_states = TextField(
+        help_text="The states of the random number generators after the phase has been completed, stored as JSON"
+    )
+
+    completed_at = DateTimeField(
+        default=lambda: datetime.datetime.now().replace(microsecond=0),
+        help_text="The date the phase has been completed"
+    )
@@ -15,7 +15,7 @@ class ContainerFlowStatisticsReport:
         self.logger = logging.getLogger("conflowgen")
         self.free_capacity_inbound_statistics = {}
         self.free_capacity_outbound_statistics = {}
-        if transportation_buffer:
+        if transportation_buffer is not None:
             self.set_transportation_buffer(transportation_buffer=transportation_buffer)
 
     def set_transportation_buffer(self, transportation_buffer: float) -> None:
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import typing
+import weakref
+
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
+from conflowgen.application.models.container_flow_generation_checkpoint import ContainerFlowGenerationCheckpoint
+from conflowgen.domain_models.base_model import database_proxy
+
+
+class ContainerFlowGenerationCheckpointRepository:
+
+    # The databases in which the checkpoint table is known to exist
+    _databases_with_table: weakref.WeakSet = weakref.WeakSet()
+
+    @classmethod
+    def _ensure_table_exists(cls) -> None:
+        # Databases that have been created with an earlier version of ConFlowGen lack this table
+        database = database_proxy.obj
+        if database not in cls._databases_with_table:
+            ContainerFlowGenerationCheckpoint.create_table(safe=True)
+            cls._databases_with_table.add(database)
+
+    @classmethod
+    def get_last_completed_phase(cls) -> ContainerFlowGenerationPhase | None:
+        cls._ensure_table_exists()
+        completed_phases = {
+            checkpoint.phase
+            for checkpoint in ContainerFlowGenerationCheckpoint.select(ContainerFlowGenerationCheckpoint.phase)
+        }
+        last_completed_phase = None
+        for phase in ContainerFlowGenerationPhase:
+            if phase.value not in completed_phases:
+                break
+            last_completed_phase = phase
+        return last_completed_phase
+
+    @classmethod
+    def get_random_states(cls, phase: ContainerFlowGenerationPhase) -> typing.Dict[str, typing.Any] | None:
+        cls._ensure_table_exists()
+        checkpoint = ContainerFlowGenerationCheckpoint.get_or_none(
+            ContainerFlowGenerationCheckpoint.phase == phase.value
+        )
+        if checkpoint is None:
+            return None
+        return json.loads(checkpoint.random_states)
+
+    @classmethod
+    def save_checkpoint(cls, phase: ContainerFlowGenerationPhase, random_states: typing.Dict[str, typing.Any]) -> None:
+        cls._ensure_table_exists()
+        ContainerFlowGenerationCheckpoint.delete().where(
+            ContainerFlowGenerationCheckpoint.phase == phase.value
+        ).execute()
+        ContainerFlowGenerationCheckpoint.create(
+            phase=phase.value,
+            random_states=json.dumps(random_states)
+        )
+
+    @classmethod
+    def delete_checkpoints(cls, phases: typing.Iterable[ContainerFlowGenerationPhase]) -> None:
+        cls._ensure_table_exists()
+        ContainerFlowGenerationCheckpoint.delete().where(
+            ContainerFlowGenerationCheckpoint.phase << [phase.value for phase in phases]
+        ).execute()
@@ -1,24 +1,38 @@
 from __future__ import annotations
 
-import enum
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import pathlib
+import sqlite3
+import time
 from functools import lru_cache
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Tuple, Iterator, Iterable, Callable, Any, NamedTuple
 
 import numpy as np
 import pandas as pd
 # noinspection PyProtectedMember
-from peewee import ModelSelect
+from peewee import ModelSelect, Field, ForeignKeyField, JOIN, BooleanField, DateTimeField, \
+    IntegerField
 
 from conflowgen.application.data_types.export_file_format import ExportFileFormat
+from conflowgen.application.repositories.container_flow_generation_properties_repository import \
+    ContainerFlowGenerationPropertiesRepository
+from conflowgen.database_connection.current_database import get_path_to_current_database
 from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
     TruckArrivalInformationForPickup
-from conflowgen.domain_models.base_model import BaseModel
+from conflowgen.domain_models.base_model import BaseModel, database_proxy
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.field_types.container_length import ContainerLengthField
+from conflowgen.domain_models.field_types.mode_of_transport import ModeOfTransportField
+from conflowgen.domain_models.field_types.storage_requirement import StorageRequirementField
 from conflowgen.domain_models.large_vehicle_schedule import Destination
 from conflowgen.domain_models.vehicle import DeepSeaVessel, LargeScheduledVehicle, Feeder, Barge, Train, Truck, \
     AbstractLargeScheduledVehicle
@@ -40,6 +54,18 @@ class CastingException(Exception):
     pass
 
 
+class MissingExportDependencyException(Exception):
+    pass
+
+
+class _TableExport(NamedTuple):
+    rows: int
+    sha256: str
+    read_duration: float
+    write_duration: float
+    skipped: bool
+
+
 class ExportContainerFlowService:
     logger = logging.getLogger("conflowgen")
 
@@ -64,11 +90,45 @@ class ExportContainerFlowService:
         assert file_name.endswith(".xlsx")
         df.to_excel(file_name)
 
-    enums_to_convert = (
-        ContainerLength,
-        StorageRequirement,
-        ModeOfTransport
-    )
+    @classmethod
+    def _save_chunks_as_csv(cls, chunks: Iterable[pd.DataFrame], file_name: str) -> None:
+        assert file_name.endswith(".csv")
+        with open(file_name, "w", newline="", encoding="utf-8") as csv_file:
+            for i, chunk in enumerate(chunks):
+                # noinspection PyTypeChecker
+                chunk.to_csv(csv_file, header=(i == 0))
+
+    @classmethod
+    def _save_as_parquet(
+            cls,
+            df: pd.DataFrame,
+            file_name: str,
+            compression: Optional[str] = None,
+            row_group_size: Optional[int] = None
+    ):
+        assert file_name.endswith(".parquet")
+        df.to_parquet(
+            file_name,
+            engine="pyarrow",
+            compression=compression if compression is not None else "snappy",
+            row_group_size=row_group_size
+        )
+
+    @classmethod
+    def _save_as_feather(
+            cls,
+            df: pd.DataFrame,
+            file_name: str,
+            compression: Optional[str] = None,
+            row_group_size: Optional[int] = None
+    ):
+        assert file_name.endswith(".feather")
+        # Feather only stores columns, thus the index is kept as the column 'id'
+        df.reset_index().to_feather(
+            file_name,
+            compression=compression if compression is not None else "lz4",
+            chunksize=row_group_size
+        )
 
     # For a row, this foreign key is resolved and leads to a flat representation.
     foreign_keys_to_resolve = {
@@ -78,9 +138,10 @@ class ExportContainerFlowService:
                 'large_scheduled_vehicle': LargeScheduledVehicle
             } for mode_of_transport in ModeOfTransport.get_scheduled_vehicles()
         },
+        # The resolved columns follow this order, i.e., the pickup time precedes the delivery time as in earlier exports
         Truck: {
-            'truck_arrival_information_for_delivery': TruckArrivalInformationForDelivery,
-            'truck_arrival_information_for_pickup': TruckArrivalInformationForPickup
+            'truck_arrival_information_for_pickup': TruckArrivalInformationForPickup,
+            'truck_arrival_information_for_delivery': TruckArrivalInformationForDelivery
         },
         Container: {
             'destination': Destination
@@ -129,64 +190,131 @@ class ExportContainerFlowService:
         },
     }
 
+    # Describes the exported files, it is used to skip unchanged tables in the next export to the same folder
+    manifest_file_name = "manifest.json"
+
+    # For each exported file, the table it is based on
+    tables_to_export = {
+        "containers": Container,
+        "deep_sea_vessels": DeepSeaVessel,
+        "feeders": Feeder,
+        "barges": Barge,
+        "trains": Train,
+        "trucks": Truck,
+    }
+
+    # These enums are exported as categorical columns if the file format keeps the column types
+    enums_of_fields = {
+        ModeOfTransportField: ModeOfTransport,
+        StorageRequirementField: StorageRequirement,
+        ContainerLengthField: ContainerLength,
+    }
+
+    # These file formats keep the column types and are written with the help of pyarrow
+    columnar_file_formats = (
+        ExportFileFormat.parquet,
+        ExportFileFormat.feather,
+    )
+
     def __init__(self):
         self.save_as_file_format_mapping = {
             ExportFileFormat.csv: self._save_as_csv,
             ExportFileFormat.xls: self._save_as_xls,
-            ExportFileFormat.xlsx: self._save_as_xlsx
+            ExportFileFormat.xlsx: self._save_as_xlsx,
+            ExportFileFormat.parquet: self._save_as_parquet,
+            ExportFileFormat.feather: self._save_as_feather,
         }
 
     @classmethod
-    def _convert_table_to_pandas_dataframe(
+    def _build_query_for_table(
             cls,
-            model: Type[BaseModel] | ModelSelect,
-            resolved_column: str | None = None
-    ) -> pd.DataFrame:
-
-        if resolved_column is not None:
-            cls.debug_once(f"This is a nested call to resolve the column '{resolved_column}'")
-
-        # extract data from sql database
-        data = list(model.select().dicts())
-
-        if type(model) == ModelSelect:  # pylint: disable=unidiomatic-typecheck  # TODO: check if isinstance works
-            model = model.model
+            model: Type[BaseModel],
+            connection: sqlite3.Connection
+    ) -> Tuple[ModelSelect, Dict[str, Field]]:
+        """
+        Builds one query that reads the whole table and resolves the foreign keys with the help of joins.
+        The connection is used to check which foreign keys need to be resolved at all.
+
+        Returns:
+            The query and, for each selected column, the field the column originates from.
+        """
+        selected_fields: Dict[str, Field] = {}
+        query = model.select(*[
+            field.alias(field.name) for field in model._meta.sorted_fields  # pylint: disable=protected-access
+        ])
+        for field in model._meta.sorted_fields:  # pylint: disable=protected-access
+            selected_fields[field.name] = field
+
+        for column, model_of_column in cls.foreign_keys_to_resolve.get(model, {}).items():
+            foreign_key: ForeignKeyField = getattr(model, column)
+            sql, params = model.select(model.id).where(foreign_key.is_null(False)).limit(1).sql()
+            if connection.execute(sql, params).fetchone() is None:
+                # The foreign key points to nothing, thus no resolution
+                continue
+            cls.debug_once(f"Resolving column {column} of model {model}...")
+            assert model_of_column not in cls.foreign_keys_to_resolve, "Only one level of resolution is supported"
+            model_alias = model_of_column.alias(f"resolved_{column}")
+            query = query.join_from(
+                model, model_alias, join_type=JOIN.LEFT_OUTER, on=(foreign_key == model_alias.id)
+            )
+            for nested_field in model_of_column._meta.sorted_fields:  # pylint: disable=protected-access
+                if nested_field.name == "id" or nested_field.name in cls.columns_to_drop.get(model_of_column, []):
+                    continue
+                assert nested_field.name not in selected_fields, "Do not accidentally overwrite a column by a " \
+                                                                 "nested column"
+                query = query.select_extend(getattr(model_alias, nested_field.name).alias(nested_field.name))
+                selected_fields[nested_field.name] = nested_field
 
-        foreign_keys_to_resolve = {}
-        if model in cls.foreign_keys_to_resolve.keys():
-            foreign_keys_to_resolve = cls.foreign_keys_to_resolve[model]
+        return query, selected_fields
 
-        # resolve some foreign keys
-        for i, row in enumerate(data):
-            for column, value in list(row.items()):
-                if column not in foreign_keys_to_resolve.keys():  # This is not a foreign key to resolve
-                    continue
-                if value is None:  # The foreign key points to nothing, thus no resolution
-                    continue
-                cls.debug_once(f"Resolving column {column} of model {model}...")
-                model_of_column = foreign_keys_to_resolve[column]
-                nested_model_select = model_of_column.select().where(
-                    model_of_column.id == value
+    @classmethod
+    def _cast_columns(
+            cls,
+            df_table: pd.DataFrame,
+            selected_fields: Dict[str, Field],
+            typed_columns: bool = False
+    ) -> pd.DataFrame:
+        """
+        SQLite only knows a few storage classes, thus the column types are restored based on the fields.
+        The enums are already stored by their value.
+        If typed columns are requested, each enum column becomes a categorical column with all values of the enum as its
+        categories and integer columns without any value become nullable integer columns.
+        """
+        for column, field in selected_fields.items():
+            if column not in df_table.columns:
+                continue
+            if typed_columns and type(field) in cls.enums_of_fields:
+                enum_of_field = cls.enums_of_fields[type(field)]
+                df_table[column] = pd.Categorical(
+                    df_table[column],
+                    categories=[member.value for member in enum_of_field]
                 )
-                nested_df = cls._convert_table_to_pandas_dataframe(
-                    nested_model_select,
-                    resolved_column=column
-                )  # Recursively resolve the relationship
-                assert len(nested_df) == 1, "Only 1:1 relationships between tables are supported"
-                nested_values = nested_df.iloc[0]
-                for nested_column in nested_df.columns:
-                    assert nested_column not in data[i].keys(), "Do not accidentally overwrite a column by a nested " \
-                                                                "column"
-                    data[i][nested_column] = nested_values[nested_column]
-
-        # convert enums to their value
-        for i, row in enumerate(data):
-            for column, value in row.items():
-                if isinstance(value, cls.enums_to_convert):
-                    value: enum.Enum
-                    data[i][column] = value.value
-
-        df_table = pd.DataFrame(data)
+            elif isinstance(field, BooleanField):
+                if df_table[column].isna().any():
+                    df_table[column] = df_table[column].astype("boolean")
+                else:
+                    df_table[column] = df_table[column].astype(bool)
+            elif isinstance(field, DateTimeField):
+                # Peewee omits the microseconds if they are zero, thus they are added so that one format fits all values
+                timestamps = df_table[column].astype("string").str.replace(
+                    r"^(.{19})$", r"\1.000000", regex=True
+                )
+                df_table[column] = pd.to_datetime(timestamps, format="%Y-%m-%d %H:%M:%S.%f")
+            elif typed_columns and isinstance(field, (IntegerField, ForeignKeyField)) \
+                    and df_table[column].dtype == object:
+                # e.g., a foreign key that is never set is read in as a column of None
+                df_table[column] = df_table[column].astype("Int64")
+        return df_table
+
+    @classmethod
+    def _post_process_table(
+            cls,
+            model: Type[BaseModel],
+            df_table: pd.DataFrame,
+            selected_fields: Dict[str, Field],
+            typed_columns: bool
+    ) -> pd.DataFrame:
+        df_table = cls._cast_columns(df_table, selected_fields, typed_columns=typed_columns)
 
         # remove any columns that have been (accidentally) inserted, e.g. by resolving foreign keys.
         if model in cls.columns_to_drop:
@@ -194,12 +322,8 @@ class ExportContainerFlowService:
             if not set(columns_to_drop).issubset(set(df_table.columns)):
                 missing_columns = set(columns_to_drop) - set(df_table.columns)
                 cls.debug_once(f"These columns are listed to be deleted but are missing: {missing_columns}")
-                columns_to_drop = set(df_table.columns).intersection(set(columns_to_drop))
-            try:
-                df_table.drop(columns=columns_to_drop, inplace=True)
-            except KeyError as error:
-                raise RuntimeError(f"Encountered an exception while dropping columns {columns_to_drop} from model "
-                                   f"{model} and the current table columns {df_table.columns}.") from error
+                columns_to_drop = [column for column in columns_to_drop if column in df_table.columns]
+            df_table.drop(columns=columns_to_drop, inplace=True)
 
         if model in cls.columns_to_rename:
             column_translation_for_model = cls.columns_to_rename[model]
@@ -209,11 +333,10 @@ class ExportContainerFlowService:
                 df_table.drop(columns=overwritten_columns, inplace=True)
             df_table.rename(columns=column_translation_for_model, inplace=True)
 
-        # use SQL id instead of newly created pandas id if present
-        if len(data) > 0:
-            if "id" not in df_table.columns:
-                raise RuntimeError(f"No column 'id' present for '{model}', just {df_table.columns}")
-            df_table.set_index("id", drop=True, inplace=True)
+        # use SQL id instead of newly created pandas id
+        if "id" not in df_table.columns:
+            raise RuntimeError(f"No column 'id' present for '{model}', just {df_table.columns}")
+        df_table.set_index("id", drop=True, inplace=True)
 
         # use nullable int instead of float (currently we don't use any floats in the whole application)
         for column in df_table.columns:
@@ -222,44 +345,210 @@ class ExportContainerFlowService:
                     df_table[column] = df_table[column].astype("Int64")
                 except TypeError as error:
                     raise CastingException(
-                        f"Column '{column}' for model '{model.model}' could not be casted from float64 to Int64"
+                        f"Column '{column}' for model '{model}' could not be casted from float64 to Int64"
                     ) from error
 
         return df_table
 
     @classmethod
-    def _convert_sql_database_to_pandas_dataframe(cls) -> Dict[str, pd.DataFrame]:
+    def _convert_table_to_pandas_dataframe(
+            cls,
+            model: Type[BaseModel],
+            connection: Optional[sqlite3.Connection] = None,
+            typed_columns: bool = False
+    ) -> pd.DataFrame:
 
-        df_container = cls._convert_table_to_pandas_dataframe(Container)
-        result = {
-            "containers": df_container,
-        }
+        if connection is None:
+            connection = database_proxy.connection()
 
-        large_schedule_vehicles_as_subtype = {
-            "deep_sea_vessels": DeepSeaVessel,
-            "feeders": Feeder,
-            "barges": Barge,
-            "trains": Train,
-        }
-        for file_name, large_schedule_vehicle_as_subtype in large_schedule_vehicles_as_subtype.items():
-            cls.logger.debug(f"Gathering data for generating the '{file_name}' table...")
-            df = cls._convert_table_to_pandas_dataframe(large_schedule_vehicle_as_subtype)
-            if len(df) == 0:
-                cls.logger.info(f"No content found for the {file_name} table, the file will be empty.")
-            result[file_name] = df
+        query, selected_fields = cls._build_query_for_table(model, connection)
+        sql, params = query.sql()
+        df_table = pd.read_sql(sql, connection, params=params)
+        return cls._post_process_table(model, df_table, selected_fields, typed_columns)
+
+    @classmethod
+    def _read_table_in_chunks(
+            cls,
+            model: Type[BaseModel],
+            chunk_size: int,
+            connection: Optional[sqlite3.Connection] = None,
+            typed_columns: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads the table with the same query as :meth:`._convert_table_to_pandas_dataframe` but only fetches
+        ``chunk_size`` rows at a time from the cursor.
+        Thus, only one chunk is kept in memory at the same time.
+        An empty table still yields one empty chunk so that the column names are known.
+        """
+        if connection is None:
+            connection = database_proxy.connection()
+
+        query, selected_fields = cls._build_query_for_table(model, connection)
+        sql, params = query.sql()
+        for df_chunk in pd.read_sql(sql, connection, params=params, chunksize=chunk_size):
+            yield cls._post_process_table(model, df_chunk, selected_fields, typed_columns)
 
-        df_trucks = cls._convert_table_to_pandas_dataframe(Truck)
-        result["trucks"] = df_trucks
-        return result
+    @classmethod
+    def _open_read_only_connection(cls, path_to_database: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            pathlib.Path(path_to_database).absolute().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False
+        )
+        connection.execute("PRAGMA query_only = 1")
+        return connection
+
+    @staticmethod
+    def _update_content_hash(content_hash: Any, df: pd.DataFrame) -> None:
+        # The hash of each row is independent of the chunk it has been read in
+        content_hash.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+
+    def _export_table(
+            self,
+            model: Type[BaseModel],
+            path_to_file: str,
+            save_as_file_format: Callable[[pd.DataFrame, str], None],
+            typed_columns: bool,
+            chunk_size: Optional[int],
+            path_to_database: Optional[str],
+            previous_table_manifest: Optional[Dict[str, Any]]
+    ) -> _TableExport:
+        """
+        Reads one table and saves it in the target file.
+        If a path to the database is provided, the table is read with its own read-only connection.
+        Otherwise, the connection of the database proxy is used.
+        If the content hash equals the one of the previous export and the previously exported file still exists, the
+        file is not written again.
+        """
+        if path_to_database is not None:
+            connection = self._open_read_only_connection(path_to_database)
+        else:
+            connection = database_proxy.connection()
+
+        def is_unchanged(number_rows: int, sha256: str) -> bool:
+            return (
+                previous_table_manifest is not None
+                and previous_table_manifest["rows"] == number_rows
+                and previous_table_manifest["sha256"] == sha256
+                and os.path.isfile(path_to_file)
+            )
+
+        content_hash = hashlib.sha256()
+        content_hash.update(repr(model.__name__).encode())
+        try:
+            if chunk_size is None:
+                start = time.perf_counter()
+                df = self._convert_table_to_pandas_dataframe(model, connection=connection, typed_columns=typed_columns)
+                self._update_content_hash(content_hash, df)
+                number_rows = len(df)
+                read_duration = time.perf_counter() - start
+                if number_rows == 0:
+                    self.logger.info(
+                        f"No content found for the {model.__name__} table, the file {os.path.basename(path_to_file)} "
+                        f"will be empty."
+                    )
+                if is_unchanged(number_rows, content_hash.hexdigest()):
+                    return _TableExport(number_rows, content_hash.hexdigest(), read_duration, 0, skipped=True)
+                start = time.perf_counter()
+                # noinspection PyArgumentList
+                save_as_file_format(df, path_to_file)
+                write_duration = time.perf_counter() - start
+            else:
+                start = time.perf_counter()
+                if previous_table_manifest is not None:
+                    # Only if the content has changed, the table is read a second time for writing
+                    number_rows = 0
+                    for df_chunk in self._read_table_in_chunks(
+                            model, chunk_size, connection=connection, typed_columns=typed_columns
+                    ):
+                        self._update_content_hash(content_hash, df_chunk)
+                        number_rows += len(df_chunk)
+                    if is_unchanged(number_rows, content_hash.hexdigest()):
+                        return _TableExport(
+                            number_rows, content_hash.hexdigest(), time.perf_counter() - start, 0, skipped=True
+                        )
+                    content_hash = hashlib.sha256()
+                    content_hash.update(repr(model.__name__).encode())
+
+                number_rows = 0
+
+                def hash_and_count_chunks() -> Iterator[pd.DataFrame]:
+                    nonlocal number_rows
+                    for df_chunk in self._read_table_in_chunks(
+                            model, chunk_size, connection=connection, typed_columns=typed_columns
+                    ):
+                        self._update_content_hash(content_hash, df_chunk)
+                        number_rows += len(df_chunk)
+                        yield df_chunk
+
+                # Reading and writing the chunks are interleaved, thus only the sum is measured
+                self._save_chunks_as_csv(hash_and_count_chunks(), path_to_file)
+                read_duration, write_duration = time.perf_counter() - start, 0
+        finally:
+            if path_to_database is not None:
+                connection.close()
+        return _TableExport(number_rows, content_hash.hexdigest(), read_duration, write_duration, skipped=False)
+
+    @staticmethod
+    def _load_manifest(path_to_manifest: str) -> Optional[Dict[str, Any]]:
+        if not os.path.isfile(path_to_manifest):
+            return None
+        try:
+            with open(path_to_manifest, encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_generation_timestamps() -> Dict[str, Optional[str]]:
+        properties = ContainerFlowGenerationPropertiesRepository.get_container_flow_generation_properties()
+        return {
+            timestamp_name: timestamp.replace(microsecond=0).isoformat() if timestamp is not None else None
+            for timestamp_name, timestamp in (
+                ("generated_at", properties.generated_at),
+                ("last_updated_at", properties.last_updated_at),
+            )
+        }
 
     def export(
             self,
             folder_name: str,
             path_to_export_folder: Optional[str],
             file_format: ExportFileFormat,
-            overwrite: bool
+            overwrite: bool,
+            compression: Optional[str] = None,
+            row_group_size: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            max_workers: int = 1
     ) -> str:
 
+        if max_workers < 1:
+            raise ValueError(f"At least one worker is required but {max_workers} have been requested")
+
+        if chunk_size is not None:
+            if file_format != ExportFileFormat.csv:
+                raise ValueError(
+                    f"Exporting in chunks is only supported for the file format '{ExportFileFormat.csv.value}'"
+                )
+            if chunk_size < 1:
+                raise ValueError(f"The chunk size must be a positive number of rows but it is {chunk_size}")
+
+        save_as_file_format = self.save_as_file_format_mapping[file_format]
+        if file_format in self.columnar_file_formats:
+            if importlib.util.find_spec("pyarrow") is None:
+                raise MissingExportDependencyException(
+                    f"The file format '{file_format.value}' requires the package 'pyarrow'. You can install it, e.g., "
+                    f"with 'pip install conflowgen[arrow]'."
+                )
+            save_as_file_format = functools.partial(
+                save_as_file_format, compression=compression, row_group_size=row_group_size
+            )
+        elif compression is not None or row_group_size is not None:
+            raise ValueError(
+                f"Compression and row groups are only supported for the file formats "
+                f"{[columnar_file_format.value for columnar_file_format in self.columnar_file_formats]}"
+            )
+
         if path_to_export_folder is None:
             path_to_export_folder = EXPORTS_DEFAULT_DIR
 
@@ -273,8 +562,11 @@ class ExportContainerFlowService:
             path_to_export_folder,
             folder_name
         )
+        path_to_manifest = os.path.join(path_to_target_folder, self.manifest_file_name)
+        previous_manifest = None
         if os.path.isdir(path_to_target_folder):
             if overwrite:
+                previous_manifest = self._load_manifest(path_to_manifest)
                 self.logger.info(f"The folder {path_to_target_folder} already exists, potentially overwriting files.")
             else:
                 raise ExportOnlyAllowedToNotExistingFolderException(path_to_target_folder)
@@ -282,17 +574,84 @@ class ExportContainerFlowService:
             self.logger.info(f"Creating folder at {path_to_target_folder}")
             os.mkdir(path_to_target_folder)
 
+        path_to_database = None
+        if max_workers > 1:
+            path_to_database = get_path_to_current_database()
+            if path_to_database is None:
+                self.logger.info("The database only exists in memory, thus the tables are exported one after another.")
+                max_workers = 1
+
+        export_settings = {
+            "file_format": file_format.value,
+            "compression": compression,
+            "row_group_size": row_group_size,
+        }
+        previous_tables_manifest = {}
+        if previous_manifest is not None and previous_manifest.get("export_settings") == export_settings:
+            previous_tables_manifest = previous_manifest.get("tables", {})
+
         file_format_str_repr = str(file_format.value)
-        self.logger.info(f"Converting SQL database into file format '.{file_format_str_repr}'")
-        dfs = self._convert_sql_database_to_pandas_dataframe()
-        for file_name, df in dfs.items():
-            full_file_name = file_name + "." + file_format_str_repr
-            path_to_file = os.path.join(
-                path_to_target_folder,
-                full_file_name
+        if chunk_size is None:
+            self.logger.info(f"Converting SQL database into file format '.{file_format_str_repr}'")
+        else:
+            self.logger.info(
+                f"Streaming SQL database into file format '.{file_format_str_repr}' in chunks of {chunk_size} rows"
+            )
+        export_jobs = {
+            file_name: functools.partial(
+                self._export_table,
+                model=model,
+                path_to_file=os.path.join(path_to_target_folder, file_name + "." + file_format_str_repr),
+                save_as_file_format=save_as_file_format,
+                typed_columns=(file_format in self.columnar_file_formats),
+                chunk_size=chunk_size,
+                path_to_database=path_to_database,
+                previous_table_manifest=previous_tables_manifest.get(file_name)
             )
-            self.logger.debug(f"Saving file {full_file_name}")
-            # noinspection PyArgumentList
-            self.save_as_file_format_mapping[file_format](df, path_to_file)
+            for file_name, model in self.tables_to_export.items()
+        }
+        table_exports: Dict[str, _TableExport] = {}
+        if max_workers == 1:
+            for file_name, export_job in export_jobs.items():
+                self.logger.debug(f"Saving file {file_name}.{file_format_str_repr}")
+                table_exports[file_name] = export_job()
+        else:
+            self.logger.info(f"Exporting {len(export_jobs)} tables with {max_workers} threads")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(export_job): file_name
+                    for file_name, export_job in export_jobs.items()
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    table_exports[futures[future]] = future.result()
+
+        for file_name in export_jobs.keys():
+            table_export = table_exports[file_name]
+            if table_export.skipped:
+                self.logger.info(
+                    f"Skipped {file_name}.{file_format_str_repr} because its content has not changed since the "
+                    f"previous export (reading: {table_export.read_duration:.2f}s)"
+                )
+            else:
+                self.logger.info(
+                    f"Exported {file_name}.{file_format_str_repr} in "
+                    f"{table_export.read_duration + table_export.write_duration:.2f}s "
+                    f"(reading: {table_export.read_duration:.2f}s, writing: {table_export.write_duration:.2f}s)"
+                )
+
+        manifest = {
+            **self._get_generation_timestamps(),
+            "export_settings": export_settings,
+            "tables": {
+                file_name: {
+                    "file_name": file_name + "." + file_format_str_repr,
+                    "rows": table_exports[file_name].rows,
+                    "sha256": table_exports[file_name].sha256,
+                }
+                for file_name in export_jobs.keys()
+            }
+        }
+        with open(path_to_manifest, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
         self.logger.info("Export has finished successfully.")
         return path_to_target_folder
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Optional, Dict
+
+from conflowgen.application.services.export_container_flow_service import EXPORTS_DEFAULT_DIR
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.base_model import database_proxy
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.large_vehicle_schedule import Destination, Schedule
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+
+
+class ExportOnlyAllowedToNotExistingFileException(Exception):
+    pass
+
+
+def _table(model) -> str:
+    return f'"{model._meta.table_name}"'  # pylint: disable=protected-access
+
+
+class ExportContainerFlowToSqliteService:
+    """
+    Copies the container flow into a compact SQLite database that only contains what a downstream tool needs to replay
+    the container flow.
+    All data is moved by SQLite itself with ``INSERT ... SELECT`` statements into the attached target database, i.e.,
+    no row passes through Python.
+    """
+
+    logger = logging.getLogger("conflowgen")
+
+    schema_name = "export_target"
+
+    # The target tables in the order they are created and filled in
+    target_tables = {
+        "vehicles": """
+            CREATE TABLE {schema}.vehicles (
+                id INTEGER NOT NULL PRIMARY KEY,
+                vehicle_type TEXT NOT NULL,
+                service_name TEXT NOT NULL,
+                vehicle_name TEXT NOT NULL,
+                capacity_in_teu INTEGER NOT NULL,
+                moved_capacity INTEGER NOT NULL,
+                realized_arrival DATETIME
+            )
+        """,
+        "trucks": """
+            CREATE TABLE {schema}.trucks (
+                id INTEGER NOT NULL PRIMARY KEY,
+                delivers_container INTEGER NOT NULL,
+                picks_up_container INTEGER NOT NULL,
+                realized_container_delivery_time DATETIME,
+                realized_container_pickup_time DATETIME
+            )
+        """,
+        "containers": """
+            CREATE TABLE {schema}.containers (
+                id INTEGER NOT NULL PRIMARY KEY,
+                weight INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                storage_requirement TEXT NOT NULL,
+                delivered_by TEXT NOT NULL,
+                delivered_by_vehicle INTEGER REFERENCES vehicles (id),
+                delivered_by_vehicle_name TEXT,
+                delivered_by_truck INTEGER REFERENCES trucks (id),
+                picked_up_by_initial TEXT NOT NULL,
+                picked_up_by TEXT NOT NULL,
+                picked_up_by_vehicle INTEGER REFERENCES vehicles (id),
+                picked_up_by_vehicle_name TEXT,
+                picked_up_by_truck INTEGER REFERENCES trucks (id),
+                emergency_pickup INTEGER NOT NULL,
+                destination_sequence_id INTEGER,
+                destination_name TEXT,
+                arrival_time DATETIME,
+                departure_time DATETIME
+            )
+        """,
+    }
+
+    target_indices = (
+        "CREATE INDEX {schema}.containers_delivered_by_vehicle ON containers (delivered_by_vehicle)",
+        "CREATE INDEX {schema}.containers_picked_up_by_vehicle ON containers (picked_up_by_vehicle)",
+        "CREATE INDEX {schema}.containers_arrival_time ON containers (arrival_time)",
+        "CREATE INDEX {schema}.containers_departure_time ON containers (departure_time)",
+    )
+
+    @classmethod
+    def _get_insert_statements(cls) -> Dict[str, str]:
+        large_scheduled_vehicle = _table(LargeScheduledVehicle)
+        schedule = _table(Schedule)
+        truck = _table(Truck)
+        delivery = _table(TruckArrivalInformationForDelivery)
+        pickup = _table(TruckArrivalInformationForPickup)
+        container = _table(Container)
+        destination = _table(Destination)
+        return {
+            "vehicles": f"""
+                INSERT INTO {cls.schema_name}.vehicles
+                SELECT v.id, s.vehicle_type, s.service_name, v.vehicle_name, v.capacity_in_teu, v.moved_capacity,
+                    v.realized_arrival
+                FROM {large_scheduled_vehicle} AS v
+                JOIN {schedule} AS s ON s.id = v.schedule_id
+            """,
+            "trucks": f"""
+                INSERT INTO {cls.schema_name}.trucks
+                SELECT t.id, t.delivers_container, t.picks_up_container, d.realized_container_delivery_time,
+                    p.realized_container_pickup_time
+                FROM {truck} AS t
+                LEFT JOIN {delivery} AS d ON d.id = t.truck_arrival_information_for_delivery_id
+                LEFT JOIN {pickup} AS p ON p.id = t.truck_arrival_information_for_pickup_id
+            """,
+            # The arrival and departure times follow Container.get_arrival_time and Container.get_departure_time
+            "containers": f"""
+                INSERT INTO {cls.schema_name}.containers
+                SELECT c.id, c.weight, c.length, c.storage_requirement,
+                    c.delivered_by, c.delivered_by_large_scheduled_vehicle_id, dv.vehicle_name, c.delivered_by_truck_id,
+                    c.picked_up_by_initial, c.picked_up_by, c.picked_up_by_large_scheduled_vehicle_id, pv.vehicle_name,
+                    c.picked_up_by_truck_id,
+                    c.emergency_pickup, dest.sequence_id, dest.destination_name,
+                    COALESCE(dti.realized_container_delivery_time, dv.scheduled_arrival),
+                    COALESCE(pti.realized_container_pickup_time, pv.scheduled_arrival)
+                FROM {container} AS c
+                LEFT JOIN {large_scheduled_vehicle} AS dv ON dv.id = c.delivered_by_large_scheduled_vehicle_id
+                LEFT JOIN {truck} AS dt ON dt.id = c.delivered_by_truck_id
+                LEFT JOIN {delivery} AS dti ON dti.id = dt.truck_arrival_information_for_delivery_id
+                LEFT JOIN {large_scheduled_vehicle} AS pv ON pv.id = c.picked_up_by_large_scheduled_vehicle_id
+                LEFT JOIN {truck} AS pt ON pt.id = c.picked_up_by_truck_id
+                LEFT JOIN {pickup} AS pti ON pti.id = pt.truck_arrival_information_for_pickup_id
+                LEFT JOIN {destination} AS dest ON dest.id = c.destination_id
+            """,
+        }
+
+    def export(
+            self,
+            file_name: str,
+            path_to_export_folder: Optional[str] = None,
+            overwrite: bool = False
+    ) -> str:
+        if path_to_export_folder is None:
+            path_to_export_folder = EXPORTS_DEFAULT_DIR
+        os.makedirs(path_to_export_folder, exist_ok=True)
+        if not file_name.endswith(".sqlite"):
+            file_name += ".sqlite"
+        path_to_file = os.path.abspath(os.path.join(path_to_export_folder, file_name))
+
+        if os.path.exists(path_to_file):
+            if not overwrite:
+                raise ExportOnlyAllowedToNotExistingFileException(path_to_file)
+            self.logger.info(f"The file {path_to_file} already exists, it is overwritten.")
+            for suffix in ("", "-wal", "-shm", "-journal"):
+                if os.path.exists(path_to_file + suffix):
+                    os.remove(path_to_file + suffix)
+
+        self.logger.info(f"Exporting the container flow into the SQLite database {path_to_file}")
+        start = time.perf_counter()
+        # ATTACH and DETACH are not allowed inside a transaction
+        database_proxy.execute_sql(f"ATTACH DATABASE ? AS {self.schema_name}", (path_to_file,))
+        try:
+            with database_proxy.atomic():
+                for table_name, create_statement in self.target_tables.items():
+                    self.logger.debug(f"Filling the table '{table_name}'")
+                    database_proxy.execute_sql(create_statement.format(schema=self.schema_name))
+                    database_proxy.execute_sql(self._get_insert_statements()[table_name])
+                for create_index_statement in self.target_indices:
+                    database_proxy.execute_sql(create_index_statement.format(schema=self.schema_name))
+        finally:
+            database_proxy.execute_sql(f"DETACH DATABASE {self.schema_name}")
+        self.logger.info(f"Export has finished successfully after {time.perf_counter() - start:.2f}s.")
+        return path_to_file
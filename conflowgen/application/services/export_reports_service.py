@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import html
+import io
+import logging
+import multiprocessing
+import os
+import pathlib
+import time
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Type
+
+from peewee import SqliteDatabase, fn
+
+from conflowgen.application.data_types.report_file_format import ReportFileFormat
+from conflowgen.application.services.export_container_flow_service import EXPORTS_DEFAULT_DIR, \
+    ExportOnlyAllowedToNotExistingFolderException
+from conflowgen.database_connection.current_database import get_path_to_current_database
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.base_model import database_proxy
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.reporting import AbstractReport, AbstractReportWithPlotly
+
+logger = logging.getLogger("conflowgen")
+
+
+class _RenderedReport(NamedTuple):
+    name: str
+    description: str
+    text_file: str
+    graph_files: List[str]
+    error: Optional[str]
+    duration: float
+
+
+def _save_matplotlib_graph(graph: object, path_to_file_without_suffix: str, file_format: ReportFileFormat) -> List[str]:
+    import matplotlib.figure  # pylint: disable=import-outside-toplevel
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if isinstance(graph, matplotlib.figure.Figure):
+        fig = graph
+    elif isinstance(graph, np.ndarray):  # a grid of axes
+        fig = graph.flat[0].figure
+    else:
+        fig = graph.figure
+    path_to_file = f"{path_to_file_without_suffix}.{file_format.value}"
+    try:
+        if file_format == ReportFileFormat.html:
+            svg = io.StringIO()
+            fig.savefig(svg, format="svg", bbox_inches="tight")
+            with open(path_to_file, "w", encoding="utf-8") as html_file:
+                html_file.write(f"<!DOCTYPE html>\n<html>\n<body>\n{svg.getvalue()}\n</body>\n</html>\n")
+        else:
+            fig.savefig(path_to_file, format=file_format.value, bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return [path_to_file]
+
+
+def _save_plotly_graph(graph: object, path_to_file_without_suffix: str, file_format: ReportFileFormat) -> List[str]:
+    from plotly import graph_objects  # pylint: disable=import-outside-toplevel
+
+    if isinstance(graph, graph_objects.Figure):
+        figs = [graph]
+    else:
+        figs = list(graph)
+    paths_to_files = []
+    for i, fig in enumerate(figs, start=1):
+        suffix = f"_{i}" if len(figs) > 1 else ""
+        path_to_file = f"{path_to_file_without_suffix}{suffix}.{file_format.value}"
+        if file_format == ReportFileFormat.html:
+            fig.write_html(path_to_file, include_plotlyjs="cdn")
+        else:
+            fig.write_image(path_to_file, format=file_format.value, width=800)
+        paths_to_files.append(path_to_file)
+    return paths_to_files
+
+
+@contextlib.contextmanager
+def _drawing_without_display() -> Iterator[None]:
+    """
+    Draws the matplotlib graphs with the Agg backend so that no window is opened.
+    Afterwards, the previously used backend is restored.
+    """
+    import matplotlib  # pylint: disable=import-outside-toplevel
+    previous_backend = matplotlib.get_backend()
+    matplotlib.use("Agg")
+    try:
+        yield
+    finally:
+        matplotlib.use(previous_backend)
+
+
+def _initialize_worker(path_to_database: str) -> None:
+    """
+    Each worker process draws without a display and reads the database with its own read-only connection.
+    The connection and the cached analysis results are kept for all reports the worker renders.
+    """
+    import matplotlib  # pylint: disable=import-outside-toplevel
+    matplotlib.use("Agg")
+
+    sqlite_db = SqliteDatabase(
+        pathlib.Path(path_to_database).absolute().as_uri() + "?mode=ro",
+        uri=True,
+        pragmas={"query_only": 1}
+    )
+    database_proxy.initialize(sqlite_db)
+    sqlite_db.connect()
+
+
+def _render_report(
+        report_type: Type[AbstractReport],
+        path_to_target_folder: str,
+        file_format: ReportFileFormat
+) -> _RenderedReport:
+    started_at = time.perf_counter()
+    report = report_type()
+    name = report_type.__name__
+    path_to_file_without_suffix = os.path.join(path_to_target_folder, name)
+
+    text_file = path_to_file_without_suffix + ".txt"
+    graph_files = []
+    error = None
+    try:
+        text = report.get_report_as_text()
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        # One report that cannot be determined should not stop the others.
+        text = "The report could not be determined.\n"
+        error = f"{exception.__class__.__name__}: {exception}"
+    with open(text_file, "w", encoding="utf-8") as _file:
+        _file.write(text)
+
+    if error is None:
+        try:
+            graph = report.get_report_as_graph()
+            if isinstance(report, AbstractReportWithPlotly):
+                graph_files = _save_plotly_graph(graph, path_to_file_without_suffix, file_format)
+            else:
+                graph_files = _save_matplotlib_graph(graph, path_to_file_without_suffix, file_format)
+        except NotImplementedError:
+            pass
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            # One graph that cannot be rendered, e.g., due to a missing optional dependency, should not stop the others.
+            error = f"{exception.__class__.__name__}: {exception}"
+
+    return _RenderedReport(
+        name=name,
+        description=report.report_description,
+        text_file=text_file,
+        graph_files=graph_files,
+        error=error,
+        duration=time.perf_counter() - started_at
+    )
+
+
+class ExportReportsService:
+
+    index_file_name = "index.html"
+
+    @staticmethod
+    def _get_all_reports() -> List[Type[AbstractReport]]:
+        from conflowgen import analyses, previews  # pylint: disable=import-outside-toplevel
+        return list(previews.reports) + list(analyses.reports)
+
+    @staticmethod
+    def _cache_container_times() -> None:
+        """
+        Most analyses look up when each container arrives and departs.
+        These points in time are determined for all containers at once in the database and stored at the containers.
+        Afterwards, :meth:`.Container.get_arrival_time` and :meth:`.Container.get_departure_time` only read them,
+        i.e., neither the serial rendering nor the read-only workers need to look up the vehicles of each container.
+        """
+        delivery_time_of_truck = TruckArrivalInformationForDelivery.select(
+            TruckArrivalInformationForDelivery.realized_container_delivery_time
+        ).join(
+            Truck, on=(Truck.truck_arrival_information_for_delivery == TruckArrivalInformationForDelivery.id)
+        ).where(
+            Truck.id == Container.delivered_by_truck
+        )
+        pickup_time_of_truck = TruckArrivalInformationForPickup.select(
+            TruckArrivalInformationForPickup.realized_container_pickup_time
+        ).join(
+            Truck, on=(Truck.truck_arrival_information_for_pickup == TruckArrivalInformationForPickup.id)
+        ).where(
+            Truck.id == Container.picked_up_by_truck
+        )
+        arrival_of_delivering_vehicle = LargeScheduledVehicle.select(LargeScheduledVehicle.scheduled_arrival).where(
+            LargeScheduledVehicle.id == Container.delivered_by_large_scheduled_vehicle
+        )
+        arrival_of_picking_up_vehicle = LargeScheduledVehicle.select(LargeScheduledVehicle.scheduled_arrival).where(
+            LargeScheduledVehicle.id == Container.picked_up_by_large_scheduled_vehicle
+        )
+        Container.update(
+            cached_arrival_time=fn.COALESCE(delivery_time_of_truck, arrival_of_delivering_vehicle),
+            cached_departure_time=fn.COALESCE(pickup_time_of_truck, arrival_of_picking_up_vehicle)
+        ).execute()
+
+    def _write_index(self, path_to_target_folder: str, rendered_reports: List[_RenderedReport]) -> str:
+        lines = [
+            "<!DOCTYPE html>",
+            "<html>",
+            "<head>",
+            '<meta charset="utf-8">',
+            "<title>ConFlowGen reports</title>",
+            "</head>",
+            "<body>",
+            "<h1>ConFlowGen reports</h1>",
+            "<ul>",
+        ]
+        lines.extend(
+            f'<li><a href="#{rendered_report.name}">{rendered_report.name}</a></li>'
+            for rendered_report in rendered_reports
+        )
+        lines.append("</ul>")
+        for rendered_report in rendered_reports:
+            lines.append(f'<h2 id="{rendered_report.name}">{rendered_report.name}</h2>')
+            lines.append(f"<p>{html.escape(rendered_report.description.strip())}</p>")
+            with open(rendered_report.text_file, encoding="utf-8") as text_file:
+                lines.append(f"<pre>{html.escape(text_file.read())}</pre>")
+            for graph_file in rendered_report.graph_files:
+                file_name = html.escape(os.path.basename(graph_file))
+                if graph_file.endswith(".html"):
+                    lines.append(f'<iframe src="{file_name}" width="100%" height="700" frameborder="0"></iframe>')
+                else:
+                    lines.append(f'<img src="{file_name}" alt="{rendered_report.name}">')
+            if rendered_report.error is not None:
+                lines.append(
+                    f"<p>The report could not be rendered completely: {html.escape(rendered_report.error)}</p>"
+                )
+        lines.extend(["</body>", "</html>", ""])
+
+        path_to_index = os.path.join(path_to_target_folder, self.index_file_name)
+        with open(path_to_index, "w", encoding="utf-8") as index_file:
+            index_file.write("\n".join(lines))
+        return path_to_index
+
+    def export(
+            self,
+            folder_name: str,
+            path_to_export_folder: Optional[str],
+            file_format: ReportFileFormat,
+            overwrite: bool,
+            reports: Optional[Iterable[Type[AbstractReport]]] = None,
+            max_workers: int = 1
+    ) -> str:
+
+        if max_workers < 1:
+            raise ValueError(f"At least one worker is required but {max_workers} have been requested")
+
+        if reports is None:
+            reports = self._get_all_reports()
+        reports = list(reports)
+
+        if path_to_export_folder is None:
+            path_to_export_folder = EXPORTS_DEFAULT_DIR
+        if not os.path.isdir(path_to_export_folder):
+            logger.info(f"Creating export folder {path_to_export_folder}")
+            os.makedirs(path_to_export_folder, exist_ok=True)
+
+        path_to_target_folder = os.path.join(path_to_export_folder, folder_name)
+        if os.path.isdir(path_to_target_folder):
+            if not overwrite:
+                raise ExportOnlyAllowedToNotExistingFolderException(path_to_target_folder)
+            logger.info(f"The folder {path_to_target_folder} already exists, potentially overwriting files.")
+        else:
+            logger.info(f"Creating folder at {path_to_target_folder}")
+            os.mkdir(path_to_target_folder)
+
+        path_to_database = None
+        if max_workers > 1:
+            path_to_database = get_path_to_current_database()
+            if path_to_database is None:
+                logger.info("The database only exists in memory, thus the reports are rendered one after another.")
+                max_workers = 1
+
+        logger.info("Caching the arrival and departure times of all containers")
+        self._cache_container_times()
+
+        if max_workers == 1:
+            with _drawing_without_display():
+                rendered_reports = [
+                    _render_report(report, path_to_target_folder, file_format)
+                    for report in reports
+                ]
+        else:
+            logger.info(f"Rendering {len(reports)} reports with {max_workers} processes")
+            # 'spawn' guarantees fresh interpreters so that neither the database connection nor the loaded plotting
+            # libraries are inherited from the parent process
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialize_worker,
+                    initargs=(path_to_database,)
+            ) as executor:
+                rendered_reports = list(executor.map(
+                    _render_report,
+                    reports,
+                    [path_to_target_folder] * len(reports),
+                    [file_format] * len(reports)
+                ))
+
+        for rendered_report in rendered_reports:
+            if rendered_report.error is None:
+                logger.debug(f"Rendered {rendered_report.name} in {rendered_report.duration:.2f}s")
+            else:
+                logger.warning(
+                    f"The report {rendered_report.name} could not be rendered completely: {rendered_report.error}"
+                )
+
+        path_to_index = self._write_index(path_to_target_folder, rendered_reports)
+        logger.info(f"Exported {len(rendered_reports)} reports, see {path_to_index}")
+        return path_to_index
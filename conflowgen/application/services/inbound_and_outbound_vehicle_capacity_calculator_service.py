@@ -10,7 +10,7 @@ from conflowgen.domain_models.distribution_repositories.container_length_distrib
     ContainerLengthDistributionRepository
 from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
     ModeOfTransportDistributionRepository
-from conflowgen.domain_models.factories.fleet_factory import create_arrivals_within_time_range
+from conflowgen.domain_models.factories.fleet_factory import create_arrivals_of_schedules
 from conflowgen.domain_models.large_vehicle_schedule import Schedule
 
 
@@ -28,10 +28,10 @@ class InboundAndOutboundVehicleCapacityCalculatorService:
         Thus, this method accounts for both import and export.
         """
         truck_capacity = 0
+        mode_of_transport_distribution = ModeOfTransportDistributionRepository().get_distribution()
         for vehicle_type in ModeOfTransport.get_scheduled_vehicles():
             number_of_containers_delivered_to_terminal_by_vehicle_type = inbound_capacity_of_vehicles[vehicle_type]
-            mode_of_transport_distribution_of_vehicle_type = \
-                ModeOfTransportDistributionRepository().get_distribution()[vehicle_type]
+            mode_of_transport_distribution_of_vehicle_type = mode_of_transport_distribution[vehicle_type]
             vehicle_to_truck_fraction = mode_of_transport_distribution_of_vehicle_type[ModeOfTransport.truck]
             number_of_containers_to_pick_up_by_truck_from_vehicle_type = \
                 number_of_containers_delivered_to_terminal_by_vehicle_type * vehicle_to_truck_fraction
@@ -55,15 +55,11 @@ class InboundAndOutboundVehicleCapacityCalculatorService:
             for vehicle_type in ModeOfTransport
         }
 
-        for schedule in Schedule.select():
-            arrivals = create_arrivals_within_time_range(
-                start_date,
-                schedule.vehicle_arrives_at,
-                end_date,
-                schedule.vehicle_arrives_every_k_days,
-                schedule.vehicle_arrives_at_time
-            )
-            total_capacity_moved_by_vessel = (len(arrivals)  # number of vehicles that are planned
+        schedules = list(Schedule.select())
+        arrivals_of_schedules = create_arrivals_of_schedules(start_date, end_date, schedules)
+        for schedule in schedules:
+            number_of_arrivals = arrivals_of_schedules.get_number_of_arrivals(schedule.id)
+            total_capacity_moved_by_vessel = (number_of_arrivals  # number of vehicles that are planned
                                               * schedule.average_moved_capacity)  # TEU capacity of each vehicle
             containers[schedule.vehicle_type] += total_capacity_moved_by_vessel / \
                 (ContainerLengthDistributionRepository.get_teu_factor() * 20)
@@ -109,24 +105,20 @@ class InboundAndOutboundVehicleCapacityCalculatorService:
             for vehicle_type in ModeOfTransport
         }
 
+        schedules = list(Schedule.select())
+        arrivals_of_schedules = create_arrivals_of_schedules(start_date, end_date, schedules)
         schedule: Schedule
-        for schedule in Schedule.select():
+        for schedule in schedules:
             assert schedule.average_moved_capacity <= schedule.average_vehicle_capacity, \
                 "A vehicle cannot move a larger amount of containers (in TEU) than its capacity, " \
                 f"the input data is malformed. Schedule '{schedule.service_name}' of vehicle type " \
                 f"{schedule.vehicle_type} has an average moved capacity of {schedule.average_moved_capacity} but an " \
                 f"averaged vehicle capacity of {schedule.average_vehicle_capacity}."
 
-            arrivals = create_arrivals_within_time_range(
-                start_date,
-                schedule.vehicle_arrives_at,
-                end_date,
-                schedule.vehicle_arrives_every_k_days,
-                schedule.vehicle_arrives_at_time
-            )
+            number_of_arrivals = arrivals_of_schedules.get_number_of_arrivals(schedule.id)
 
             # If all container flows are balanced, only the average moved capacity is required
-            total_average_capacity_moved_by_vessel_in_teu = len(arrivals) * schedule.average_moved_capacity
+            total_average_capacity_moved_by_vessel_in_teu = number_of_arrivals * schedule.average_moved_capacity
             outbound_used_capacity_in_teu[schedule.vehicle_type] += total_average_capacity_moved_by_vessel_in_teu
             outbound_used_containers[schedule.vehicle_type] += total_average_capacity_moved_by_vessel_in_teu / \
                 (ContainerLengthDistributionRepository.get_teu_factor() * 20)
@@ -136,7 +128,7 @@ class InboundAndOutboundVehicleCapacityCalculatorService:
                 schedule.average_moved_capacity * (1 + transportation_buffer),
                 schedule.average_vehicle_capacity
             )
-            total_maximum_capacity_moved_by_vessel = len(arrivals) * maximum_capacity_of_vehicle_in_teu
+            total_maximum_capacity_moved_by_vessel = number_of_arrivals * maximum_capacity_of_vehicle_in_teu
             outbound_maximum_capacity_in_teu[schedule.vehicle_type] += total_maximum_capacity_moved_by_vessel
             outbound_maximum_containers[schedule.vehicle_type] += total_maximum_capacity_moved_by_vessel / \
                 (ContainerLengthDistributionRepository.get_teu_factor() * 20)
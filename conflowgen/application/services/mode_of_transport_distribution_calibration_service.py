@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import typing
+
+import numpy as np
+
+from conflowgen.application.services.inbound_and_outbound_vehicle_capacity_calculator_service import \
+    InboundAndOutboundVehicleCapacityCalculatorService
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
+    ModeOfTransportDistributionRepository
+from conflowgen.previews.batched_hypotheses_preview import BatchedHypothesesPreview
+from conflowgen.previews.modal_split_preview import ModalSplitPreview
+
+
+class NoFeasibleModeOfTransportDistributionException(Exception):
+    pass
+
+
+class ModeOfTransportDistributionCalibrationService:
+    """
+    Searches for a mode of transport distribution that neither exceeds the outbound capacity of any vehicle type nor
+    deviates from the target modal split, according to the capacity model of the previews.
+
+    The search is formulated as a linear program over the container flows in TEU from each inbound vehicle type to each
+    outbound vehicle type.
+    The flows of the vehicles adhering to a schedule must add up to their inbound capacity, and the trucks deliver
+    as much as they pick up.
+    The objective is to minimize the deviations from the targets and, with a much smaller weight, the deviation from
+    the current mode of transport distribution.
+    """
+
+    logger = logging.getLogger("conflowgen")
+
+    #: The weight of the deviation from the current distribution relative to the deviation from the targets
+    regularization_weight = 1e-3
+
+    #: The outbound capacities are reduced by this share of the total scheduled capacity
+    capacity_margin = 1e-6
+
+    hinterland_vehicle_types = [ModeOfTransport.train, ModeOfTransport.barge, ModeOfTransport.truck]
+
+    def __init__(self, start_date: datetime.date, end_date: datetime.date, transportation_buffer: float):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.transportation_buffer = transportation_buffer
+        self.vehicle_types = BatchedHypothesesPreview.vehicle_types
+
+    def _index(self, inbound_vehicle_type: ModeOfTransport, outbound_vehicle_type: ModeOfTransport) -> int:
+        return self.vehicle_types.index(inbound_vehicle_type) * len(self.vehicle_types) \
+            + self.vehicle_types.index(outbound_vehicle_type)
+
+    def _get_hinterland_volume_coefficients(self, vehicle_type: ModeOfTransport) -> np.ndarray:
+        # Like ModalSplitPreview.get_modal_split_for_hinterland with both the inbound and the outbound journeys
+        coefficients = np.zeros(len(self.vehicle_types) ** 2)
+        for other_vehicle_type in self.vehicle_types:
+            coefficients[self._index(vehicle_type, other_vehicle_type)] += 1
+            coefficients[self._index(other_vehicle_type, vehicle_type)] += 1
+        return coefficients
+
+    @property
+    def _number_of_flows(self) -> int:
+        return len(self.vehicle_types) ** 2
+
+    def _validate_targets(
+            self,
+            hinterland_modal_split: typing.Optional[typing.Dict[ModeOfTransport, float]],
+            transshipment_share: typing.Optional[float],
+            tolerance: float
+    ) -> None:
+        if hinterland_modal_split is not None:
+            if set(hinterland_modal_split.keys()) != set(self.hinterland_vehicle_types):
+                raise ValueError(
+                    f"The hinterland modal split must contain exactly the vehicle types {self.hinterland_vehicle_types}"
+                    f" but it contains {list(hinterland_modal_split.keys())}."
+                )
+            if not np.isclose(sum(hinterland_modal_split.values()), 1, atol=tolerance):
+                raise ValueError(f"The hinterland modal split must sum to 1 but it is {hinterland_modal_split}.")
+        if transshipment_share is not None and not 0 <= transshipment_share <= 1:
+            raise ValueError(f"The transshipment share must range between 0 and 1 but it is {transshipment_share}.")
+
+    def _get_relative_capacities(
+            self
+    ) -> typing.Tuple[typing.Dict[ModeOfTransport, float], typing.Dict[ModeOfTransport, float]]:
+        """
+        All volumes are expressed relative to the total scheduled capacity to keep the linear program well-scaled.
+
+        Returns:
+            The inbound capacity of each vehicle type adhering to a schedule and the maximum outbound capacity of each
+            of them that is limited at all.
+        """
+        scheduled_vehicle_types = ModeOfTransport.get_scheduled_vehicles()
+        inbound_capacity = InboundAndOutboundVehicleCapacityCalculatorService.get_inbound_capacity_of_vehicles(
+            self.start_date, self.end_date
+        ).teu
+        maximum_outbound_capacity = InboundAndOutboundVehicleCapacityCalculatorService.\
+            get_outbound_capacity_of_vehicles(self.start_date, self.end_date, self.transportation_buffer).maximum.teu
+        total_scheduled_capacity = sum(inbound_capacity[vehicle_type] for vehicle_type in scheduled_vehicle_types)
+        if total_scheduled_capacity == 0:
+            raise NoFeasibleModeOfTransportDistributionException(
+                "No vehicle adhering to a schedule delivers containers in the given time range."
+            )
+        scheduled_capacity = {
+            vehicle_type: inbound_capacity[vehicle_type] / total_scheduled_capacity
+            for vehicle_type in scheduled_vehicle_types
+        }
+        outbound_capacity = {
+            vehicle_type: maximum_outbound_capacity[vehicle_type] / total_scheduled_capacity
+            for vehicle_type in scheduled_vehicle_types
+            if not np.isnan(maximum_outbound_capacity[vehicle_type])
+        }
+        return scheduled_capacity, outbound_capacity
+
+    def _get_current_flows(
+            self,
+            scheduled_capacity: typing.Dict[ModeOfTransport, float],
+            current_distribution_array: np.ndarray
+    ) -> np.ndarray:
+        number_of_vehicle_types = len(self.vehicle_types)
+        current_flows = np.zeros((number_of_vehicle_types, number_of_vehicle_types))
+        for vehicle_type, capacity in scheduled_capacity.items():
+            i = self.vehicle_types.index(vehicle_type)
+            current_flows[i] = capacity * current_distribution_array[i]
+        truck_row = self.vehicle_types.index(ModeOfTransport.truck)
+        current_flows[truck_row] = current_flows[:, truck_row].sum() * current_distribution_array[truck_row]
+        return current_flows.flatten()
+
+    def _get_targets(
+            self,
+            hinterland_modal_split: typing.Optional[typing.Dict[ModeOfTransport, float]],
+            transshipment_share: typing.Optional[float]
+    ) -> typing.List[np.ndarray]:
+        """
+        Returns:
+            For each target, the coefficients of the flows.
+            A target is met if the flows multiplied with its coefficients add up to zero.
+        """
+        targets: typing.List[np.ndarray] = []
+        if hinterland_modal_split is not None:
+            hinterland_volume = sum(
+                self._get_hinterland_volume_coefficients(vehicle_type)
+                for vehicle_type in self.hinterland_vehicle_types
+            )
+            for vehicle_type in self.hinterland_vehicle_types:
+                targets.append(
+                    self._get_hinterland_volume_coefficients(vehicle_type)
+                    - hinterland_modal_split[vehicle_type] * hinterland_volume
+                )
+        if transshipment_share is not None:
+            transshipment_volume = np.zeros(self._number_of_flows)
+            for inbound_vehicle_type in ModalSplitPreview.vessels_considered_for_transshipment:
+                for outbound_vehicle_type in ModalSplitPreview.vessels_considered_for_transshipment:
+                    transshipment_volume[self._index(inbound_vehicle_type, outbound_vehicle_type)] = 1
+            targets.append(transshipment_volume - transshipment_share * np.ones(self._number_of_flows))
+        return targets
+
+    def _get_bounds(
+            self,
+            current_distribution_array: np.ndarray,
+            number_of_variables: int,
+            keep_zero_entries: bool
+    ) -> typing.List[typing.Tuple[float, typing.Optional[float]]]:
+        bounds = [(0, None)] * number_of_variables
+        if keep_zero_entries:
+            for i, probability in enumerate(current_distribution_array.flatten()):
+                if probability == 0:
+                    bounds[i] = (0, 0)
+        return bounds
+
+    def _get_equality_constraints(
+            self,
+            scheduled_capacity: typing.Dict[ModeOfTransport, float],
+            targets: typing.List[np.ndarray],
+            number_of_variables: int
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        number_of_flows = self._number_of_flows
+        truck = ModeOfTransport.truck
+        constraints, bounds = [], []
+        for vehicle_type, capacity in scheduled_capacity.items():
+            row = np.zeros(number_of_variables)
+            for outbound_vehicle_type in self.vehicle_types:
+                row[self._index(vehicle_type, outbound_vehicle_type)] = 1
+            constraints.append(row)
+            bounds.append(capacity)
+        # The trucks deliver as many containers as they pick up from the vehicles adhering to a schedule
+        row = np.zeros(number_of_variables)
+        for vehicle_type in self.vehicle_types:
+            row[self._index(truck, vehicle_type)] += 1
+        for vehicle_type in scheduled_capacity:
+            row[self._index(vehicle_type, truck)] -= 1
+        constraints.append(row)
+        bounds.append(0)
+        for k, coefficients in enumerate(targets):
+            row = np.zeros(number_of_variables)
+            row[:number_of_flows] = coefficients
+            row[2 * number_of_flows + 2 * k] = -1
+            row[2 * number_of_flows + 2 * k + 1] = 1
+            constraints.append(row)
+            bounds.append(0)
+        return np.array(constraints), np.array(bounds)
+
+    def _get_inequality_constraints(
+            self,
+            outbound_capacity: typing.Dict[ModeOfTransport, float],
+            current_flows: np.ndarray,
+            number_of_variables: int
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        number_of_flows = self._number_of_flows
+        constraints, bounds = [], []
+        for vehicle_type, capacity in outbound_capacity.items():
+            row = np.zeros(number_of_variables)
+            for inbound_vehicle_type in self.vehicle_types:
+                row[self._index(inbound_vehicle_type, vehicle_type)] = 1
+            constraints.append(row)
+            # The margin absorbs the feasibility tolerance of the solver so that the capacity is not exceeded
+            bounds.append(capacity - self.capacity_margin)
+        for i in range(number_of_flows):
+            # The auxiliary variable is at least as large as the absolute deviation from the current flow
+            for sign in (1, -1):
+                row = np.zeros(number_of_variables)
+                row[i] = sign
+                row[number_of_flows + i] = -1
+                constraints.append(row)
+                bounds.append(sign * current_flows[i])
+        return np.array(constraints), np.array(bounds)
+
+    def _solve(
+            self,
+            objective: np.ndarray,
+            equality_constraints: typing.Tuple[np.ndarray, np.ndarray],
+            inequality_constraints: typing.Tuple[np.ndarray, np.ndarray],
+            bounds: typing.List[typing.Tuple[float, typing.Optional[float]]]
+    ) -> np.ndarray:
+        """
+        Returns:
+            The flows between the vehicle types, one row for each inbound vehicle type
+        """
+        import scipy.optimize  # pylint: disable=import-outside-toplevel
+
+        result = scipy.optimize.linprog(
+            objective,
+            A_ub=inequality_constraints[0],
+            b_ub=inequality_constraints[1],
+            A_eq=equality_constraints[0],
+            b_eq=equality_constraints[1],
+            bounds=bounds,
+            method="highs"
+        )
+        if not result.success:
+            raise NoFeasibleModeOfTransportDistributionException(
+                f"No mode of transport distribution keeps all vehicle types within their outbound capacity: "
+                f"{result.message}"
+            )
+        number_of_vehicle_types = len(self.vehicle_types)
+        return result.x[:self._number_of_flows].reshape(number_of_vehicle_types, number_of_vehicle_types)
+
+    @staticmethod
+    def _get_distribution_array_from_flows(flows: np.ndarray, current_distribution_array: np.ndarray) -> np.ndarray:
+        inbound_volumes = flows.sum(axis=1)
+        calibrated_distribution_array = current_distribution_array.copy()
+        for i, inbound_volume in enumerate(inbound_volumes):
+            # Without any inbound volume, the fractions of the vehicle type do not matter and are kept
+            if inbound_volume > 1e-12:
+                calibrated_distribution_array[i] = np.clip(flows[i] / inbound_volume, 0, 1)
+                calibrated_distribution_array[i] /= calibrated_distribution_array[i].sum()
+        return calibrated_distribution_array
+
+    def calibrate(
+            self,
+            hinterland_modal_split: typing.Optional[typing.Dict[ModeOfTransport, float]] = None,
+            transshipment_share: typing.Optional[float] = None,
+            tolerance: float = 0.01,
+            keep_zero_entries: bool = True
+    ) -> typing.Dict[ModeOfTransport, typing.Dict[ModeOfTransport, float]]:
+        self._validate_targets(hinterland_modal_split, transshipment_share, tolerance)
+
+        current_distribution = ModeOfTransportDistributionRepository().get_distribution()
+        current_distribution_array = BatchedHypothesesPreview.to_array([current_distribution])[0]
+        scheduled_capacity, outbound_capacity = self._get_relative_capacities()
+        current_flows = self._get_current_flows(scheduled_capacity, current_distribution_array)
+        targets = self._get_targets(hinterland_modal_split, transshipment_share)
+
+        # The variables are the flows, then the absolute deviations from the current flows, then the positive and
+        # negative deviations from each target.
+        number_of_flows = self._number_of_flows
+        number_of_variables = 2 * number_of_flows + 2 * len(targets)
+        objective = np.zeros(number_of_variables)
+        objective[number_of_flows:2 * number_of_flows] = self.regularization_weight
+        objective[2 * number_of_flows:] = 1
+
+        flows = self._solve(
+            objective,
+            equality_constraints=self._get_equality_constraints(scheduled_capacity, targets, number_of_variables),
+            inequality_constraints=self._get_inequality_constraints(
+                outbound_capacity, current_flows, number_of_variables
+            ),
+            bounds=self._get_bounds(current_distribution_array, number_of_variables, keep_zero_entries)
+        )
+        calibrated_distribution_array = self._get_distribution_array_from_flows(flows, current_distribution_array)
+
+        self._verify(calibrated_distribution_array, hinterland_modal_split, transshipment_share, tolerance)
+        return {
+            inbound_vehicle_type: {
+                outbound_vehicle_type: float(calibrated_distribution_array[i, j])
+                for j, outbound_vehicle_type in enumerate(self.vehicle_types)
+            }
+            for i, inbound_vehicle_type in enumerate(self.vehicle_types)
+        }
+
+    def _verify(
+            self,
+            calibrated_distribution_array: np.ndarray,
+            hinterland_modal_split: typing.Optional[typing.Dict[ModeOfTransport, float]],
+            transshipment_share: typing.Optional[float],
+            tolerance: float
+    ) -> None:
+        metrics = BatchedHypothesesPreview(self.start_date, self.end_date, self.transportation_buffer).evaluate(
+            calibrated_distribution_array[np.newaxis]
+        )
+        if metrics.outbound_capacity_exceeded[0].any():
+            exceeded_vehicle_types = [
+                vehicle_type
+                for vehicle_type, exceeded in zip(self.vehicle_types, metrics.outbound_capacity_exceeded[0])
+                if exceeded
+            ]
+            raise NoFeasibleModeOfTransportDistributionException(
+                f"The outbound capacity of {exceeded_vehicle_types} is still exceeded."
+            )
+        deviations = {}
+        if hinterland_modal_split is not None:
+            achieved_volumes = metrics.hinterland_modal_split_inbound_and_outbound[0]
+            if achieved_volumes.sum() > 0:
+                achieved_modal_split = achieved_volumes / achieved_volumes.sum()
+                for vehicle_type, achieved_share in zip(self.hinterland_vehicle_types, achieved_modal_split):
+                    deviations[vehicle_type] = achieved_share - hinterland_modal_split[vehicle_type]
+        if transshipment_share is not None:
+            total_volume = metrics.transshipment_capacity[0] + metrics.hinterland_capacity[0]
+            if total_volume > 0:
+                deviations["transshipment"] = metrics.transshipment_capacity[0] / total_volume - transshipment_share
+        self.logger.debug(f"Deviations of the calibrated mode of transport distribution from the targets: {deviations}")
+        missed_targets = {target: deviation for target, deviation in deviations.items() if abs(deviation) > tolerance}
+        if missed_targets:
+            raise NoFeasibleModeOfTransportDistributionException(
+                f"The targets cannot be met within the tolerance of {tolerance}, the deviations are {missed_targets}."
+            )
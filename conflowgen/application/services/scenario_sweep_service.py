@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import typing
+
+from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis_summary import \
+    ContainerFlowAdjustedToVehicleType
+from conflowgen.database_connection.sqlite_database_connection import SqliteDatabaseConnection
+from conflowgen.descriptive_datatypes import TransshipmentAndHinterlandSplit, HinterlandModalSplit
+
+
+class UnknownScenarioSettingException(Exception):
+    pass
+
+
+class ScenarioSweepResult(typing.NamedTuple):
+    """
+    This tuple keeps track of the summary analyses of one generated scenario variant.
+    """
+
+    #: The name of the variant as it has been provided to the sweep
+    variant_name: str
+
+    #: The file name of the SQLite database that contains the generated container flow of the variant
+    file_name: str
+
+    #: The split between transshipment and hinterland traffic in TEU
+    transshipment_and_hinterland_split: TransshipmentAndHinterlandSplit
+
+    #: The modal split of the hinterland traffic (both inbound and outbound) in TEU
+    hinterland_modal_split: HinterlandModalSplit
+
+    #: The container volume in TEU that had to be re-assigned to a different vehicle type on the outbound journey
+    container_flow_adjusted_to_vehicle_type: ContainerFlowAdjustedToVehicleType
+
+
+def _apply_scenario_settings(settings: typing.Dict[str, typing.Any]) -> None:
+    # pylint: disable=import-outside-toplevel
+    from conflowgen.api.container_dwell_time_distribution_manager import ContainerDwellTimeDistributionManager
+    from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+    from conflowgen.api.mode_of_transport_distribution_manager import ModeOfTransportDistributionManager
+    from conflowgen.api.truck_arrival_distribution_manager import TruckArrivalDistributionManager
+
+    if "transportation_buffer" in settings:
+        container_flow_generation_manager = ContainerFlowGenerationManager()
+        properties = container_flow_generation_manager.get_properties()
+        container_flow_generation_manager.set_properties(
+            start_date=properties["start_date"],
+            end_date=properties["end_date"],
+            transportation_buffer=settings["transportation_buffer"]
+        )
+    if "mode_of_transport_distribution" in settings:
+        ModeOfTransportDistributionManager().set_mode_of_transport_distribution(
+            settings["mode_of_transport_distribution"]
+        )
+    if "container_dwell_time_distribution" in settings:
+        ContainerDwellTimeDistributionManager().set_container_dwell_time_distribution(
+            settings["container_dwell_time_distribution"]
+        )
+    if "truck_arrival_distribution" in settings:
+        TruckArrivalDistributionManager().set_truck_arrival_distribution(
+            settings["truck_arrival_distribution"]
+        )
+
+
+def _generate_variant(
+        sqlite_databases_directory: str,
+        variant_name: str,
+        file_name: str,
+        settings: typing.Dict[str, typing.Any]
+) -> ScenarioSweepResult:
+    """
+    This function is executed in a worker process. Each worker process has its own database proxy and its own cache
+    for the data summaries, so the variants do not interfere with each other.
+    """
+    # pylint: disable=import-outside-toplevel
+    from conflowgen.analyses.container_flow_adjustment_by_vehicle_type_analysis_summary import \
+        ContainerFlowAdjustmentByVehicleTypeAnalysisSummary
+    from conflowgen.analyses.modal_split_analysis import ModalSplitAnalysis
+    from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+    from conflowgen.api.database_chooser import DatabaseChooser
+
+    database_chooser = DatabaseChooser(sqlite_databases_directory=sqlite_databases_directory)
+    database_chooser.load_existing_sqlite_database(file_name)
+    try:
+        _apply_scenario_settings(settings)
+        ContainerFlowGenerationManager().generate()
+
+        modal_split_analysis = ModalSplitAnalysis()
+        result = ScenarioSweepResult(
+            variant_name=variant_name,
+            file_name=file_name,
+            transshipment_and_hinterland_split=modal_split_analysis.get_transshipment_and_hinterland_split(),
+            hinterland_modal_split=modal_split_analysis.get_modal_split_for_hinterland_traffic(
+                inbound=True, outbound=True
+            ),
+            container_flow_adjusted_to_vehicle_type=ContainerFlowAdjustmentByVehicleTypeAnalysisSummary().get_summary()
+        )
+    finally:
+        database_chooser.close_current_connection()
+    return result
+
+
+class ScenarioSweepService:
+
+    supported_settings = {
+        "transportation_buffer",
+        "mode_of_transport_distribution",
+        "container_dwell_time_distribution",
+        "truck_arrival_distribution",
+    }
+
+    def __init__(self, sqlite_databases_directory: typing.Optional[str] = None):
+        self.sqlite_database_connection = SqliteDatabaseConnection(
+            sqlite_databases_directory=sqlite_databases_directory
+        )
+        self.logger = logging.getLogger("conflowgen")
+
+    @staticmethod
+    def get_file_name_of_variant(base_file_name: str, variant_name: str) -> str:
+        base_name, extension = os.path.splitext(base_file_name)
+        return f"{base_name}__{variant_name}{extension or '.sqlite'}"
+
+    def run(
+            self,
+            base_file_name: str,
+            variants: typing.Dict[str, typing.Dict[str, typing.Any]],
+            max_workers: typing.Optional[int] = None,
+            overwrite: bool = False
+    ) -> typing.Dict[str, ScenarioSweepResult]:
+        for variant_name, settings in variants.items():
+            unknown_settings = set(settings.keys()) - self.supported_settings
+            if unknown_settings:
+                raise UnknownScenarioSettingException(
+                    f"Variant '{variant_name}' contains the unknown settings {sorted(unknown_settings)}, only "
+                    f"{sorted(self.supported_settings)} are supported."
+                )
+
+        if not variants:
+            return {}
+
+        file_names = {}
+        for variant_name in variants.keys():
+            file_name = self.get_file_name_of_variant(base_file_name, variant_name)
+            self.sqlite_database_connection.copy_database(
+                base_file_name, file_name, include_flow=False, overwrite=overwrite
+            )
+            file_names[variant_name] = file_name
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(variants)))
+        self.logger.info(f"Generate {len(variants)} variants of '{base_file_name}' with {max_workers} worker processes")
+
+        results: typing.Dict[str, ScenarioSweepResult] = {}
+        # 'spawn' guarantees fresh interpreters so that no database connection is inherited from the parent process
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _generate_variant,
+                    self.sqlite_database_connection.sqlite_databases_directory,
+                    variant_name,
+                    file_names[variant_name],
+                    settings
+                ): variant_name
+                for variant_name, settings in variants.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                variant_name = futures[future]
+                results[variant_name] = future.result()
+                self.logger.info(f"Variant '{variant_name}' has been generated")
+
+        return {
+            variant_name: results[variant_name]
+            for variant_name in variants.keys()
+        }
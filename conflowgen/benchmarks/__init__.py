@@ -0,0 +1,20 @@
+"""
+Benchmarks of the container flow generation, the analyses, and the export on synthetic scenarios of different sizes.
+Run them from the command line with ``python -m conflowgen.benchmarks --help``.
+The results are saved as JSON so that runs of different commits can be compared.
+"""
+from .benchmark import run_benchmark, format_benchmark_results, compare_benchmark_results, save_benchmark_results, \
+    load_benchmark_results, measure_import_time
+from .scenario import BenchmarkScenario, PRESET_SCENARIOS, add_scenario_to_current_database
+
+__all__ = [
+    "run_benchmark",
+    "format_benchmark_results",
+    "compare_benchmark_results",
+    "save_benchmark_results",
+    "load_benchmark_results",
+    "measure_import_time",
+    "BenchmarkScenario",
+    "PRESET_SCENARIOS",
+    "add_scenario_to_current_database",
+]
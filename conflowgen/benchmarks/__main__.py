@@ -0,0 +1,69 @@
+import argparse
+import logging
+import typing
+
+from conflowgen.benchmarks.benchmark import run_benchmark, compare_benchmark_results, save_benchmark_results, \
+    load_benchmark_results, format_benchmark_results, measure_import_time
+from conflowgen.benchmarks.scenario import BenchmarkScenario, PRESET_SCENARIOS
+from conflowgen.logging.logging import setup_logger
+
+
+def main(args: typing.Optional[typing.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m conflowgen.benchmarks",
+        description="Time the import, the container flow generation phase by phase, the analyses, and the export."
+    )
+    parser.add_argument(
+        "--scenario", choices=sorted(PRESET_SCENARIOS.keys()), default="tiny",
+        help="The size of the synthetic scenario (default: tiny)"
+    )
+    parser.add_argument("--days", type=int, help="Overwrite the number of days of the scenario")
+    parser.add_argument("--services", type=int, help="Overwrite the number of services of the scenario")
+    parser.add_argument("--seed", type=int, help="Overwrite the seed of the scenario")
+    parser.add_argument(
+        "--database-directory",
+        help="Keep the database and the exports in this directory instead of a temporary one"
+    )
+    parser.add_argument("--output", help="Save the results as JSON to this file")
+    parser.add_argument("--compare", help="Compare the results with the ones saved in this JSON file")
+    parser.add_argument(
+        "--import-only", action="store_true",
+        help="Only time the import of ConFlowGen in fresh Python interpreters"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Also show the logs of the generation")
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.import_only:
+        for name, duration in measure_import_time().items():
+            print(f"import.{name:<73} {duration:>10.3f}")
+        return
+
+    scenario = PRESET_SCENARIOS[parsed_args.scenario]
+    overwritten_fields = {
+        field_name: value for field_name, value in (
+            ("days", parsed_args.days),
+            ("number_of_services", parsed_args.services),
+            ("seed", parsed_args.seed),
+        ) if value is not None
+    }
+    if overwritten_fields:
+        scenario = scenario._replace(name=f"{scenario.name}-custom", **overwritten_fields)
+    assert isinstance(scenario, BenchmarkScenario)
+
+    if parsed_args.verbose:
+        setup_logger()
+    else:
+        logging.getLogger("conflowgen").setLevel(logging.WARNING)
+
+    results = run_benchmark(scenario, sqlite_databases_directory=parsed_args.database_directory)
+    if parsed_args.output:
+        save_benchmark_results(results, parsed_args.output)
+
+    if parsed_args.compare:
+        print(compare_benchmark_results(load_benchmark_results(parsed_args.compare), results))
+    else:
+        print(format_benchmark_results(results))
+
+
+if __name__ == "__main__":
+    main()
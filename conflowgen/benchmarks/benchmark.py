@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+import numpy as np
+
+from conflowgen import analyses
+from conflowgen.api.database_chooser import DatabaseChooser
+from conflowgen.api.export_container_flow_manager import ExportContainerFlowManager
+from conflowgen.benchmarks.scenario import BenchmarkScenario, add_scenario_to_current_database
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.flow_generator.container_flow_generation_service import ContainerFlowGenerationService
+from conflowgen.flow_generator.generation_statistics import GenerationStats
+from conflowgen.metadata import __version__
+
+logger = logging.getLogger("conflowgen")
+
+#: The statements whose import time is measured, each in a fresh Python interpreter
+IMPORT_STATEMENTS = {
+    "conflowgen": "import conflowgen",
+    "reports": "from conflowgen.previews import reports\nfrom conflowgen.analyses import reports",
+}
+
+
+def _get_git_commit() -> typing.Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _timed(durations: typing.Dict[str, float], name: str, func: typing.Callable[[], None]) -> None:
+    start = time.perf_counter()
+    func()
+    durations[name] = time.perf_counter() - start
+
+
+def measure_import_time(repetitions: int = 3) -> typing.Dict[str, float]:
+    """
+    Executes each of the :data:`IMPORT_STATEMENTS` in a fresh Python interpreter so that no module is cached yet.
+
+    Args:
+        repetitions: How often each statement is executed. The fastest run is reported to reduce the noise.
+
+    Returns:
+        The duration of each import statement in seconds
+    """
+    durations: typing.Dict[str, float] = {}
+    for name, statement in IMPORT_STATEMENTS.items():
+        code = f"import time\nstarted_at = time.perf_counter()\n{statement}\nprint(time.perf_counter() - started_at)"
+        durations[name] = min(
+            float(subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout)
+            for _ in range(repetitions)
+        )
+    return durations
+
+
+def _run_generation() -> GenerationStats:
+    return ContainerFlowGenerationService().generate()
+
+
+def _run_analyses() -> typing.Dict[str, float]:
+    durations: typing.Dict[str, float] = {}
+    DataSummariesCache.reset_cache()
+    for report_type in analyses.reports:
+        report = report_type()
+        _timed(durations, report_type.__name__, report.get_report_as_text)
+    return durations
+
+
+def _run_exports(path_to_export_folder: str) -> typing.Dict[str, float]:
+    export_container_flow_manager = ExportContainerFlowManager()
+    durations: typing.Dict[str, float] = {}
+    _timed(durations, "csv", lambda: export_container_flow_manager.export(
+        "benchmark", path_to_export_folder, overwrite=True
+    ))
+    _timed(durations, "sqlite", lambda: export_container_flow_manager.export_as_sqlite_database(
+        "benchmark", path_to_export_folder, overwrite=True
+    ))
+    return durations
+
+
+def run_benchmark(
+        scenario: BenchmarkScenario,
+        sqlite_databases_directory: typing.Optional[str] = None
+) -> typing.Dict[str, typing.Any]:
+    """
+    Measures the import time, creates a fresh database for the scenario, generates the container flow, runs all
+    analyses, and exports the container flow.
+    Each step is timed separately.
+
+    Args:
+        scenario: The size of the synthetic scenario
+        sqlite_databases_directory: The directory the database and the exports are saved in.
+            Defaults to a temporary directory that is removed afterwards.
+
+    Returns:
+        The results, ready to be saved as JSON
+    """
+    logger.info("Benchmarking the import")
+    import_durations = measure_import_time()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        if sqlite_databases_directory is None:
+            sqlite_databases_directory = temporary_directory
+        database_chooser = DatabaseChooser(sqlite_databases_directory=sqlite_databases_directory)
+        database_chooser.create_new_sqlite_database(f"benchmark_{scenario.name}.sqlite", overwrite=True)
+        try:
+            add_scenario_to_current_database(scenario)
+            random.seed(scenario.seed)
+            np.random.seed(scenario.seed)
+
+            logger.info(f"Benchmarking the container flow generation for the scenario {scenario}")
+            generation_stats = _run_generation()
+            counts = {
+                "containers": Container.select().count(),
+                "large_scheduled_vehicles": LargeScheduledVehicle.select().count(),
+                "trucks": Truck.select().count(),
+            }
+
+            logger.info("Benchmarking the analyses")
+            analysis_durations = _run_analyses()
+
+            logger.info("Benchmarking the export")
+            export_durations = _run_exports(os.path.join(sqlite_databases_directory, "exports"))
+        finally:
+            database_chooser.close_current_connection()
+
+    return {
+        "conflowgen_version": __version__,
+        "git_commit": _get_git_commit(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "started_at": datetime.datetime.now().replace(microsecond=0).isoformat(),
+        "scenario": scenario._asdict(),
+        "counts": counts,
+        "generation_phases": {
+            phase.value: {
+                **phase_stats._asdict(),
+                "phase": phase.value,
+            }
+            for phase, phase_stats in generation_stats.phases.items()
+        },
+        "durations": {
+            "import": import_durations,
+            "generation": {
+                "total": generation_stats.wall_time,
+                "phases": {
+                    phase.value: phase_stats.wall_time for phase, phase_stats in generation_stats.phases.items()
+                },
+            },
+            "analyses": analysis_durations,
+            "export": export_durations,
+        },
+    }
+
+
+def _flatten_durations(durations: typing.Dict[str, typing.Any], prefix: str = "") -> typing.Dict[str, float]:
+    flat_durations = {}
+    for name, value in durations.items():
+        if isinstance(value, dict):
+            flat_durations.update(_flatten_durations(value, prefix=f"{prefix}{name}."))
+        else:
+            flat_durations[prefix + name] = value
+    return flat_durations
+
+
+def format_benchmark_results(results: typing.Dict[str, typing.Any]) -> str:
+    """
+    Returns:
+        A table that lists the duration of each timed step in seconds.
+    """
+    lines = [
+        f"scenario: {results['scenario']}, commit: {results.get('git_commit')}",
+        f"counts: {results['counts']}",
+        f"{'step':<80} {'seconds':>10}",
+    ]
+    for step, duration in _flatten_durations(results["durations"]).items():
+        lines.append(f"{step:<80} {duration:>10.3f}")
+    return "\n".join(lines)
+
+
+def compare_benchmark_results(
+        previous_results: typing.Dict[str, typing.Any],
+        current_results: typing.Dict[str, typing.Any]
+) -> str:
+    """
+    Returns:
+        A table that lists each timed step of both benchmark runs together with the ratio of the durations.
+        A ratio above 1 means that the step has become slower.
+    """
+    previous_durations = _flatten_durations(previous_results["durations"])
+    current_durations = _flatten_durations(current_results["durations"])
+    lines = [
+        f"previous: {previous_results.get('git_commit')} ({previous_results['scenario']['name']}), "
+        f"current: {current_results.get('git_commit')} ({current_results['scenario']['name']})",
+        f"{'step':<80} {'previous':>10} {'current':>10} {'ratio':>8}",
+    ]
+    for step, current_duration in current_durations.items():
+        previous_duration = previous_durations.get(step)
+        if previous_duration is None:
+            lines.append(f"{step:<80} {'-':>10} {current_duration:>10.3f} {'-':>8}")
+        else:
+            ratio = current_duration / previous_duration if previous_duration > 0 else float("inf")
+            lines.append(f"{step:<80} {previous_duration:>10.3f} {current_duration:>10.3f} {ratio:>8.2f}")
+    return "\n".join(lines)
+
+
+def save_benchmark_results(results: typing.Dict[str, typing.Any], path_to_file: str) -> None:
+    with open(path_to_file, "w", encoding="utf-8") as json_file:
+        json.dump(results, json_file, indent=2)
+
+
+def load_benchmark_results(path_to_file: str) -> typing.Dict[str, typing.Any]:
+    with open(path_to_file, encoding="utf-8") as json_file:
+        return json.load(json_file)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import datetime
+import random
+import typing
+
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+
+
+class BenchmarkScenario(typing.NamedTuple):
+    """
+    Describes the size of a synthetic scenario the container flow generation is benchmarked with.
+    """
+
+    #: The name of the scenario, it is also part of the database name
+    name: str
+
+    #: The number of days the container flow is generated for
+    days: int
+
+    #: The number of services that visit the terminal, they are spread over deep sea vessels, feeders, barges, and
+    #: trains
+    number_of_services: int
+
+    #: The seed for creating the services and for the random number generators used during the generation
+    seed: int = 1
+
+
+#: Scenarios of increasing size, from a quick check to a year of operations at a large terminal
+PRESET_SCENARIOS: typing.Dict[str, BenchmarkScenario] = {
+    scenario.name: scenario for scenario in (
+        BenchmarkScenario(name="tiny", days=7, number_of_services=5),
+        BenchmarkScenario(name="small", days=30, number_of_services=20),
+        BenchmarkScenario(name="medium", days=90, number_of_services=60),
+        BenchmarkScenario(name="large", days=365, number_of_services=200),
+    )
+}
+
+# For each vehicle type, the share of the services, the range of the average vehicle capacity in TEU, and the range of
+# the share of the capacity that is moved at the terminal per call. The ranges are inspired by the demo scripts.
+_SERVICE_PROFILES = {
+    ModeOfTransport.deep_sea_vessel: (0.2, (8000, 20000), (0.05, 0.15)),
+    ModeOfTransport.feeder: (0.35, (800, 1500), (0.15, 0.35)),
+    ModeOfTransport.barge: (0.2, (50, 150), (0.5, 0.8)),
+    ModeOfTransport.train: (0.25, (80, 100), (0.6, 0.9)),
+}
+
+_DESTINATION_NAMES = ("DEBRV", "RULED", "PLGDN", "NLRTM", "BEANR", "CNSHA", "USNYC", "SGSIN")
+
+
+def _get_number_of_services_per_vehicle_type(number_of_services: int) -> typing.Dict[ModeOfTransport, int]:
+    vehicle_types = list(_SERVICE_PROFILES.keys())
+    if number_of_services < len(vehicle_types):
+        return {vehicle_type: 1 for vehicle_type in vehicle_types[:number_of_services]}
+    number_of_services_per_vehicle_type = {
+        vehicle_type: max(1, int(_SERVICE_PROFILES[vehicle_type][0] * number_of_services))
+        for vehicle_type in vehicle_types
+    }
+    # The rounding remainder is added to the feeders, the most frequent type of service
+    number_of_services_per_vehicle_type[ModeOfTransport.feeder] += \
+        number_of_services - sum(number_of_services_per_vehicle_type.values())
+    return number_of_services_per_vehicle_type
+
+
+def add_scenario_to_current_database(
+        scenario: BenchmarkScenario,
+        start_date: datetime.date = datetime.date(2021, 7, 1)
+) -> None:
+    """
+    Sets the properties and adds the weekly services of the scenario to the database that is currently selected.
+    The services only depend on the scenario, thus the same scenario always leads to the same input data.
+    """
+    if scenario.days < 1 or scenario.number_of_services < 1:
+        raise ValueError(f"The scenario {scenario} requires at least one day and one service.")
+    seeded_random = random.Random(x=scenario.seed)
+
+    ContainerFlowGenerationManager().set_properties(
+        name=f"Benchmark '{scenario.name}'",
+        start_date=start_date,
+        end_date=start_date + datetime.timedelta(days=scenario.days)
+    )
+
+    port_call_manager = PortCallManager()
+    for vehicle_type, number_of_services in _get_number_of_services_per_vehicle_type(
+            scenario.number_of_services).items():
+        _, vehicle_capacity_range, moved_share_range = _SERVICE_PROFILES[vehicle_type]
+        for i in range(number_of_services):
+            next_destinations = None
+            if vehicle_type in (ModeOfTransport.deep_sea_vessel, ModeOfTransport.feeder):
+                destination_names = seeded_random.sample(_DESTINATION_NAMES, k=seeded_random.randint(2, 4))
+                next_destinations = [
+                    (destination_name, 1 / len(destination_names)) for destination_name in destination_names
+                ]
+            average_vehicle_capacity = seeded_random.randint(*vehicle_capacity_range)
+            port_call_manager.add_vehicle(
+                vehicle_type=vehicle_type,
+                service_name=f"{vehicle_type.value}-{i + 1}",
+                vehicle_arrives_at=start_date + datetime.timedelta(days=seeded_random.randint(0, 6)),
+                vehicle_arrives_at_time=datetime.time(hour=seeded_random.randint(0, 23)),
+                average_vehicle_capacity=average_vehicle_capacity,
+                average_moved_capacity=int(average_vehicle_capacity * seeded_random.uniform(*moved_share_range)),
+                next_destinations=next_destinations
+            )
@@ -1,5 +1,6 @@
 # Decorator class for preview and analysis result caching
 from functools import wraps
+from typing import Tuple
 
 
 class DataSummariesCache:
@@ -18,6 +19,10 @@ class DataSummariesCache:
     cached_results = {}
     _hit_counter = {}  # For internal testing purposes
 
+    # These counters are never reset so that the hit rate of a period can be determined by taking the differences
+    _number_of_lookups = 0
+    _number_of_misses = 0
+
     # Decorator function to accept function as argument, and return cached result if available or compute and cache
     # result
     @classmethod
@@ -36,10 +41,12 @@ class DataSummariesCache:
             if function_name not in cls._hit_counter:
                 cls._hit_counter[function_name] = 0
             cls._hit_counter[function_name] += 1
+            cls._number_of_lookups += 1
 
             # Check if key exists in cache
             if key in cls.cached_results:
                 return cls.cached_results[key]
+            cls._number_of_misses += 1
 
             # If not, compute result
             result = func(*args, **kwargs)
@@ -50,6 +57,15 @@ class DataSummariesCache:
 
         return wrapper
 
+    @classmethod
+    def get_lookup_statistics(cls) -> Tuple[int, int]:
+        """
+        Returns:
+            The number of lookups and the number of lookups that were not answered from the cache since the start of
+            the process.
+        """
+        return cls._number_of_lookups, cls._number_of_misses
+
     # Reset cache
     @classmethod
     def reset_cache(cls):
@@ -2,6 +2,7 @@ import logging
 
 import peewee
 
+from conflowgen.application.models.container_flow_generation_checkpoint import ContainerFlowGenerationCheckpoint
 from conflowgen.application.models.container_flow_generation_properties import ContainerFlowGenerationProperties
 from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup, \
     TruckArrivalInformationForDelivery
@@ -18,6 +19,20 @@ from conflowgen.domain_models.vehicle import DeepSeaVessel, Feeder, LargeSchedul
 
 logger = logging.getLogger("conflowgen")
 
+#: These tables are filled during the container flow generation, all other tables contain the input data
+CONTAINER_FLOW_TABLES = (
+    Container,
+    LargeScheduledVehicle,
+    DeepSeaVessel,
+    Feeder,
+    Barge,
+    Train,
+    Truck,
+    TruckArrivalInformationForPickup,
+    TruckArrivalInformationForDelivery,
+    ContainerFlowGenerationCheckpoint,
+)
+
 
 def create_tables(sql_db_connection: peewee.Database) -> peewee.Database:
     logger.debug("Creating all tables...")
@@ -36,6 +51,7 @@ def create_tables(sql_db_connection: peewee.Database) -> peewee.Database:
         ContainerWeightDistribution,
         ContainerLengthDistribution,
         ContainerFlowGenerationProperties,
+        ContainerFlowGenerationCheckpoint,
         TruckArrivalDistribution,
         TruckArrivalInformationForPickup,
         TruckArrivalInformationForDelivery,
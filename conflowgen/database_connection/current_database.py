@@ -0,0 +1,17 @@
+from typing import Optional
+
+from conflowgen.domain_models.base_model import database_proxy
+
+
+def get_path_to_current_database() -> Optional[str]:
+    """
+    Returns:
+        The path to the SQLite file of the current database or :py:obj:`None` if no database has been chosen yet or if
+        the database only exists in memory.
+    """
+    if database_proxy.obj is None:
+        return None
+    path_to_database = database_proxy.obj.database
+    if path_to_database in ("", ":memory:") or str(path_to_database).startswith("file::memory:"):
+        return None
+    return path_to_database
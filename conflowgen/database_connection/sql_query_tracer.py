@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import collections
+import os
+import re
+import sys
+import threading
+import time
+import typing
+
+import peewee
+
+
+class QueryStatistics(typing.NamedTuple):
+    """
+    The aggregated numbers of all executions of one SQL statement.
+    """
+
+    #: The SQL statement with the whitespace collapsed and with literals and lists of parameters replaced by
+    #: placeholders
+    normalized_sql: str
+
+    #: How often the statement has been executed
+    count: int
+
+    #: The time in seconds spent in executing the statement, summed over all executions
+    total_time: float
+
+    #: The code locations the statement has been issued from, ordered by how often they issued it
+    locations: typing.List[typing.Tuple[str, int]]
+
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?(?![\w\"])")
+_LIST_OF_PLACEHOLDERS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_ROWS = re.compile(r"(\((?:\.\.\.|\?)\))(?:, \1)+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Maps all statements that only differ in their literals or in the length of their parameter lists to the same
+    string, e.g., ``id IN (?, ?, ?)`` and ``id IN (?, ?)`` both become ``id IN (...)``.
+    """
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _LIST_OF_PLACEHOLDERS.sub("(...)", sql)
+    sql = _REPEATED_ROWS.sub(r"\1, ...", sql)
+    return sql
+
+
+# The frames of these files are skipped when looking for the code that has issued a statement
+_SKIPPED_FILES = {
+    os.path.normcase(os.path.abspath(__file__)),
+    os.path.normcase(os.path.abspath(peewee.__file__)),
+}
+
+
+def _get_calling_location() -> str:
+    frame = sys._getframe(2)  # pylint: disable=protected-access
+    while frame is not None:
+        file_name = os.path.normcase(os.path.abspath(frame.f_code.co_filename))
+        if file_name not in _SKIPPED_FILES and not frame.f_code.co_filename.startswith("<"):
+            return f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+class SqlQueryTracer:
+    """
+    Records each SQL statement that is sent to an SQLite database through peewee, e.g., to spot N+1 query patterns
+    where the same statement is issued once per vehicle or container.
+    Statements are grouped by their normalized SQL, see :func:`.normalize_sql`.
+    For each group, the number of executions, the total time, and the code locations the statement has been issued
+    from are kept.
+
+    The time only covers executing the statement and fetching the first row.
+    The remaining rows of a query are fetched lazily by peewee and are not included.
+
+    The tracer is used as a context manager:
+
+    .. code-block:: python
+
+        with SqlQueryTracer(database) as tracer:
+            ContainerFlowGenerationManager().generate()
+        tracer.print_report(top_n=10)
+    """
+
+    def __init__(self, database: peewee.Database):
+        """
+        Args:
+            database: The database to trace, e.g., the one returned by
+                :meth:`.SqliteDatabaseConnection.choose_database`
+        """
+        self.database = database
+        self._lock = threading.Lock()
+        self._counts: typing.Dict[str, int] = collections.Counter()
+        self._total_times: typing.Dict[str, float] = collections.defaultdict(float)
+        self._locations: typing.Dict[str, typing.Counter[str]] = collections.defaultdict(collections.Counter)
+        self._original_execute_sql: typing.Optional[typing.Callable] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self._original_execute_sql is not None
+
+    def start(self) -> None:
+        """
+        Starts recording the statements.
+        """
+        if self.is_active:
+            return
+        original_execute_sql = self._original_execute_sql = self.database.execute_sql
+
+        def traced_execute_sql(sql, *args, **kwargs):
+            location = _get_calling_location()
+            start = time.perf_counter()
+            try:
+                return original_execute_sql(sql, *args, **kwargs)
+            finally:
+                self._record(sql, time.perf_counter() - start, location)
+
+        # Shadows the method of the class for this database instance only
+        self.database.execute_sql = traced_execute_sql
+
+    def stop(self) -> None:
+        """
+        Stops recording the statements.
+        The recorded numbers are kept.
+        """
+        if not self.is_active:
+            return
+        del self.database.execute_sql
+        self._original_execute_sql = None
+
+    def reset(self) -> None:
+        """
+        Removes all recorded numbers.
+        """
+        with self._lock:
+            self._counts.clear()
+            self._total_times.clear()
+            self._locations.clear()
+
+    def __enter__(self) -> SqlQueryTracer:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _record(self, sql: str, duration: float, location: str) -> None:
+        normalized_sql = normalize_sql(sql)
+        with self._lock:
+            self._counts[normalized_sql] += 1
+            self._total_times[normalized_sql] += duration
+            self._locations[normalized_sql][location] += 1
+
+    def get_statistics(self, order_by: str = "total_time") -> typing.List[QueryStatistics]:
+        """
+        Args:
+            order_by: Either ``"total_time"`` or ``"count"``
+
+        Returns:
+            The numbers of each recorded statement, starting with the most expensive one
+        """
+        if order_by not in ("total_time", "count"):
+            raise ValueError(f"Statements can be ordered by 'total_time' or 'count' but not by '{order_by}'")
+        with self._lock:
+            statistics = [
+                QueryStatistics(
+                    normalized_sql=normalized_sql,
+                    count=count,
+                    total_time=self._total_times[normalized_sql],
+                    locations=self._locations[normalized_sql].most_common()
+                )
+                for normalized_sql, count in self._counts.items()
+            ]
+        return sorted(statistics, key=lambda query_statistics: getattr(query_statistics, order_by), reverse=True)
+
+    def get_report(self, top_n: int = 10, order_by: str = "total_time", max_sql_length: int = 200) -> str:
+        """
+        Args:
+            top_n: The number of statements to list
+            order_by: Either ``"total_time"`` or ``"count"``
+            max_sql_length: Longer statements are truncated
+
+        Returns:
+            A textual report of the most expensive statements
+        """
+        statistics = self.get_statistics(order_by=order_by)
+        total_count = sum(query_statistics.count for query_statistics in statistics)
+        total_time = sum(query_statistics.total_time for query_statistics in statistics)
+        lines = [
+            f"{total_count} statements ({len(statistics)} distinct) took {total_time:.3f}s, "
+            f"top {min(top_n, len(statistics))} by {order_by}:"
+        ]
+        for rank, query_statistics in enumerate(statistics[:top_n], start=1):
+            sql = query_statistics.normalized_sql
+            if len(sql) > max_sql_length:
+                sql = sql[:max_sql_length - 3] + "..."
+            lines.append(
+                f"{rank:>3}. count: {query_statistics.count:>8}, total: {query_statistics.total_time:>8.3f}s, "
+                f"mean: {1000 * query_statistics.total_time / query_statistics.count:>8.3f}ms"
+            )
+            lines.append(f"     {sql}")
+            for location, count in query_statistics.locations[:3]:
+                lines.append(f"     {count:>8}x from {location}")
+            if len(query_statistics.locations) > 3:
+                lines.append(f"     ... and {len(query_statistics.locations) - 3} other locations")
+        return "\n".join(lines)
+
+    def print_report(self, top_n: int = 10, order_by: str = "total_time") -> None:
+        """
+        Prints the report, see :meth:`.get_report`.
+        """
+        print(self.get_report(top_n=top_n, order_by=order_by))
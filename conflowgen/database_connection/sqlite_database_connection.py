@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
+import sqlite3
 from typing import List, Tuple, Optional
 
 from peewee import SqliteDatabase
 
 from conflowgen.application.models.container_flow_generation_properties import ContainerFlowGenerationProperties
-from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.database_connection.create_tables import create_tables, CONTAINER_FLOW_TABLES
+from conflowgen.database_connection.sql_query_tracer import SqlQueryTracer
 from conflowgen.domain_models.base_model import database_proxy
 from conflowgen.domain_models.container import Container
 from conflowgen.domain_models.distribution_seeders import seed_all_distributions
@@ -26,6 +29,10 @@ class AmbiguousParameterException(Exception):
     pass
 
 
+class NoDatabaseChosenException(Exception):
+    pass
+
+
 class SqliteDatabaseConnection:
     """
     The SQLite database stores all content from the API calls to enable reproducible results.
@@ -125,6 +132,17 @@ class SqliteDatabaseConnection:
 
         return self.sqlite_db_connection
 
+    def trace_queries(self) -> SqlQueryTracer:
+        """
+        Opt in to recording the SQL statements sent to the database that is currently opened.
+
+        Returns:
+            A tracer that is started by entering it as a context manager or by calling :meth:`.SqlQueryTracer.start`
+        """
+        if self.sqlite_db_connection is None:
+            raise NoDatabaseChosenException("You must first choose a database to trace its queries.")
+        return SqlQueryTracer(self.sqlite_db_connection)
+
     def delete_database(self, database_name: str) -> None:
         path_to_sqlite_database = self._get_path_to_database(database_name)
         if os.path.isfile(path_to_sqlite_database):
@@ -133,6 +151,79 @@ class SqliteDatabaseConnection:
         else:
             raise SqliteDatabaseIsMissingException(path_to_sqlite_database)
 
+    def copy_database(
+            self,
+            source_database_name: str,
+            target_database_name: str,
+            include_flow: bool = False,
+            overwrite: bool = False
+    ) -> str:
+        """
+        Copies a database.
+        If the container flow is included, the SQLite backup API is used.
+        The backup API reads a consistent snapshot of the source database, including pages that still reside in the
+        write-ahead log.
+        Otherwise, the schema is re-created and only the rows of the input tables are copied.
+
+        Args:
+            source_database_name: The file name of the existing database to copy
+            target_database_name: The file name of the copy
+            include_flow: Whether to also copy the generated container flow, i.e., the containers and vehicles
+            overwrite: Whether to overwrite an existing database with the same name as the copy
+
+        Returns:
+            The path to the copied database
+        """
+        path_to_source_database = self._get_path_to_database(source_database_name)
+        if not os.path.isfile(path_to_source_database):
+            raise SqliteDatabaseIsMissingException(path_to_source_database)
+        path_to_target_database = self._prepare_target_database_file(target_database_name, overwrite)
+
+        self.logger.debug(f"Copying database {path_to_source_database} to {path_to_target_database}, "
+                          f"include_flow={include_flow}")
+        with contextlib.closing(sqlite3.connect(path_to_target_database)) as target_connection:
+            if include_flow:
+                with contextlib.closing(sqlite3.connect(path_to_source_database)) as source_connection:
+                    source_connection.backup(target_connection)
+            else:
+                self._copy_input_tables(path_to_source_database, target_connection)
+        return path_to_target_database
+
+    @staticmethod
+    def _copy_input_tables(path_to_source_database: str, target_connection: sqlite3.Connection) -> None:
+        container_flow_table_names = {
+            model._meta.table_name for model in CONTAINER_FLOW_TABLES  # pylint: disable=protected-access,no-member
+        }
+        target_connection.execute("ATTACH DATABASE ? AS source", (path_to_source_database, ))
+        schema = target_connection.execute(
+            "SELECT type, name, sql FROM source.sqlite_master "
+            "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' "
+            "ORDER BY CASE type WHEN 'table' THEN 0 ELSE 1 END"
+        ).fetchall()
+        with target_connection:
+            for object_type, name, sql in schema:
+                if object_type == "index":
+                    continue
+                target_connection.execute(sql)
+                if object_type == "table" and name not in container_flow_table_names:
+                    target_connection.execute(f'INSERT INTO main."{name}" SELECT * FROM source."{name}"')
+            # Indices are created after the rows have been inserted as this is faster than updating them row by row
+            for object_type, _, sql in schema:
+                if object_type == "index":
+                    target_connection.execute(sql)
+        target_connection.execute("DETACH DATABASE source")
+
+    def _prepare_target_database_file(self, database_name: str, overwrite: bool) -> str:
+        path_to_sqlite_database = self._get_path_to_database(database_name)
+        if os.path.isfile(path_to_sqlite_database):
+            if not overwrite:
+                raise SqliteDatabaseAlreadyExistsException(path_to_sqlite_database)
+            self.logger.debug(f"Deleting old database at {path_to_sqlite_database}")
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.isfile(path_to_sqlite_database + suffix):
+                    os.remove(path_to_sqlite_database + suffix)
+        return path_to_sqlite_database
+
     def _load_or_create_sqlite_file_on_hard_drive(
             self, database_name: str, create: bool, reset: bool
     ) -> Tuple[str, bool]:
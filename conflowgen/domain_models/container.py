@@ -119,6 +119,9 @@ class Container(BaseModel):
     @DataSummariesCache.cache_result
     def get_arrival_time(self) -> datetime.datetime:
 
+        if self.cached_arrival_time is not None:
+            return self.cached_arrival_time
+
         container_arrival_time: datetime.datetime
         if self.delivered_by == ModeOfTransport.truck:
             # noinspection PyTypeChecker
@@ -139,6 +142,9 @@ class Container(BaseModel):
     @DataSummariesCache.cache_result
     def get_departure_time(self) -> datetime.datetime:
 
+        if self.cached_departure_time is not None:
+            return self.cached_departure_time
+
         container_departure_time: datetime.datetime
         if self.picked_up_by_truck is not None:
             # noinspection PyTypeChecker
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Type
+from typing import Dict, Any, Type, Tuple
 
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
 from conflowgen.domain_models.distribution_models.container_dwell_time_distribution import \
     ContainerDwellTimeDistribution
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
 from conflowgen.domain_models.distribution_validators import validate_distribution_with_two_dependent_variables
 from conflowgen.tools.continuous_distribution import ContinuousDistribution
 
@@ -13,18 +14,8 @@ from conflowgen.tools.continuous_distribution import ContinuousDistribution
 class ContainerDwellTimeDistributionRepository:
 
     @staticmethod
-    def _get_distribution_entry(
-            delivered_by: ModeOfTransport,
-            picked_up_by: ModeOfTransport,
-            storage_requirement: StorageRequirement
-    ) -> Type[ContinuousDistribution]:
-        """Loads the distribution for the given transport direction and container type."""
-
-        entry: ContainerDwellTimeDistribution = ContainerDwellTimeDistribution.get(
-            (ContainerDwellTimeDistribution.delivered_by == delivered_by)
-            & (ContainerDwellTimeDistribution.picked_up_by == picked_up_by)
-            & (ContainerDwellTimeDistribution.storage_requirement == storage_requirement)
-        )
+    def _create_distribution(entry: ContainerDwellTimeDistribution) -> ContinuousDistribution:
+        """Creates the distribution for the given transport direction and container type."""
 
         distribution_class: Type[ContinuousDistribution] | None = \
             ContinuousDistribution.distribution_types.get(entry.distribution_name, None)
@@ -33,21 +24,29 @@ class ContainerDwellTimeDistributionRepository:
         return distribution_class.from_database_entry(entry)
 
     @classmethod
+    @DistributionCache.cache_distribution
     def get_distributions(
             cls
     ) -> Dict[ModeOfTransport, Dict[ModeOfTransport, Dict[StorageRequirement, ContinuousDistribution]]]:
-        distributions = {
-            mode_of_transport_i: {
-                mode_of_transport_j: {
-                    storage_requirement: cls._get_distribution_entry(
-                        mode_of_transport_i, mode_of_transport_j, storage_requirement
-                    )
-                    for storage_requirement in StorageRequirement
-                }
-                for mode_of_transport_j in ModeOfTransport
-            }
-            for mode_of_transport_i in ModeOfTransport
+        entries: Dict[Tuple[ModeOfTransport, ModeOfTransport, StorageRequirement], ContainerDwellTimeDistribution] = {
+            (entry.delivered_by, entry.picked_up_by, entry.storage_requirement): entry
+            for entry in ContainerDwellTimeDistribution.select()
         }
+        distributions = {}
+        for mode_of_transport_i in ModeOfTransport:
+            distributions[mode_of_transport_i] = {}
+            for mode_of_transport_j in ModeOfTransport:
+                distributions[mode_of_transport_i][mode_of_transport_j] = {}
+                for storage_requirement in StorageRequirement:
+                    entry = entries.get((mode_of_transport_i, mode_of_transport_j, storage_requirement))
+                    if entry is None:
+                        raise ContainerDwellTimeDistribution.DoesNotExist(
+                            f"No container dwell time distribution for the containers delivered by "
+                            f"{mode_of_transport_i} and picked up by {mode_of_transport_j} with the storage "
+                            f"requirement {storage_requirement}"
+                        )
+                    distributions[mode_of_transport_i][mode_of_transport_j][storage_requirement] = \
+                        cls._create_distribution(entry)
         return distributions
 
     @staticmethod
@@ -60,6 +59,7 @@ class ContainerDwellTimeDistributionRepository:
             distributions, ModeOfTransport, ModeOfTransport, StorageRequirement, values_are_frequencies=False
         )
         ContainerDwellTimeDistribution.delete().execute()
+        DistributionCache.invalidate()
         for delivered_by, picked_up_by_distribution in distributions.items():
             for picked_up_by, storage_requirement_distribution in picked_up_by_distribution.items():
                 for storage_requirement, container_dwell_time_distribution in storage_requirement_distribution.items():
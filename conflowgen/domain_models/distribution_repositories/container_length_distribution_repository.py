@@ -2,6 +2,7 @@ import math
 from typing import Dict
 
 from conflowgen.domain_models.distribution_models.container_length_distribution import ContainerLengthDistribution
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 
 
@@ -36,6 +37,7 @@ class ContainerLengthDistributionRepository:
             raise ContainerLengthProportionsUnequalOneException(sum_of_all_proportions)
 
     @classmethod
+    @DistributionCache.cache_distribution
     def get_distribution(cls) -> Dict[ContainerLength, float]:
         container_length_distribution_entry: ContainerLengthDistribution
         return {
@@ -48,6 +50,7 @@ class ContainerLengthDistributionRepository:
     def set_distribution(cls, container_lengths: Dict[ContainerLength, float]):
         cls._verify_container_lengths(container_lengths)
         ContainerLengthDistribution.delete().execute()
+        DistributionCache.invalidate()
         for container_length, fraction in container_lengths.items():
             ContainerLengthDistribution.create(
                 container_length=container_length,
@@ -1,10 +1,11 @@
 import math
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from conflowgen.domain_models.distribution_models.container_weight_distribution import ContainerWeightDistribution
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
     ContainerLengthMissing
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
 
 
 class MissingContainerWeightDistributionEntryException(Exception):
@@ -42,42 +43,38 @@ class ContainerWeightDistributionRepository:
                         f"key: {key}, value: {proportion}"
                     )
 
-    @staticmethod
-    def _get_fraction_for_container_type(
-            container_length: ContainerLength,
-            container_weight_category: int
-    ) -> float:
-        """Load fraction for container type. Currently, containers are only distinguished according to their lengths.
-        All fractions do not necessarily sum up to 1."""
-
-        entry = ContainerWeightDistribution.get_or_none(
-            (ContainerWeightDistribution.container_length == container_length)
-            & (ContainerWeightDistribution.weight_category == container_weight_category)
-        )
-        if entry is None:
-            raise MissingContainerWeightDistributionEntryException(
-                f"container_length: {container_length}, container_weight_category: {container_weight_category}"
-            )
-        return entry.fraction
+    @classmethod
+    def _get_fractions(cls) -> Tuple[List[int], Dict[ContainerLength, Dict[int, float]]]:
+        """Load the weight categories and the fractions for each container type. Currently, containers are only
+        distinguished according to their lengths. All fractions do not necessarily sum up to 1."""
+
+        fractions_of_stored_entries: Dict[ContainerLength, Dict[int, float]] = {
+            container_length: {} for container_length in ContainerLength
+        }
+        container_weight_categories: Dict[int, None] = {}  # keeps the order of the categories
+        entry: ContainerWeightDistribution
+        for entry in ContainerWeightDistribution.select():
+            fractions_of_stored_entries[entry.container_length][entry.weight_category] = entry.fraction
+            container_weight_categories[entry.weight_category] = None
+
+        fractions = {}
+        for container_length in ContainerLength:
+            fractions[container_length] = {}
+            for container_weight_category in container_weight_categories:
+                if container_weight_category not in fractions_of_stored_entries[container_length]:
+                    raise MissingContainerWeightDistributionEntryException(
+                        f"container_length: {container_length}, container_weight_category: {container_weight_category}"
+                    )
+                fractions[container_length][container_weight_category] = \
+                    fractions_of_stored_entries[container_length][container_weight_category]
+        return list(container_weight_categories), fractions
 
     @classmethod
+    @DistributionCache.cache_distribution
     def get_distribution(cls) -> Dict[ContainerLength, Dict[int, float]]:
         """Loads a distribution for which all fractions are normalized to sum up to 1 for each container type.
         """
-        container_weight_categories = [
-            category_entry.weight_category
-            for category_entry in list(ContainerWeightDistribution.select(
-                ContainerWeightDistribution.weight_category
-            ).distinct())]
-
-        fractions = {
-            container_length: {
-                container_weight_category: cls._get_fraction_for_container_type(
-                    container_length, container_weight_category)
-                for container_weight_category in container_weight_categories
-            }
-            for container_length in ContainerLength
-        }
+        container_weight_categories, fractions = cls._get_fractions()
         distributions = {}
         for container_length in ContainerLength:
             sum_over_container_length = sum(fractions[container_length].values())
@@ -98,6 +95,7 @@ class ContainerWeightDistributionRepository:
     def set_distribution(self, distributions: Dict[ContainerLength, Dict[int, float]]) -> None:
         self._verify_container_weights(distributions)
         ContainerWeightDistribution.delete().execute()
+        DistributionCache.invalidate()
         for container_length, weight_distribution in distributions.items():
             for container_weight_category, fraction in weight_distribution.items():
                 ContainerWeightDistribution.create(
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import typing
+from functools import wraps
+
+from conflowgen.domain_models.base_model import database_proxy
+
+
+def _copy_nested_dictionaries(value: typing.Any) -> typing.Any:
+    if isinstance(value, dict):
+        return {key: _copy_nested_dictionaries(nested_value) for key, nested_value in value.items()}
+    return value
+
+
+class DistributionCache:
+    """
+    Keeps the distributions that the repositories have loaded from the database in memory.
+    Each distribution is loaded with one query at its first use and is then kept until it is invalidated.
+
+    The repositories invalidate the cache whenever they write a distribution to the database.
+    Each invalidation increments :attr:`.version`, so that derived results can be checked for being outdated.
+    When another database is chosen, all loaded distributions are dropped.
+    Whoever changes the distribution tables without a repository must call :meth:`.invalidate`.
+    """
+
+    #: Incremented each time the cached distributions are invalidated
+    version: int = 0
+
+    _database = None
+    _cached_distributions: typing.Dict[str, typing.Any] = {}
+
+    # These counters are never reset so that the hit rate of a period can be determined by taking the differences
+    _number_of_lookups = 0
+    _number_of_misses = 0
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drops all loaded distributions and increments :attr:`.version`.
+        """
+        cls.version += 1
+        cls._cached_distributions.clear()
+
+    @classmethod
+    def get_lookup_statistics(cls) -> typing.Tuple[int, int]:
+        """
+        Returns:
+            The number of lookups and the number of lookups that were not answered from the cache since the start of
+            the process.
+        """
+        return cls._number_of_lookups, cls._number_of_misses
+
+    @classmethod
+    def cache_distribution(cls, func):
+        """
+        Decorator for the class methods of the repositories that load a distribution.
+        As the callers might modify the returned dictionaries, each caller receives its own copy of them.
+        The values, e.g., the container dwell time distributions, are shared.
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if database_proxy.obj is not cls._database:
+                cls._database = database_proxy.obj
+                cls._cached_distributions.clear()
+            key = func.__qualname__ + repr(args[1:]) + repr(kwargs)
+            cls._number_of_lookups += 1
+            if key not in cls._cached_distributions:
+                cls._number_of_misses += 1
+                cls._cached_distributions[key] = func(*args, **kwargs)
+            return _copy_nested_dictionaries(cls._cached_distributions[key])
+
+        return wrapper
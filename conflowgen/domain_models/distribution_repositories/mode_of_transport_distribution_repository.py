@@ -1,38 +1,41 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 from conflowgen.domain_models.distribution_models.mode_of_transport_distribution import ModeOfTransportDistribution
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
 from conflowgen.domain_models.distribution_validators import validate_distribution_with_one_dependent_variable
 
 
 class ModeOfTransportDistributionRepository:
 
     @staticmethod
-    def _get_fraction(
-            delivered_by: ModeOfTransport,
-            picked_up_by: ModeOfTransport
-    ) -> float:
-        """Loads the fraction of goods that are transported between the two modes of transport.
+    def _get_fractions() -> Dict[ModeOfTransport, Dict[ModeOfTransport, float]]:
+        """Loads the fractions of goods that are transported between each two modes of transport.
         These do not necessarily sum up to 1."""
 
-        entry = ModeOfTransportDistribution.get(
-            (ModeOfTransportDistribution.delivered_by == delivered_by)
-            & (ModeOfTransportDistribution.picked_up_by == picked_up_by)
-        )
-        fraction = entry.fraction
-        return fraction
+        stored_fractions: Dict[Tuple[ModeOfTransport, ModeOfTransport], float] = {
+            (entry.delivered_by, entry.picked_up_by): entry.fraction
+            for entry in ModeOfTransportDistribution.select()
+        }
+        fractions: Dict[ModeOfTransport, Dict[ModeOfTransport, float]] = {}
+        for mode_of_transport_i in ModeOfTransport:
+            fractions[mode_of_transport_i] = {}
+            for mode_of_transport_j in ModeOfTransport:
+                if (mode_of_transport_i, mode_of_transport_j) not in stored_fractions:
+                    raise ModeOfTransportDistribution.DoesNotExist(
+                        f"No fraction for the containers delivered by {mode_of_transport_i} and picked up by "
+                        f"{mode_of_transport_j}"
+                    )
+                fractions[mode_of_transport_i][mode_of_transport_j] = \
+                    stored_fractions[(mode_of_transport_i, mode_of_transport_j)]
+        return fractions
 
     @classmethod
+    @DistributionCache.cache_distribution
     def get_distribution(cls) -> Dict[ModeOfTransport, Dict[ModeOfTransport, float]]:
         """Loads a distribution for which all fractions are normalized to sum up to 1 for each mode of transportation.
         """
-        fractions = {
-            mode_of_transport_i: {
-                mode_of_transport_j: cls._get_fraction(mode_of_transport_i, mode_of_transport_j)
-                for mode_of_transport_j in ModeOfTransport
-            }
-            for mode_of_transport_i in ModeOfTransport
-        }
+        fractions = cls._get_fractions()
         distributions = {}
         for mode_of_transport_i in ModeOfTransport:
             sum_over_mode_of_transport_i = sum(fractions[mode_of_transport_i].values())
@@ -51,6 +54,7 @@ class ModeOfTransportDistributionRepository:
             distributions, ModeOfTransport, ModeOfTransport, values_are_frequencies=True
         )
         ModeOfTransportDistribution.delete().execute()
+        DistributionCache.invalidate()
         for delivered_by, picked_up_by_distribution in distributions.items():
             for picked_up_by, fraction in picked_up_by_distribution.items():
                 ModeOfTransportDistribution.create(
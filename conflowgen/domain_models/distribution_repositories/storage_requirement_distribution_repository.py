@@ -4,6 +4,7 @@ from typing import Dict
 from conflowgen.domain_models.data_types.container_length import ContainerLength
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
 from conflowgen.domain_models.distribution_models.storage_requirement_distribution import StorageRequirementDistribution
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
 
 
 class StorageRequirementMissingException(Exception):
@@ -31,29 +32,20 @@ class StorageRequirementDistributionRepository:
             if not math.isclose(sum_of_probabilities, 1):
                 raise SumOfProbabilitiesUnequalOneException(sum_of_probabilities)
 
-    @staticmethod
-    def _get_fraction(
-            container_length: ContainerLength,
-            storage_requirement: StorageRequirement
-    ) -> float:
-        """Loads the fraction of containers."""
-
-        entry = StorageRequirementDistribution.get(
-            (StorageRequirementDistribution.container_length == container_length)
-            & (StorageRequirementDistribution.storage_requirement == storage_requirement)
-        )
-        fraction = entry.fraction
-        return fraction
-
     @classmethod
+    @DistributionCache.cache_distribution
     def get_distribution(cls) -> Dict[ContainerLength, Dict[StorageRequirement, float]]:
+        fractions: Dict[ContainerLength, Dict[StorageRequirement, float]] = {
+            container_length: {} for container_length in ContainerLength
+        }
+        entry: StorageRequirementDistribution
+        for entry in StorageRequirementDistribution.select():
+            fractions[entry.container_length][entry.storage_requirement] = entry.fraction
         distribution = {
             container_length: {
-                storage_requirement: cls._get_fraction(
-                    container_length=container_length,
-                    storage_requirement=storage_requirement
-                )
+                storage_requirement: fractions[container_length][storage_requirement]
                 for storage_requirement in StorageRequirement
+                if storage_requirement in fractions[container_length]
             }
             for container_length in ContainerLength
         }
@@ -66,6 +58,7 @@ class StorageRequirementDistributionRepository:
     ) -> None:
         self._validate(distributions)
         StorageRequirementDistribution.delete().execute()
+        DistributionCache.invalidate()
         for container_length, storage_requirement_distribution in distributions.items():
             for storage_requirement, fraction in storage_requirement_distribution.items():
                 StorageRequirementDistribution.create(
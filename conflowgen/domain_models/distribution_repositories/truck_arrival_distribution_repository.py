@@ -2,6 +2,7 @@ import math
 from typing import Dict
 
 from conflowgen.domain_models.distribution_models.truck_arrival_distribution import TruckArrivalDistribution
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
 
 
 class TruckArrivalDistributionTableWithDuplicatesException(Exception):
@@ -30,6 +31,7 @@ class TruckArrivalDistributionRepository:
             raise TruckArrivalFractionsUnequalOneException(sum_of_all_fractions)
 
     @classmethod
+    @DistributionCache.cache_distribution
     def get_distribution(cls) -> Dict[int, float]:
         truck_arrival_entry: TruckArrivalDistribution
         return {
@@ -42,6 +44,7 @@ class TruckArrivalDistributionRepository:
     def set_distribution(cls, truck_arrivals: Dict[int, float]):
         cls._verify_truck_arrival_distribution(truck_arrivals)
         TruckArrivalDistribution.delete().execute()
+        DistributionCache.invalidate()
         for hour_in_the_week, fraction in truck_arrivals.items():
             TruckArrivalDistribution.create(
                 fraction=fraction,
@@ -1,5 +1,6 @@
 from conflowgen.domain_models.distribution_models.container_weight_distribution import ContainerWeightDistribution
 from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
 
 DEFAULT_FORTY_AND_FORTY_FIVE_FEET_CONTAINER_WEIGHT_DISTRIBUTION = {
     2: 0,
@@ -58,3 +59,4 @@ def seed() -> None:
                 weight_category=container_weight_category,
                 fraction=fraction
             )
+    DistributionCache.invalidate()
@@ -1,6 +1,12 @@
+from __future__ import annotations
+
 import datetime
+import functools
+import typing
 from typing import List
 
+import numpy as np
+
 from conflowgen.domain_models.large_vehicle_schedule import Schedule
 from conflowgen.domain_models.vehicle import DeepSeaVessel, Feeder, Train, Barge
 from .vehicle_factory import VehicleFactory
@@ -18,27 +24,20 @@ def create_arrivals_within_time_range(
     if range_ends_at <= range_starts_at:
         raise ValueError(f"Time range ill-defined: from {range_starts_at} to {range_ends_at}")
 
-    result = []
-
-    if vehicle_arrives_every_k_days > 1:  # usual case
+    if vehicle_arrives_every_k_days >= 1:  # usual case
         scheduled_interval = datetime.timedelta(days=vehicle_arrives_every_k_days)
         first_arrival_at_kth_day = (vehicle_arrives_at - range_starts_at) % scheduled_interval
         first_arrival_as_day = range_starts_at + first_arrival_at_kth_day
-
-        kth_arrival = 0
-
-        def kth_arrival_date(xth_arrival):
-            return first_arrival_as_day + xth_arrival * scheduled_interval
-
-        while kth_arrival_date(kth_arrival) <= range_ends_at:
-            kth_arrival_as_datetime = datetime.datetime.combine(
-                kth_arrival_date(kth_arrival),
+        if first_arrival_as_day > range_ends_at:
+            return []
+        number_of_arrivals = (range_ends_at - first_arrival_as_day) // scheduled_interval + 1
+        return [
+            datetime.datetime.combine(
+                first_arrival_as_day + kth_arrival * scheduled_interval,
                 vehicle_arrives_at_time
             )
-            result.append(kth_arrival_as_datetime)
-            kth_arrival += 1
-
-        return result
+            for kth_arrival in range(number_of_arrivals)
+        ]
 
     if vehicle_arrives_every_k_days == -1:  # special case
         vehicle_arrival_time = datetime.datetime.combine(
@@ -49,6 +48,131 @@ def create_arrivals_within_time_range(
             return [vehicle_arrival_time]
         return []
 
+    raise ValueError(f"A vehicle cannot arrive every {vehicle_arrives_every_k_days} days")
+
+
+class ScheduledArrivals(typing.NamedTuple):
+    """
+    The arrivals of several schedules within the same time range, see :func:`.create_arrivals_of_schedules`.
+    """
+
+    #: The ids of the schedules in ascending order
+    schedule_ids: np.ndarray
+
+    #: The number of arrivals of each schedule in the order of :attr:`.schedule_ids`
+    number_of_arrivals: np.ndarray
+
+    #: The position of the first arrival of each schedule in :attr:`.arrivals`, in the order of :attr:`.schedule_ids`
+    first_index_of_schedule: np.ndarray
+
+    #: The arrivals as ``datetime64`` values, grouped by schedule in the order of :attr:`.schedule_ids`
+    arrivals: np.ndarray
+
+    def _get_index(self, schedule_id: int) -> int:
+        index = int(np.searchsorted(self.schedule_ids, schedule_id))
+        if index == len(self.schedule_ids) or self.schedule_ids[index] != schedule_id:
+            raise KeyError(f"The arrivals of the schedule with the id {schedule_id} have not been created")
+        return index
+
+    def get_number_of_arrivals(self, schedule_id: int) -> int:
+        return int(self.number_of_arrivals[self._get_index(schedule_id)])
+
+    def get_arrivals(self, schedule_id: int) -> List[datetime.datetime]:
+        index = self._get_index(schedule_id)
+        first_arrival = self.first_index_of_schedule[index]
+        arrivals_of_schedule = self.arrivals[first_arrival:first_arrival + self.number_of_arrivals[index]]
+        return arrivals_of_schedule.astype(datetime.datetime).tolist()
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_arrivals_of_schedules(
+        schedule_rows: typing.Tuple[typing.Tuple[int, datetime.date, int, typing.Optional[datetime.time]], ...],
+        range_starts_at: datetime.date,
+        range_ends_at: datetime.date
+) -> ScheduledArrivals:
+    if range_ends_at <= range_starts_at:
+        raise ValueError(f"Time range ill-defined: from {range_starts_at} to {range_ends_at}")
+    schedule_rows = tuple(sorted(schedule_rows, key=lambda schedule_row: schedule_row[0]))
+    for schedule_id, _, vehicle_arrives_every_k_days, _ in schedule_rows:
+        if vehicle_arrives_every_k_days < 1 and vehicle_arrives_every_k_days != -1:
+            raise ValueError(f"A vehicle cannot arrive every {vehicle_arrives_every_k_days} days, see the schedule "
+                             f"with the id {schedule_id}")
+
+    schedule_ids = np.array([schedule_row[0] for schedule_row in schedule_rows], dtype=np.int64)
+    days_until_fixed_arrival = np.array(
+        [(schedule_row[1] - range_starts_at).days for schedule_row in schedule_rows], dtype=np.int64
+    )
+    every_k_days = np.array([schedule_row[2] for schedule_row in schedule_rows], dtype=np.int64)
+    seconds_after_midnight = np.array([
+        0 if schedule_row[3] is None
+        else schedule_row[3].hour * 3600 + schedule_row[3].minute * 60 + schedule_row[3].second
+        for schedule_row in schedule_rows
+    ], dtype=np.int64)
+    length_of_range_in_days = (range_ends_at - range_starts_at).days
+
+    # Vehicles that arrive only once are treated like vehicles with an interval that is longer than the time range
+    arrives_regularly = every_k_days >= 1
+    interval_in_days = np.where(arrives_regularly, every_k_days, length_of_range_in_days + 1)
+    first_arrival_in_days = np.where(
+        arrives_regularly, np.mod(days_until_fixed_arrival, interval_in_days), days_until_fixed_arrival
+    )
+    number_of_arrivals = np.where(
+        (first_arrival_in_days >= 0) & (first_arrival_in_days <= length_of_range_in_days),
+        (length_of_range_in_days - first_arrival_in_days) // interval_in_days + 1,
+        0
+    )
+
+    first_index_of_schedule = np.cumsum(number_of_arrivals) - number_of_arrivals
+    kth_arrival = np.arange(number_of_arrivals.sum()) - np.repeat(first_index_of_schedule, number_of_arrivals)
+    arrival_in_days = np.repeat(first_arrival_in_days, number_of_arrivals) \
+        + kth_arrival * np.repeat(interval_in_days, number_of_arrivals)
+    arrivals = np.datetime64(range_starts_at, "s") \
+        + arrival_in_days.astype("timedelta64[D]") \
+        + np.repeat(seconds_after_midnight, number_of_arrivals).astype("timedelta64[s]")
+
+    # The result is shared by all callers with the same arguments
+    for array in (schedule_ids, number_of_arrivals, first_index_of_schedule, arrivals):
+        array.flags.writeable = False
+    return ScheduledArrivals(
+        schedule_ids=schedule_ids,
+        number_of_arrivals=number_of_arrivals,
+        first_index_of_schedule=first_index_of_schedule,
+        arrivals=arrivals
+    )
+
+
+def create_arrivals_of_schedules(
+        range_starts_at: datetime.date,
+        range_ends_at: datetime.date,
+        schedules: typing.Optional[typing.Iterable[Schedule]] = None
+) -> ScheduledArrivals:
+    """
+    Creates the arrivals of all schedules at once like :func:`.create_arrivals_within_time_range` does for a single
+    schedule.
+    The result is cached for each set of schedules and time range.
+
+    Args:
+        range_starts_at: The earliest day of the time range
+        range_ends_at: The latest day of the time range
+        schedules: The schedules to create the arrivals for. Defaults to all schedules in the database.
+
+    Returns:
+        The number of arrivals and the arrivals of each schedule
+    """
+    if schedules is None:
+        schedules = Schedule.select(
+            Schedule.id, Schedule.vehicle_arrives_at, Schedule.vehicle_arrives_every_k_days,
+            Schedule.vehicle_arrives_at_time
+        )
+    schedule_rows = tuple(
+        (
+            schedule.id, schedule.vehicle_arrives_at, schedule.vehicle_arrives_every_k_days,
+            schedule.vehicle_arrives_at_time
+        )
+        for schedule in schedules
+    )
+    return _expand_arrivals_of_schedules(schedule_rows, range_starts_at, range_ends_at)
+
 
 class FleetFactory:
 
@@ -1,15 +1,34 @@
+from __future__ import annotations
+
+import collections
+import contextlib
 import datetime
 import logging
+import random
+import time
+import typing
+
+from peewee import fn
 
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
 from conflowgen.application.reports.container_flow_statistics_report import ContainerFlowStatisticsReport
+from conflowgen.application.repositories.container_flow_generation_checkpoint_repository import \
+    ContainerFlowGenerationCheckpointRepository
 from conflowgen.application.repositories.container_flow_generation_properties_repository import \
     ContainerFlowGenerationPropertiesRepository
 from conflowgen.flow_generator.assign_destination_to_container_service import \
     AssignDestinationToContainerService
+from conflowgen.flow_generator.generation_statistics import GenerationStats, PhaseInstrumentation, PhaseStats
 from conflowgen.flow_generator.large_scheduled_vehicle_creation_service import \
     LargeScheduledVehicleCreationService
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.base_model import database_proxy
 from conflowgen.domain_models.container import Container
-from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.repositories.large_scheduled_vehicle_repository import LargeScheduledVehicleRepository
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck, DeepSeaVessel, Feeder, Barge, Train
 from conflowgen.flow_generator.allocate_space_for_containers_delivered_by_truck_service import \
     AllocateSpaceForContainersDeliveredByTruckService
 from conflowgen.flow_generator.large_scheduled_vehicle_for_onward_transportation_manager \
@@ -19,6 +38,15 @@ from conflowgen.flow_generator.truck_for_export_containers_manager import \
 from conflowgen.flow_generator.truck_for_import_containers_manager import \
     TruckForImportContainersManager
 from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.tools.profiler import Profiler
+
+
+class MissingCheckpointException(Exception):
+    pass
+
+
+class VacuumWithinTransactionException(Exception):
+    pass
 
 
 class ContainerFlowGenerationService:
@@ -33,6 +61,51 @@ class ContainerFlowGenerationService:
         self.allocate_space_for_containers_delivered_by_truck_service = \
             AllocateSpaceForContainersDeliveredByTruckService()
         self.assign_destination_to_container_service = AssignDestinationToContainerService()
+        self.checkpoint_repository = ContainerFlowGenerationCheckpointRepository()
+
+        self.phase_runners: typing.Dict[ContainerFlowGenerationPhase, typing.Callable[[], None]] = {
+            ContainerFlowGenerationPhase.fleet_creation:
+                self.large_scheduled_vehicle_creation_service.create,
+            ContainerFlowGenerationPhase.onward_transportation_assignment:
+                self.large_scheduled_vehicle_for_onward_transportation_manager.choose_departing_vehicle_for_containers,
+            ContainerFlowGenerationPhase.trucks_for_import_containers:
+                self.truck_for_import_containers_manager.generate_trucks_for_picking_up,
+            ContainerFlowGenerationPhase.containers_delivered_by_truck:
+                self.allocate_space_for_containers_delivered_by_truck_service.allocate,
+            ContainerFlowGenerationPhase.trucks_for_export_containers:
+                self.truck_for_export_containers_manager.generate_trucks_for_delivering,
+            ContainerFlowGenerationPhase.destination_assignment:
+                self.assign_destination_to_container_service.assign,
+        }
+        self.phase_undoers: typing.Dict[ContainerFlowGenerationPhase, typing.Callable[[], None]] = {
+            ContainerFlowGenerationPhase.fleet_creation: self.clear_previous_container_flow,
+            ContainerFlowGenerationPhase.onward_transportation_assignment: self._undo_onward_transportation_assignment,
+            ContainerFlowGenerationPhase.trucks_for_import_containers: self._undo_trucks_for_import_containers,
+            ContainerFlowGenerationPhase.containers_delivered_by_truck: self._undo_containers_delivered_by_truck,
+            ContainerFlowGenerationPhase.trucks_for_export_containers: self._undo_trucks_for_export_containers,
+            ContainerFlowGenerationPhase.destination_assignment: self._undo_destination_assignment,
+        }
+        self.phase_descriptions: typing.Dict[ContainerFlowGenerationPhase, str] = {
+            ContainerFlowGenerationPhase.fleet_creation:
+                "Create fleet including their delivered containers for given time range for each schedule...",
+            ContainerFlowGenerationPhase.onward_transportation_assignment:
+                "Assign containers that are picked up from the terminal by a vehicle adhering a schedule to their "
+                "specific vehicle instance...",
+            ContainerFlowGenerationPhase.trucks_for_import_containers:
+                "Generate trucks that pick up containers...",
+            ContainerFlowGenerationPhase.containers_delivered_by_truck:
+                "Generate containers that are delivered by trucks...",
+            ContainerFlowGenerationPhase.trucks_for_export_containers:
+                "Generate trucks that deliver containers...",
+            ContainerFlowGenerationPhase.destination_assignment:
+                "Assign containers to next destinations...",
+        }
+        self.phases_followed_by_statistics_report = {
+            ContainerFlowGenerationPhase.fleet_creation,
+            ContainerFlowGenerationPhase.onward_transportation_assignment,
+            ContainerFlowGenerationPhase.containers_delivered_by_truck,
+            ContainerFlowGenerationPhase.destination_assignment,
+        }
 
     def _update_generation_properties_and_distributions(self):
         self.container_flow_generation_properties_manager = ContainerFlowGenerationPropertiesRepository()
@@ -61,63 +134,290 @@ class ContainerFlowGenerationService:
         self.assign_destination_to_container_service.reload_distributions()
 
     @staticmethod
-    def clear_previous_container_flow():
-        Container.delete().execute()
+    def clear_previous_container_flow(vacuum: bool = False):
+        """
+        Removes all generated vehicles, containers, and truck arrival information at once.
+
+        Args:
+            vacuum: Whether to rebuild the database file afterwards so that the freed disk space is returned.
+                SQLite cannot do this within a transaction.
+        """
+        database = database_proxy
+        if vacuum and database.in_transaction():
+            raise VacuumWithinTransactionException(
+                "The database cannot be vacuumed within a transaction, thus nothing has been removed."
+            )
+        switch_off_foreign_keys = not database.in_transaction()
+        if switch_off_foreign_keys:
+            # Without foreign key checks, SQLite drops all rows of a table at once instead of deleting them one by one.
+            # This pragma has no effect inside a transaction, so there the checks are at least deferred until commit.
+            foreign_keys = database.pragma("foreign_keys")
+            database.pragma("foreign_keys", 0)
+        try:
+            with database.atomic():
+                database.pragma("defer_foreign_keys", 1)
+                for model in (
+                    Container,
+                    DeepSeaVessel,
+                    Feeder,
+                    Barge,
+                    Train,
+                    LargeScheduledVehicle,
+                    Truck,
+                    TruckArrivalInformationForPickup,
+                    TruckArrivalInformationForDelivery,
+                ):
+                    model.delete().execute()
+        finally:
+            if switch_off_foreign_keys:
+                database.pragma("foreign_keys", foreign_keys)
+        if vacuum:
+            database.execute_sql("VACUUM")
+
+    @staticmethod
+    def _undo_onward_transportation_assignment():
+        Container.update(
+            picked_up_by=Container.picked_up_by_initial,
+            picked_up_by_large_scheduled_vehicle=None,
+            emergency_pickup=False,
+            cached_departure_time=None
+        ).execute()
 
-        # Due to cascading foreign keys, Train, Feeder etc. are also deleted
-        LargeScheduledVehicle.delete().execute()
+        # The fleet creation sets the same flag for each vehicle whose capacity for the inbound journey is exhausted,
+        # thus it is restored for these vehicles.
+        LargeScheduledVehicle.update(capacity_exhausted_while_determining_onward_transportation=False).execute()
+        used_capacity_for_inbound_journey: typing.Dict[int, float] = collections.defaultdict(float)
+        for large_scheduled_vehicle_id, container_length, number_of_containers in Container.select(
+                Container.delivered_by_large_scheduled_vehicle,
+                Container.length,
+                fn.COUNT(Container.id)
+        ).where(
+            Container.delivered_by_large_scheduled_vehicle.is_null(False)
+        ).group_by(
+            Container.delivered_by_large_scheduled_vehicle,
+            Container.length
+        ).tuples():
+            used_capacity_for_inbound_journey[large_scheduled_vehicle_id] += \
+                number_of_containers * ContainerLength.get_factor(container_length)
+        vehicles_with_exhausted_capacity = [
+            large_scheduled_vehicle_id
+            for large_scheduled_vehicle_id, moved_capacity in LargeScheduledVehicle.select(
+                LargeScheduledVehicle.id, LargeScheduledVehicle.moved_capacity
+            ).tuples()
+            if large_scheduled_vehicle_id in used_capacity_for_inbound_journey
+            and moved_capacity - used_capacity_for_inbound_journey[large_scheduled_vehicle_id]
+            < LargeScheduledVehicleRepository.ignored_capacity
+        ]
+        if vehicles_with_exhausted_capacity:
+            LargeScheduledVehicle.update(capacity_exhausted_while_determining_onward_transportation=True).where(
+                LargeScheduledVehicle.id.in_(vehicles_with_exhausted_capacity)
+            ).execute()
 
-        Truck.delete().execute()
+    @staticmethod
+    def _undo_trucks_for_import_containers():
+        Container.update(
+            picked_up_by_truck=None,
+            cached_departure_time=None
+        ).where(
+            Container.picked_up_by_truck.is_null(False)
+        ).execute()
+        Truck.delete().where(Truck.picks_up_container).execute()
+        TruckArrivalInformationForPickup.delete().execute()
+
+    @staticmethod
+    def _undo_containers_delivered_by_truck():
+        Container.delete().where(Container.delivered_by == ModeOfTransport.truck).execute()
+        LargeScheduledVehicle.update(capacity_exhausted_while_allocating_space_for_export_containers=False).execute()
+
+    @staticmethod
+    def _undo_trucks_for_export_containers():
+        Container.update(
+            delivered_by_truck=None,
+            cached_arrival_time=None
+        ).where(
+            Container.delivered_by_truck.is_null(False)
+        ).execute()
+        Truck.delete().where(Truck.delivers_container).execute()
+        TruckArrivalInformationForDelivery.delete().execute()
+
+    @staticmethod
+    def _undo_destination_assignment():
+        Container.update(destination=None).where(Container.destination.is_null(False)).execute()
 
     @staticmethod
     def container_flow_data_exists() -> bool:
         return len(Container.select().limit(1)) == 1
 
-    def generate(self):
+    def _get_random_number_generators(self) -> typing.Dict[str, random.Random]:
+        return {
+            "large_scheduled_vehicle_creation_service":
+                self.large_scheduled_vehicle_creation_service.container_factory.seeded_random,
+            "large_scheduled_vehicle_for_onward_transportation_manager":
+                self.large_scheduled_vehicle_for_onward_transportation_manager.seeded_random,
+            "allocate_space_for_containers_delivered_by_truck_service":
+                self.allocate_space_for_containers_delivered_by_truck_service.container_factory.seeded_random,
+        }
+
+    def _get_random_states(self) -> typing.Dict[str, typing.Any]:
+        random_states = {
+            "global": random.getstate()
+        }
+        for name, random_number_generator in self._get_random_number_generators().items():
+            random_states[name] = random_number_generator.getstate()
+        return random_states
+
+    def _restore_random_states(self, random_states: typing.Dict[str, typing.Any]) -> None:
+        def to_state(serialized_state: typing.List[typing.Any]) -> typing.Tuple[typing.Any, ...]:
+            version, internal_state, gauss_next = serialized_state
+            return version, tuple(internal_state), gauss_next
+
+        random.setstate(to_state(random_states["global"]))
+        for name, random_number_generator in self._get_random_number_generators().items():
+            random_number_generator.setstate(to_state(random_states[name]))
+
+    def _determine_first_phase(
+            self,
+            resume: bool,
+            from_phase: typing.Optional[ContainerFlowGenerationPhase]
+    ) -> typing.Optional[ContainerFlowGenerationPhase]:
+        phases = list(ContainerFlowGenerationPhase)
+        if resume and from_phase is not None:
+            raise ValueError("Either resume the generation or re-run it from a given phase, but not both.")
+        if resume:
+            last_completed_phase = self.checkpoint_repository.get_last_completed_phase()
+            if last_completed_phase is None:
+                return phases[0]
+            if last_completed_phase == phases[-1]:
+                return None
+            return phases[phases.index(last_completed_phase) + 1]
+        if from_phase is not None:
+            if from_phase != phases[0]:
+                preceding_phase = phases[phases.index(from_phase) - 1]
+                last_completed_phase = self.checkpoint_repository.get_last_completed_phase()
+                if last_completed_phase is None or phases.index(last_completed_phase) < phases.index(preceding_phase):
+                    raise MissingCheckpointException(
+                        f"The phase '{preceding_phase}' has not been completed yet, thus the generation cannot be "
+                        f"re-run from the phase '{from_phase}'."
+                    )
+            return from_phase
+        return phases[0]
+
+    def run_phase(
+            self,
+            phase: ContainerFlowGenerationPhase,
+            profile: bool = False,
+            profile_directory: typing.Optional[str] = None
+    ) -> PhaseStats:
+        """
+        Runs a single phase within one transaction and stores a checkpoint afterwards.
+        All phases it builds upon must have been completed before.
+        If the phase is profiled, the files of the :class:`.Profiler` are named after the phase.
+
+        Returns:
+            The resources the phase has used
+        """
+        self.logger.info(self.phase_descriptions[phase])
+        profiler = Profiler(f"generation_{phase.value}", output_directory=profile_directory) if profile \
+            else contextlib.nullcontext()
+        with PhaseInstrumentation(phase) as instrumentation:
+            with profiler:
+                with database_proxy.atomic():
+                    self.phase_runners[phase]()
+                    self.checkpoint_repository.save_checkpoint(phase, self._get_random_states())
+
+                if phase in self.phases_followed_by_statistics_report:
+                    self.logger.info("Loading status of vehicles adhering to a schedule:")
+                    report = ContainerFlowStatisticsReport(transportation_buffer=self.transportation_buffer)
+                    report.generate()
+                    self.logger.info(report.get_text_representation())
+
+        self.logger.debug(f"Resources used by the phase '{phase.value}': {instrumentation.stats}")
+        return instrumentation.stats
+
+    def regenerate_truck_arrivals(self) -> None:
+        """
+        Re-creates only the trucks and their arrival information for the existing containers, e.g., after the truck
+        arrival distribution has been changed.
+        The vehicles adhering to a schedule and the containers remain unchanged.
+        """
+        last_completed_phase = self.checkpoint_repository.get_last_completed_phase()
+        phases = list(ContainerFlowGenerationPhase)
+        if last_completed_phase is None or phases.index(last_completed_phase) < phases.index(
+                ContainerFlowGenerationPhase.containers_delivered_by_truck):
+            raise MissingCheckpointException(
+                f"The phase '{ContainerFlowGenerationPhase.containers_delivered_by_truck}' has not been completed yet, "
+                f"thus the trucks cannot be regenerated."
+            )
+
         self.logger.info("Resetting preview and analysis cache...")
         DataSummariesCache.reset_cache()
-        self.logger.info("Remove previous data...")
-        self.clear_previous_container_flow()
-        self.logger.info("Reloading properties and distributions...")
-        self._update_generation_properties_and_distributions()
 
-        self.logger.info("Create fleet including their delivered containers for given time range for each schedule...")
-        self.large_scheduled_vehicle_creation_service.create()
+        self.logger.info("Remove previous trucks...")
+        with database_proxy.atomic():
+            self._undo_trucks_for_export_containers()
+            self._undo_trucks_for_import_containers()
 
-        self.logger.info("Loading status of vehicles adhering to a schedule:")
-        report = ContainerFlowStatisticsReport(transportation_buffer=self.transportation_buffer)
-        report.generate()
-        self.logger.info(report.get_text_representation())
+        self.logger.info("Reloading truck arrival distribution...")
+        self.truck_for_import_containers_manager.reload_distributions()
+        self.truck_for_export_containers_manager.reload_distributions()
+
+        self.run_phase(ContainerFlowGenerationPhase.trucks_for_import_containers)
+        self.run_phase(ContainerFlowGenerationPhase.trucks_for_export_containers)
+        self.logger.info("Truck regeneration finished")
 
-        self.logger.info("Assign containers that are picked up from the terminal by a vehicle adhering a schedule to "
-                         "their specific vehicle instance...")
-        self.large_scheduled_vehicle_for_onward_transportation_manager.choose_departing_vehicle_for_containers()
+    def generate(
+            self,
+            resume: bool = False,
+            from_phase: typing.Optional[ContainerFlowGenerationPhase] = None,
+            on_phase_completed: typing.Optional[typing.Callable[[PhaseStats], None]] = None,
+            profile: bool = False,
+            profile_directory: typing.Optional[str] = None
+    ) -> GenerationStats:
+        wall_time = time.perf_counter()
+        cpu_time = time.process_time()
+        phase_stats: typing.Dict[ContainerFlowGenerationPhase, PhaseStats] = {}
 
-        self.logger.info("Loading status of vehicles adhering to a schedule:")
-        report = ContainerFlowStatisticsReport(transportation_buffer=self.transportation_buffer)
-        report.generate()
-        self.logger.info(report.get_text_representation())
+        phases = list(ContainerFlowGenerationPhase)
+        first_phase = self._determine_first_phase(resume, from_phase)
+        if first_phase is None:
+            self.logger.info("All phases of the container flow generation have already been completed.")
+            return GenerationStats(
+                phases=phase_stats,
+                wall_time=time.perf_counter() - wall_time,
+                cpu_time=time.process_time() - cpu_time
+            )
 
-        self.logger.info("Generate trucks that pick up containers...")
-        self.truck_for_import_containers_manager.generate_trucks_for_picking_up()
+        self.logger.info("Resetting preview and analysis cache...")
+        DataSummariesCache.reset_cache()
 
-        self.logger.info("Generate containers that are delivered by trucks...")
-        self.allocate_space_for_containers_delivered_by_truck_service.allocate()
+        remaining_phases = phases[phases.index(first_phase):]
+        self.logger.info("Remove previous data...")
+        if first_phase == phases[0]:
+            # If the checkpoints were kept while the data is already gone, resuming would skip the removed phases.
+            self.checkpoint_repository.delete_checkpoints(remaining_phases)
+            self.clear_previous_container_flow()
+        else:
+            with database_proxy.atomic():
+                for phase in reversed(remaining_phases):
+                    self.phase_undoers[phase]()
+                self.checkpoint_repository.delete_checkpoints(remaining_phases)
 
-        self.logger.info("Loading status of vehicles adhering to a schedule:")
-        report = ContainerFlowStatisticsReport(transportation_buffer=self.transportation_buffer)
-        report.generate()
-        self.logger.info(report.get_text_representation())
+        self.logger.info("Reloading properties and distributions...")
+        self._update_generation_properties_and_distributions()
 
-        self.logger.info("Generate trucks that deliver containers...")
-        self.truck_for_export_containers_manager.generate_trucks_for_delivering()
+        if first_phase != phases[0]:
+            preceding_phase = phases[phases.index(first_phase) - 1]
+            self.logger.info(f"Continue the container flow generation after the phase '{preceding_phase}'...")
+            self._restore_random_states(self.checkpoint_repository.get_random_states(preceding_phase))
 
-        self.logger.info("Assign containers to next destinations...")
-        self.assign_destination_to_container_service.assign()
+        for phase in remaining_phases:
+            phase_stats[phase] = self.run_phase(phase, profile=profile, profile_directory=profile_directory)
+            if on_phase_completed is not None:
+                on_phase_completed(phase_stats[phase])
 
         self.logger.info("Container flow generation finished")
-
-        self.logger.info("Final capacity status of vehicles adhering to a schedule:")
-        report = ContainerFlowStatisticsReport(transportation_buffer=self.transportation_buffer)
-        report.generate()
-        self.logger.info(report.get_text_representation())
+        return GenerationStats(
+            phases=phase_stats,
+            wall_time=time.perf_counter() - wall_time,
+            cpu_time=time.process_time() - cpu_time
+        )
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import sys
+import time
+import typing
+
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.domain_models.base_model import database_proxy
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
+
+
+class PhaseStats(typing.NamedTuple):
+    """
+    This tuple keeps track of the resources one phase of the container flow generation has used.
+    """
+
+    #: The phase the numbers belong to
+    phase: ContainerFlowGenerationPhase
+
+    #: The elapsed time in seconds
+    wall_time: float
+
+    #: The processor time of the Python process in seconds, it excludes the time spent waiting, e.g., for the disk
+    cpu_time: float
+
+    #: The number of SQL statements issued through peewee.
+    #: The statements to begin and end transactions are not included.
+    sql_statements: int
+
+    #: The number of rows inserted, updated, or deleted
+    changed_rows: int
+
+    #: By how many bytes the phase has raised the peak resident set size of the process.
+    #: It is zero if the phase has not needed more memory than any phase or other code before.
+    #: It is :py:obj:`None` on platforms that do not report the peak resident set size, e.g., Windows.
+    peak_rss_increase: typing.Optional[int]
+
+    #: The number of requests to the caches of the data summaries and of the distributions
+    cache_lookups: int
+
+    #: The number of requests to the caches of the data summaries and of the distributions that could be answered from
+    #: the cache
+    cache_hits: int
+
+    @property
+    def cache_hit_rate(self) -> typing.Optional[float]:
+        """
+        The share of the requests to the caches that could be answered from the cache or
+        :py:obj:`None` if no request has been made.
+        """
+        if self.cache_lookups == 0:
+            return None
+        return self.cache_hits / self.cache_lookups
+
+
+class GenerationStats(typing.NamedTuple):
+    """
+    This tuple keeps track of the resources the container flow generation has used.
+    """
+
+    #: The statistics of each phase that has been run, in the order of execution
+    phases: typing.Dict[ContainerFlowGenerationPhase, PhaseStats]
+
+    #: The elapsed time in seconds for the whole generation, including removing the previous data and loading the
+    #: input distributions
+    wall_time: float
+
+    #: The processor time of the Python process in seconds for the whole generation
+    cpu_time: float
+
+
+def _get_peak_rss() -> typing.Optional[int]:
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:  # e.g., on Windows
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak_rss  # reported in bytes
+    return peak_rss * 1024  # reported in kilobytes
+
+
+def _get_cache_lookup_statistics() -> typing.Tuple[int, int]:
+    data_summaries_lookups, data_summaries_misses = DataSummariesCache.get_lookup_statistics()
+    distribution_lookups, distribution_misses = DistributionCache.get_lookup_statistics()
+    return data_summaries_lookups + distribution_lookups, data_summaries_misses + distribution_misses
+
+
+class PhaseInstrumentation:
+    """
+    Measures the resources used within the context.
+    The SQL statements are counted like the :class:`.SqlQueryTracer` does, i.e., by wrapping ``execute_sql`` of the
+    current database.
+    Thus, any trace callback that has been set on the SQLite connection is left untouched.
+    """
+
+    def __init__(self, phase: ContainerFlowGenerationPhase):
+        self.phase = phase
+        self.stats: typing.Optional[PhaseStats] = None
+        self._sql_statements = 0
+        self._database = None
+        self._previous_execute_sql: typing.Optional[typing.Callable] = None
+        self._connection = None
+        self._total_changes = 0
+        self._cache_lookups = 0
+        self._cache_misses = 0
+        self._peak_rss: typing.Optional[int] = None
+        self._cpu_time = 0.0
+        self._wall_time = 0.0
+
+    def _start_counting_sql_statements(self) -> None:
+        self._database = database_proxy.obj
+        # A tracer might already shadow the method for this database instance
+        self._previous_execute_sql = self._database.__dict__.get("execute_sql")
+        execute_sql = self._database.execute_sql
+
+        def counted_execute_sql(*args, **kwargs):
+            self._sql_statements += 1
+            return execute_sql(*args, **kwargs)
+
+        self._database.execute_sql = counted_execute_sql
+
+    def _stop_counting_sql_statements(self) -> None:
+        if self._previous_execute_sql is None:
+            del self._database.execute_sql
+        else:
+            self._database.execute_sql = self._previous_execute_sql
+
+    def __enter__(self) -> PhaseInstrumentation:
+        self._connection = database_proxy.connection()
+        self._total_changes = self._connection.total_changes
+        self._cache_lookups, self._cache_misses = _get_cache_lookup_statistics()
+        self._peak_rss = _get_peak_rss()
+        self._start_counting_sql_statements()
+        self._cpu_time = time.process_time()
+        self._wall_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        wall_time = time.perf_counter() - self._wall_time
+        cpu_time = time.process_time() - self._cpu_time
+        self._stop_counting_sql_statements()
+        cache_lookups, cache_misses = _get_cache_lookup_statistics()
+        cache_lookups -= self._cache_lookups
+        cache_misses -= self._cache_misses
+        peak_rss = _get_peak_rss()
+        peak_rss_increase = None if peak_rss is None else peak_rss - self._peak_rss
+        self.stats = PhaseStats(
+            phase=self.phase,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            sql_statements=self._sql_statements,
+            changed_rows=self._connection.total_changes - self._total_changes,
+            peak_rss_increase=peak_rss_increase,
+            cache_lookups=cache_lookups,
+            cache_hits=cache_lookups - cache_misses
+        )
@@ -1,22 +1,33 @@
-from typing import Iterable, Type, Callable, Optional, Union
+import importlib
+from typing import Any, Callable, Dict, Optional, Union
 
-from .inbound_and_outbound_vehicle_capacity_preview_report import InboundAndOutboundVehicleCapacityPreviewReport
-from .container_flow_by_vehicle_type_preview_report import ContainerFlowByVehicleTypePreviewReport
-from .modal_split_preview_report import ModalSplitPreviewReport
-from .truck_gate_throughput_preview_report import TruckGateThroughputPreviewReport
-from .vehicle_capacity_exceeded_preview_report import VehicleCapacityUtilizationOnOutboundJourneyPreviewReport
-from ..reporting import AbstractReport
 from ..reporting.auto_reporter import AutoReporter
 from ..reporting.output_style import DisplayAsMarkupLanguage
 
+#: The reports of the previews in the order in which they are presented, each with the module that defines it.
+#: They are only imported on first access because the reports depend on the plotting libraries.
+_report_modules: Dict[str, str] = {
+    "InboundAndOutboundVehicleCapacityPreviewReport": ".inbound_and_outbound_vehicle_capacity_preview_report",
+    "VehicleCapacityUtilizationOnOutboundJourneyPreviewReport": ".vehicle_capacity_exceeded_preview_report",
+    "ContainerFlowByVehicleTypePreviewReport": ".container_flow_by_vehicle_type_preview_report",
+    "ModalSplitPreviewReport": ".modal_split_preview_report",
+    "TruckGateThroughputPreviewReport": ".truck_gate_throughput_preview_report"
+}
 
-reports: Iterable[Type[AbstractReport]] = [
-    InboundAndOutboundVehicleCapacityPreviewReport,
-    VehicleCapacityUtilizationOnOutboundJourneyPreviewReport,
-    ContainerFlowByVehicleTypePreviewReport,
-    ModalSplitPreviewReport,
-    TruckGateThroughputPreviewReport
-]
+
+def __getattr__(name: str) -> Any:
+    if name == "reports":
+        value = [__getattr__(report_name) for report_name in _report_modules]
+    elif name in _report_modules:
+        value = getattr(importlib.import_module(_report_modules[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_report_modules) + ["reports"])
 
 
 def run_all_previews(
@@ -51,6 +62,9 @@ def run_all_previews(
         display_as_ipython_svg: Whether the graphs should be plotted with the IPython functionality. This is suitable,
             e.g., inside Jupyter Notebooks where a conversion to a raster image is not desirable.
     """
+    # The lazy lookup of this module imports the reports, importing them from this module itself would be circular
+    reports = __getattr__("reports")
+
     auto_reporter = AutoReporter(
         as_text=as_text,
         as_graph=as_graph,
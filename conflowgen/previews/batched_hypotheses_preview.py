@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import datetime
+import typing
+
+import numpy as np
+
+from conflowgen.api.truck_arrival_distribution_manager import TruckArrivalDistributionManager
+from conflowgen.application.services.inbound_and_outbound_vehicle_capacity_calculator_service import \
+    InboundAndOutboundVehicleCapacityCalculatorService
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
+    ContainerLengthDistributionRepository
+from conflowgen.domain_models.distribution_validators import ABSOLUTE_TOLERANCE, DistributionProbabilityOutOfRange, \
+    DistributionProbabilitiesUnequalOne, validate_distribution_with_one_dependent_variable
+from conflowgen.previews.abstract_preview import AbstractPreview
+from conflowgen.previews.modal_split_preview import ModalSplitPreview
+
+
+class BatchedPreviewMetrics(typing.NamedTuple):
+    """
+    The preview metrics for many mode of transport distributions at once.
+    The first axis of each array refers to the candidate distribution.
+    Axes that refer to vehicle types follow the order of :attr:`.BatchedHypothesesPreview.vehicle_types`.
+    """
+
+    #: The inbound capacity in TEU per vehicle type, shape ``(N, 5)``, see
+    #: :meth:`.InboundAndOutboundVehicleCapacityPreview.get_inbound_capacity_of_vehicles`
+    inbound_capacity_in_teu: np.ndarray
+
+    #: The flow in TEU from the inbound vehicle type (second axis) to the outbound vehicle type (third axis), shape
+    #: ``(N, 5, 5)``, see :meth:`.ContainerFlowByVehicleTypePreview.get_inbound_to_outbound_flow`
+    inbound_to_outbound_flow: np.ndarray
+
+    #: The outbound capacity in TEU that is required per vehicle type, shape ``(N, 5)``, see
+    #: :meth:`.VehicleCapacityExceededPreview.compare`
+    required_outbound_capacity_in_teu: np.ndarray
+
+    #: The maximum outbound capacity in TEU per vehicle type, shape ``(N, 5)``.
+    #: It does not depend on the mode of transport distribution and is not a number for trucks.
+    maximum_outbound_capacity_in_teu: np.ndarray
+
+    #: Whether the required outbound capacity exceeds the maximum outbound capacity, shape ``(N, 5)``
+    outbound_capacity_exceeded: np.ndarray
+
+    #: The transshipped capacity in TEU, shape ``(N,)``, see
+    #: :meth:`.ModalSplitPreview.get_transshipment_and_hinterland_split`
+    transshipment_capacity: np.ndarray
+
+    #: The capacity in TEU coming from or destined to the hinterland, shape ``(N,)``
+    hinterland_capacity: np.ndarray
+
+    #: The hinterland modal split of the inbound journeys in TEU with the columns train, barge, and truck like
+    #: :class:`.HinterlandModalSplit`, shape ``(N, 3)``, see :meth:`.ModalSplitPreview.get_modal_split_for_hinterland`
+    hinterland_modal_split_inbound: np.ndarray
+
+    #: The hinterland modal split of the outbound journeys, shape ``(N, 3)``
+    hinterland_modal_split_outbound: np.ndarray
+
+    #: The hinterland modal split of both the inbound and the outbound journeys, shape ``(N, 3)``
+    hinterland_modal_split_inbound_and_outbound: np.ndarray
+
+    #: The hours of the week the truck arrival distribution covers, shape ``(H,)``
+    hours_of_the_week: np.ndarray
+
+    #: The number of truck arrivals for each hour of the week, counting both inbound and outbound trucks, shape
+    #: ``(N, H)``, see :meth:`.TruckGateThroughputPreview.get_weekly_truck_arrivals`
+    weekly_truck_arrivals: np.ndarray
+
+
+class BatchedHypothesesPreview(AbstractPreview):
+    """
+    This preview evaluates many mode of transport distributions at once, e.g., to calibrate the mode of transport
+    distribution by searching through thousands of candidates.
+    Instead of invoking ``hypothesize_with_mode_of_transport_distribution`` on each preview for each candidate, all
+    candidates are stacked in one array and all preview metrics are calculated with vectorized NumPy operations.
+
+    The schedules and the other input distributions are loaded once and then kept.
+    In contrast to the other previews, the capacity of the trucks is derived from the candidate distribution and not
+    from the mode of transport distribution stored in the database.
+    """
+
+    #: The order of the vehicle types along the axes of the candidate distributions and of the results
+    vehicle_types: typing.List[ModeOfTransport] = list(ModeOfTransport)
+
+    def __init__(
+            self,
+            start_date: datetime.date,
+            end_date: datetime.date,
+            transportation_buffer: float
+    ):
+        """
+        Args:
+            start_date: The earliest day to consider when checking the vehicles that move according to schedules
+            end_date: The latest day to consider when checking the vehicles that move according to schedules
+            transportation_buffer: The fraction of how much more a vehicle takes with it on an outbound journey
+                compared to an inbound journey as long as the total vehicle capacity is not exceeded.
+        """
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            transportation_buffer=transportation_buffer
+        )
+        self.mode_of_transport_distributions: typing.Optional[np.ndarray] = None
+
+    @classmethod
+    def to_array(
+            cls,
+            mode_of_transport_distributions: typing.Iterable[
+                typing.Dict[ModeOfTransport, typing.Dict[ModeOfTransport, float]]
+            ]
+    ) -> np.ndarray:
+        """
+        Args:
+            mode_of_transport_distributions: Mode of transport distributions in the format of
+                :meth:`.ModeOfTransportDistributionManager.set_mode_of_transport_distribution`
+
+        Returns:
+            The distributions stacked in one array of the shape ``(N, 5, 5)``
+        """
+        stacked_distributions = []
+        for mode_of_transport_distribution in mode_of_transport_distributions:
+            sanitized_distribution = validate_distribution_with_one_dependent_variable(
+                mode_of_transport_distribution, ModeOfTransport, ModeOfTransport, values_are_frequencies=True
+            )
+            stacked_distributions.append([
+                [sanitized_distribution[inbound_vehicle_type][outbound_vehicle_type]
+                 for outbound_vehicle_type in cls.vehicle_types]
+                for inbound_vehicle_type in cls.vehicle_types
+            ])
+        return np.array(stacked_distributions, dtype=float).reshape(-1, len(cls.vehicle_types), len(cls.vehicle_types))
+
+    def hypothesize_with_mode_of_transport_distribution(
+            self,
+            mode_of_transport_distribution: typing.Dict[ModeOfTransport, typing.Dict[ModeOfTransport, float]]
+    ) -> None:
+        self.mode_of_transport_distributions = self.to_array([mode_of_transport_distribution])
+
+    def hypothesize_with_mode_of_transport_distributions(self, mode_of_transport_distributions: np.ndarray) -> None:
+        """
+        Args:
+            mode_of_transport_distributions: An array of the shape ``(N, 5, 5)``.
+                The entry ``[n, i, j]`` is the fraction of the containers delivered by the vehicle type ``i`` that are
+                picked up by the vehicle type ``j`` in the ``n``-th candidate.
+                The vehicle types are ordered like :attr:`.vehicle_types`.
+        """
+        mode_of_transport_distributions = np.asarray(mode_of_transport_distributions, dtype=float)
+        number_of_vehicle_types = len(self.vehicle_types)
+        if mode_of_transport_distributions.ndim == 2:
+            mode_of_transport_distributions = mode_of_transport_distributions[np.newaxis]
+        if mode_of_transport_distributions.shape[1:] != (number_of_vehicle_types, number_of_vehicle_types) \
+                or mode_of_transport_distributions.ndim != 3:
+            raise ValueError(
+                f"The mode of transport distributions must be of the shape (N, {number_of_vehicle_types}, "
+                f"{number_of_vehicle_types}) but the shape is {mode_of_transport_distributions.shape}."
+            )
+        out_of_range = (mode_of_transport_distributions < 0) | (mode_of_transport_distributions > 1) \
+            | np.isnan(mode_of_transport_distributions)
+        if out_of_range.any():
+            candidate, inbound, outbound = np.argwhere(out_of_range)[0]
+            raise DistributionProbabilityOutOfRange(
+                "The probability of an element to be drawn must range between 0 and 1 but for the element "
+                f"'{self.vehicle_types[outbound]}' of the dependent variable '{self.vehicle_types[inbound]}' the "
+                f"probability was {mode_of_transport_distributions[candidate, inbound, outbound]} in the candidate "
+                f"{candidate}."
+            )
+        sums = mode_of_transport_distributions.sum(axis=2)
+        unequal_one = ~np.isclose(sums, 1, rtol=0, atol=ABSOLUTE_TOLERANCE)
+        if unequal_one.any():
+            candidate, inbound = np.argwhere(unequal_one)[0]
+            raise DistributionProbabilitiesUnequalOne(
+                "The sum of all probabilities should sum to 1 but for the dependent variable "
+                f"'{self.vehicle_types[inbound]}' the sum was {sums[candidate, inbound]:.5f} in the candidate "
+                f"{candidate}."
+            )
+        self.mode_of_transport_distributions = mode_of_transport_distributions
+
+    def evaluate(self, mode_of_transport_distributions: typing.Optional[np.ndarray] = None) -> BatchedPreviewMetrics:
+        """
+        Args:
+            mode_of_transport_distributions: The candidates, see
+                :meth:`.hypothesize_with_mode_of_transport_distributions`.
+                If none are provided, the previously hypothesized candidates are evaluated.
+
+        Returns:
+            The metrics of all previews for each candidate
+        """
+        if mode_of_transport_distributions is not None:
+            self.hypothesize_with_mode_of_transport_distributions(mode_of_transport_distributions)
+        if self.mode_of_transport_distributions is None:
+            raise ValueError("No mode of transport distributions have been hypothesized yet.")
+        distributions = self.mode_of_transport_distributions
+        number_of_candidates = distributions.shape[0]
+        truck = self.vehicle_types.index(ModeOfTransport.truck)
+
+        inbound_capacity = InboundAndOutboundVehicleCapacityCalculatorService.get_inbound_capacity_of_vehicles(
+            self.start_date, self.end_date
+        )
+        outbound_capacity = InboundAndOutboundVehicleCapacityCalculatorService.get_outbound_capacity_of_vehicles(
+            self.start_date, self.end_date, self.transportation_buffer
+        )
+
+        # The scheduled vehicles deliver the same capacity for all candidates, only the trucks depend on the candidate
+        inbound_capacity_of_scheduled_vehicles = np.array([
+            0 if vehicle_type == ModeOfTransport.truck else inbound_capacity.teu[vehicle_type]
+            for vehicle_type in self.vehicle_types
+        ], dtype=float)
+        inbound_capacity_in_teu = np.tile(inbound_capacity_of_scheduled_vehicles, (number_of_candidates, 1))
+        inbound_capacity_in_teu[:, truck] = distributions[:, :, truck] @ inbound_capacity_of_scheduled_vehicles
+
+        inbound_to_outbound_flow = inbound_capacity_in_teu[:, :, np.newaxis] * distributions
+        required_outbound_capacity_in_teu = inbound_to_outbound_flow.sum(axis=1)
+
+        maximum_outbound_capacity_in_teu = np.broadcast_to(
+            np.array([outbound_capacity.maximum.teu[vehicle_type] for vehicle_type in self.vehicle_types], dtype=float),
+            (number_of_candidates, len(self.vehicle_types))
+        )
+        with np.errstate(invalid="ignore"):
+            outbound_capacity_exceeded = required_outbound_capacity_in_teu > maximum_outbound_capacity_in_teu
+        # Like in the VehicleCapacityExceededPreview, a vehicle type without a maximum capacity cannot be exceeded
+        outbound_capacity_exceeded &= maximum_outbound_capacity_in_teu != -1
+
+        is_vessel = np.array([
+            vehicle_type in ModalSplitPreview.vessels_considered_for_transshipment
+            for vehicle_type in self.vehicle_types
+        ])
+        transshipment_capacity = inbound_to_outbound_flow[:, is_vessel][:, :, is_vessel].sum(axis=(1, 2))
+        hinterland_capacity = inbound_to_outbound_flow.sum(axis=(1, 2)) - transshipment_capacity
+
+        hinterland_vehicle_types = [ModeOfTransport.train, ModeOfTransport.barge, ModeOfTransport.truck]
+        hinterland_columns = [self.vehicle_types.index(vehicle_type) for vehicle_type in hinterland_vehicle_types]
+        hinterland_modal_split_inbound = inbound_to_outbound_flow.sum(axis=2)[:, hinterland_columns]
+        hinterland_modal_split_outbound = required_outbound_capacity_in_teu[:, hinterland_columns]
+
+        truck_arrival_distribution = TruckArrivalDistributionManager().get_truck_arrival_distribution()
+        hours_of_the_week = np.array(list(truck_arrival_distribution.keys()))
+        truck_arrival_probabilities = np.array(list(truck_arrival_distribution.values()), dtype=float)
+        number_of_weeks = (self.end_date - self.start_date).days / 7
+        teu_factor = ContainerLengthDistributionRepository.get_teu_factor()
+        # Like in the TruckGateThroughputPreview, each import container picked up by truck leads to one export
+        # container delivered by truck, thus the inbound and outbound truck capacities are the same
+        trucks_per_week = np.ceil(inbound_capacity_in_teu[:, truck] / teu_factor) / number_of_weeks
+        weekly_truck_arrivals = 2 * np.round(trucks_per_week[:, np.newaxis] * truck_arrival_probabilities)
+
+        return BatchedPreviewMetrics(
+            inbound_capacity_in_teu=inbound_capacity_in_teu,
+            inbound_to_outbound_flow=inbound_to_outbound_flow,
+            required_outbound_capacity_in_teu=required_outbound_capacity_in_teu,
+            maximum_outbound_capacity_in_teu=maximum_outbound_capacity_in_teu,
+            outbound_capacity_exceeded=outbound_capacity_exceeded,
+            transshipment_capacity=transshipment_capacity,
+            hinterland_capacity=hinterland_capacity,
+            hinterland_modal_split_inbound=hinterland_modal_split_inbound,
+            hinterland_modal_split_outbound=hinterland_modal_split_outbound,
+            hinterland_modal_split_inbound_and_outbound=hinterland_modal_split_inbound
+            + hinterland_modal_split_outbound,
+            hours_of_the_week=hours_of_the_week,
+            weekly_truck_arrivals=weekly_truck_arrivals.astype(int)
+        )
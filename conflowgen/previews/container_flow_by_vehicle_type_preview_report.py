@@ -1,15 +1,16 @@
 from __future__ import annotations
 import itertools
 import logging
-from typing import Dict
-
-import plotly.graph_objects
+from typing import Dict, TYPE_CHECKING
 
 from conflowgen.previews.container_flow_by_vehicle_type_preview import \
     ContainerFlowByVehicleTypePreview
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.reporting import AbstractReportWithPlotly
 
+if TYPE_CHECKING:
+    import plotly.graph_objects
+
 
 class ContainerFlowByVehicleTypePreviewReport(AbstractReportWithPlotly):
     """
@@ -133,9 +134,11 @@ class ContainerFlowByVehicleTypePreviewReport(AbstractReportWithPlotly):
                 round(to_outbound_flow[i], 2)) + " " + unit
             for i, outbound_vehicle_type in enumerate(inbound_to_outbound_flow.keys())
         ]
-        fig = plotly.graph_objects.Figure(
+        from plotly import graph_objects  # pylint: disable=import-outside-toplevel
+
+        fig = graph_objects.Figure(
             data=[
-                plotly.graph_objects.Sankey(
+                graph_objects.Sankey(
                     arrangement='perpendicular',
                     node={
                         'pad': 15,
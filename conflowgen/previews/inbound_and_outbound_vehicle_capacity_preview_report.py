@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Tuple, TYPE_CHECKING
 
-import matplotlib
 import numpy as np
 import pandas as pd
 
@@ -11,6 +10,9 @@ from conflowgen.previews.inbound_and_outbound_vehicle_capacity_preview import \
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.reporting import AbstractReportWithMatplotlib
 
+if TYPE_CHECKING:
+    import matplotlib.axis
+
 
 class InboundAndOutboundVehicleCapacityPreviewReport(AbstractReportWithMatplotlib):
     """
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from typing import Dict
-
-import matplotlib
+from typing import Dict, TYPE_CHECKING
 
 from conflowgen.previews.modal_split_preview import ModalSplitPreview
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.reporting import AbstractReportWithMatplotlib, modal_split_report
 from conflowgen.reporting.modal_split_report import plot_modal_splits
 
+if TYPE_CHECKING:
+    import matplotlib.axes
+
 
 class ModalSplitPreviewReport(AbstractReportWithMatplotlib):
     """
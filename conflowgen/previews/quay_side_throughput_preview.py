@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import datetime
+import typing
+
+from conflowgen.analyses.abstract_analysis import get_week_based_time_window, get_week_based_range
+from conflowgen.application.services.inbound_and_outbound_vehicle_capacity_calculator_service import \
+    InboundAndOutboundVehicleCapacityCalculatorService
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
+    ContainerLengthDistributionRepository
+from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
+    ModeOfTransportDistributionRepository
+from conflowgen.domain_models.distribution_validators import validate_distribution_with_one_dependent_variable
+from conflowgen.domain_models.factories.fleet_factory import create_arrivals_of_schedules
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.previews.abstract_preview import AbstractPreview
+
+
+class QuaySideThroughputPreview(AbstractPreview):
+    """
+    This preview estimates the weekly quay side throughput before any container has been generated.
+    It is the counterpart of :class:`.QuaySideThroughputAnalysis` which requires the synthetic data.
+
+    Each scheduled vessel discharges its average moved capacity at its arrival.
+    The containers it loads are estimated based on the mode of transport distribution: The TEU destined to its vehicle
+    type are spread over all vessels of that type according to their average moved capacity.
+    As in the generation, a vessel loads at most its average moved capacity plus the transportation buffer, and never
+    more than its vehicle capacity.
+
+    The preview returns a data structure that can be used for generating reports (e.g., in text or as a figure).
+    It is intended to provide an estimate of the quay side throughput for the given inputs.
+    It does not consider all factors that may impact the actual quay side throughput, e.g., the container dwell times
+    which might prevent a container from being loaded onto a vessel that departs too early or too late.
+    """
+
+    QUAY_SIDE_VEHICLES = {
+        ModeOfTransport.deep_sea_vessel,
+        ModeOfTransport.feeder,
+        # barges are counted as hinterland here
+    }
+
+    def __init__(self, start_date: datetime.date, end_date: datetime.date, transportation_buffer: float):
+        super().__init__(start_date, end_date, transportation_buffer)
+        self.mode_of_transport_distribution = ModeOfTransportDistributionRepository().get_distribution()
+
+    @DataSummariesCache.cache_result
+    def hypothesize_with_mode_of_transport_distribution(
+            self,
+            mode_of_transport_distribution: typing.Dict[ModeOfTransport, typing.Dict[ModeOfTransport, float]]
+    ):
+        validate_distribution_with_one_dependent_variable(
+            mode_of_transport_distribution, ModeOfTransport, ModeOfTransport, values_are_frequencies=True
+        )
+        self.mode_of_transport_distribution = mode_of_transport_distribution
+
+    @DataSummariesCache.cache_result
+    def get_throughput_over_time(
+            self,
+            inbound: bool = True,
+            outbound: bool = True
+    ) -> typing.Dict[datetime.date, float]:
+        """
+        For each week, the expected number of containers crossing the quay is calculated.
+        Like in :meth:`.QuaySideThroughputAnalysis.get_throughput_over_time`, all containers of a vessel are assigned
+        to the week of its arrival.
+
+        Args:
+            inbound: Whether to count the containers which vessels deliver on their inbound journey
+            outbound: Whether to count the containers which vessels pick up on their outbound journey
+
+        Returns:
+            The expected number of boxes for each week, starting with the Monday of the respective week
+        """
+        assert (inbound or outbound), "At least one of the two must be checked for"
+
+        inbound_capacity_in_teu = InboundAndOutboundVehicleCapacityCalculatorService.get_inbound_capacity_of_vehicles(
+            self.start_date, self.end_date
+        ).teu
+        required_outbound_capacity_in_teu = {
+            outbound_vehicle_type: sum(
+                inbound_capacity_in_teu[inbound_vehicle_type]
+                * self.mode_of_transport_distribution[inbound_vehicle_type][outbound_vehicle_type]
+                for inbound_vehicle_type in ModeOfTransport
+            )
+            for outbound_vehicle_type in self.QUAY_SIDE_VEHICLES
+        }
+
+        # Each arrival is recorded with the TEU it discharges and the maximum TEU it can load
+        arrivals_per_vehicle_type: typing.Dict[
+            ModeOfTransport, typing.List[typing.Tuple[datetime.datetime, float, float]]
+        ] = {vehicle_type: [] for vehicle_type in self.QUAY_SIDE_VEHICLES}
+        schedule: Schedule
+        schedules = list(Schedule.select().where(Schedule.vehicle_type << list(self.QUAY_SIDE_VEHICLES)))
+        arrivals_of_schedules = create_arrivals_of_schedules(self.start_date, self.end_date, schedules)
+        for schedule in schedules:
+            arrivals = arrivals_of_schedules.get_arrivals(schedule.id)
+            maximum_capacity_of_vehicle_in_teu = min(
+                schedule.average_moved_capacity * (1 + self.transportation_buffer),
+                schedule.average_vehicle_capacity
+            )
+            arrivals_per_vehicle_type[schedule.vehicle_type].extend(
+                (arrival, schedule.average_moved_capacity, maximum_capacity_of_vehicle_in_teu)
+                for arrival in arrivals
+            )
+
+        if all(len(arrivals) == 0 for arrivals in arrivals_per_vehicle_type.values()):
+            return {}
+
+        teu_factor = ContainerLengthDistributionRepository.get_teu_factor()
+        throughput_in_teu_per_arrival: typing.List[typing.Tuple[datetime.datetime, float]] = []
+        for vehicle_type, arrivals in arrivals_per_vehicle_type.items():
+            total_moved_capacity = sum(moved_capacity for _, moved_capacity, _ in arrivals)
+            for arrival, moved_capacity, maximum_capacity in arrivals:
+                throughput_in_teu = 0
+                if inbound:
+                    throughput_in_teu += moved_capacity
+                if outbound:
+                    share_of_vehicle = moved_capacity / total_moved_capacity
+                    throughput_in_teu += min(
+                        required_outbound_capacity_in_teu[vehicle_type] * share_of_vehicle,
+                        maximum_capacity
+                    )
+                throughput_in_teu_per_arrival.append((arrival, throughput_in_teu))
+
+        first_time_window = get_week_based_time_window(min(arrival for arrival, _ in throughput_in_teu_per_arrival))
+        last_time_window = get_week_based_time_window(max(arrival for arrival, _ in throughput_in_teu_per_arrival))
+        quay_side_throughput: typing.Dict[datetime.date, float] = {
+            time_window: 0
+            for time_window in get_week_based_range(first_time_window, last_time_window)
+        }
+        for arrival, throughput_in_teu in throughput_in_teu_per_arrival:
+            quay_side_throughput[get_week_based_time_window(arrival)] += throughput_in_teu / teu_factor  # in boxes
+
+        return quay_side_throughput
@@ -1,14 +1,16 @@
+from __future__ import annotations
+
 from abc import ABC
 import typing
 import pandas as pd
 
-import matplotlib
-from matplotlib import pyplot as plt
-
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
 from conflowgen.previews.truck_gate_throughput_preview import TruckGateThroughputPreview
 from conflowgen.reporting import AbstractReportWithMatplotlib
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axes
+
 
 class TruckGateThroughputPreviewReport(AbstractReportWithMatplotlib, ABC):
     """
@@ -109,6 +111,8 @@ class TruckGateThroughputPreviewReport(AbstractReportWithMatplotlib, ABC):
         return table_string
 
     def get_report_as_graph(self, inbound: bool = True, outbound: bool = True, **kwargs) -> matplotlib.axes.Axes:
+        from matplotlib import pyplot as plt, ticker  # pylint: disable=import-outside-toplevel
+
         # Retrieve the truck distribution
         truck_distribution = self.preview.get_weekly_truck_arrivals(inbound, outbound)
 
@@ -121,7 +125,7 @@ class TruckGateThroughputPreviewReport(AbstractReportWithMatplotlib, ABC):
         plt.xlim([1, 7])  # plot from Monday to Sunday
         ax.xaxis.grid(True, which="minor", color="lightgray")  # every hour
         ax.xaxis.grid(True, which="major", color="k")  # every day
-        ax.xaxis.set_minor_locator(matplotlib.ticker.MultipleLocator(1 / 24))  # every hour
+        ax.xaxis.set_minor_locator(ticker.MultipleLocator(1 / 24))  # every hour
 
         plt.title("Expected truck arrival pattern")
         ax.set_xticks(list(range(1, 8)))  # every day
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 
-import matplotlib.axis
 import numpy as np
 import pandas as pd
 
@@ -10,6 +9,9 @@ from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTranspor
 from conflowgen.previews.vehicle_capacity_exceeded_preview import VehicleCapacityExceededPreview
 from conflowgen.reporting import AbstractReportWithMatplotlib
 
+if TYPE_CHECKING:
+    import matplotlib.axis
+
 
 class VehicleCapacityUtilizationOnOutboundJourneyPreviewReport(AbstractReportWithMatplotlib):
     """
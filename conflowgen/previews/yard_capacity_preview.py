@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import datetime
+import math
+import typing
+
+import numpy as np
+
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.descriptive_datatypes import UsedYardCapacityOverTime
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.distribution_repositories.container_dwell_time_distribution_repository import \
+    ContainerDwellTimeDistributionRepository
+from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
+    ContainerLengthDistributionRepository
+from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
+    ModeOfTransportDistributionRepository
+from conflowgen.domain_models.distribution_repositories.storage_requirement_distribution_repository import \
+    StorageRequirementDistributionRepository
+from conflowgen.domain_models.distribution_validators import validate_distribution_with_one_dependent_variable
+from conflowgen.domain_models.factories.fleet_factory import create_arrivals_of_schedules
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.previews.abstract_preview import AbstractPreview
+from conflowgen.tools.continuous_distribution import ContinuousDistribution
+
+
+def _get_survival_function(distribution: ContinuousDistribution) -> np.ndarray:
+    """
+    Returns the probability that a container is still in the yard k hours after it has entered it, starting with k = 0.
+    """
+    hours = np.arange(0, math.ceil(distribution.maximum) + 1)
+    probabilities = distribution.get_probabilities(hours)
+    survival = 1 - np.concatenate(([0], np.cumsum(probabilities)[:-1]))
+    return np.clip(survival, 0, 1)
+
+
+class YardCapacityPreview(AbstractPreview):
+    """
+    This preview estimates the used yard capacity over time before any container has been generated.
+    It is the counterpart of :class:`.YardCapacityAnalysis` which requires the synthetic data.
+
+    The scheduled vehicles deliver their average moved capacity at their arrival.
+    These containers leave the yard according to the container dwell time distributions.
+    Thus, the expected used yard capacity is obtained by convolving the delivered TEU per hour with the probability that
+    a container is still in the yard after a given number of hours.
+    The export containers delivered by trucks are handled the other way round: they are expected to arrive before the
+    vessel that picks them up, following the same dwell time distributions.
+
+    The preview returns a data structure that can be used for generating reports (e.g., in text or as a figure).
+    It is intended to provide an estimate of the expected used yard capacity for the given inputs.
+    Random effects such as the actual container dwell times drawn during the generation are smoothed out.
+    """
+
+    def __init__(self, start_date: datetime.date, end_date: datetime.date, transportation_buffer: float):
+        super().__init__(start_date, end_date, transportation_buffer)
+        self.mode_of_transport_distribution = ModeOfTransportDistributionRepository().get_distribution()
+
+    @DataSummariesCache.cache_result
+    def hypothesize_with_mode_of_transport_distribution(
+            self,
+            mode_of_transport_distribution: typing.Dict[ModeOfTransport, typing.Dict[ModeOfTransport, float]]
+    ):
+        self.mode_of_transport_distribution = validate_distribution_with_one_dependent_variable(
+            mode_of_transport_distribution, ModeOfTransport, ModeOfTransport, values_are_frequencies=True
+        )
+
+    @staticmethod
+    def _get_selected_storage_requirements(
+            storage_requirement: typing.Union[str, typing.Collection, StorageRequirement, None]
+    ) -> typing.Set[StorageRequirement]:
+        if storage_requirement is None or storage_requirement == "all":
+            return set(StorageRequirement)
+        if isinstance(storage_requirement, StorageRequirement):
+            return {storage_requirement}
+        return set(storage_requirement)
+
+    @staticmethod
+    def _get_shares_of_storage_requirements() -> typing.Tuple[
+        typing.Dict[StorageRequirement, float], typing.Dict[StorageRequirement, float]
+    ]:
+        """
+        Returns the share of each storage requirement in the TEU and in the number of boxes.
+        """
+        container_length_distribution = ContainerLengthDistributionRepository.get_distribution()
+        storage_requirement_distribution = StorageRequirementDistributionRepository.get_distribution()
+        teu_factor = ContainerLengthDistributionRepository.get_teu_factor()
+        share_in_teu = {}
+        share_in_boxes = {}
+        for storage_requirement in StorageRequirement:
+            share_in_boxes[storage_requirement] = sum(
+                fraction * storage_requirement_distribution[container_length][storage_requirement]
+                for container_length, fraction in container_length_distribution.items()
+            )
+            share_in_teu[storage_requirement] = sum(
+                fraction * ContainerLength.get_factor(container_length)
+                * storage_requirement_distribution[container_length][storage_requirement]
+                for container_length, fraction in container_length_distribution.items()
+            ) / teu_factor
+        return share_in_teu, share_in_boxes
+
+    @DataSummariesCache.cache_result
+    def get_used_yard_capacity_over_time(
+            self,
+            storage_requirement: typing.Union[str, typing.Collection, StorageRequirement] = "all"
+    ) -> UsedYardCapacityOverTime:
+        """
+        For each hour, the expected used yard capacity is calculated based on the schedules, the mode of transport
+        distribution, the container length distribution, the storage requirement distribution, and the container dwell
+        time distributions.
+
+        Args:
+            storage_requirement: One of
+                ``"all"``,
+                a collection of :class:`StorageRequirement` enum values (as a list, set, or similar), or
+                a single :class:`StorageRequirement` enum value.
+        Returns:
+            UsedYardCapacityOverTime: A namedtuple consisting of two dictionaries. The first dictionary represents the
+            expected used yard capacity in TEU over the time. The second dictionary represents the expected used yard
+            capacity in terms of the number of boxes over the time.
+            As these are expected values, the number of boxes is not rounded.
+        """
+        selected_storage_requirements = self._get_selected_storage_requirements(storage_requirement)
+        share_in_teu, share_in_boxes = self._get_shares_of_storage_requirements()
+        teu_factor = ContainerLengthDistributionRepository.get_teu_factor()
+        dwell_time_distributions = ContainerDwellTimeDistributionRepository.get_distributions()
+
+        # The survival functions weighted by the share of the selected storage requirements for each combination of
+        # delivering and picking up vehicle type, once for TEU and once for boxes
+        survival_functions: typing.Dict[
+            typing.Tuple[ModeOfTransport, ModeOfTransport], typing.Tuple[np.ndarray, np.ndarray]
+        ] = {}
+        for delivered_by in ModeOfTransport:
+            for picked_up_by in ModeOfTransport:
+                weighted_survival_in_teu = np.zeros(1)
+                weighted_survival_in_boxes = np.zeros(1)
+                for selected_storage_requirement in selected_storage_requirements:
+                    survival = _get_survival_function(
+                        dwell_time_distributions[delivered_by][picked_up_by][selected_storage_requirement]
+                    )
+                    if len(survival) > len(weighted_survival_in_teu):
+                        padding = len(survival) - len(weighted_survival_in_teu)
+                        weighted_survival_in_teu = np.pad(weighted_survival_in_teu, (0, padding))
+                        weighted_survival_in_boxes = np.pad(weighted_survival_in_boxes, (0, padding))
+                    weighted_survival_in_teu[:len(survival)] += share_in_teu[selected_storage_requirement] * survival
+                    weighted_survival_in_boxes[:len(survival)] += \
+                        share_in_boxes[selected_storage_requirement] / teu_factor * survival
+                survival_functions[(delivered_by, picked_up_by)] = weighted_survival_in_teu, weighted_survival_in_boxes
+        longest_dwell_time = max(len(survival) for survival, _ in survival_functions.values())
+
+        first_time_window = datetime.datetime.combine(self.start_date, datetime.time()) \
+            - datetime.timedelta(hours=longest_dwell_time)
+        number_of_time_windows = (self.end_date - self.start_date).days * 24 + 24 + 2 * longest_dwell_time
+
+        # The TEU each scheduled vehicle type moves per time window
+        moved_capacity: typing.Dict[ModeOfTransport, np.ndarray] = {
+            vehicle_type: np.zeros(number_of_time_windows) for vehicle_type in ModeOfTransport.get_scheduled_vehicles()
+        }
+        schedules = list(Schedule.select())
+        arrivals_of_schedules = create_arrivals_of_schedules(self.start_date, self.end_date, schedules)
+        for schedule in schedules:
+            arrivals = arrivals_of_schedules.get_arrivals(schedule.id)
+            for arrival in arrivals:
+                time_window = int((arrival - first_time_window).total_seconds() // 3600)
+                moved_capacity[schedule.vehicle_type][time_window] += schedule.average_moved_capacity
+
+        used_yard_capacity_in_teu = np.zeros(number_of_time_windows)
+        used_yard_capacity_in_boxes = np.zeros(number_of_time_windows)
+
+        # Containers delivered by scheduled vehicles enter the yard at the arrival and stay for the dwell time
+        for delivered_by, delivered_capacity in moved_capacity.items():
+            for picked_up_by in ModeOfTransport:
+                fraction = self.mode_of_transport_distribution[delivered_by][picked_up_by]
+                if fraction == 0:
+                    continue
+                survival_in_teu, survival_in_boxes = survival_functions[(delivered_by, picked_up_by)]
+                used_yard_capacity_in_teu += \
+                    np.convolve(delivered_capacity * fraction, survival_in_teu)[:number_of_time_windows]
+                used_yard_capacity_in_boxes += \
+                    np.convolve(delivered_capacity * fraction, survival_in_boxes)[:number_of_time_windows]
+
+        # Containers delivered by trucks enter the yard the dwell time before the scheduled vehicle picks them up.
+        # Like in the other previews, the export containers are spread over the scheduled vehicles of each type
+        # according to their moved capacity.
+        delivered_by_truck = sum(
+            delivered_capacity.sum() * self.mode_of_transport_distribution[delivered_by][ModeOfTransport.truck]
+            for delivered_by, delivered_capacity in moved_capacity.items()
+        )
+        for picked_up_by, picked_up_capacity in moved_capacity.items():
+            fraction = self.mode_of_transport_distribution[ModeOfTransport.truck][picked_up_by]
+            total_moved_capacity = picked_up_capacity.sum()
+            if fraction == 0 or total_moved_capacity == 0:
+                continue
+            picked_up_from_truck = picked_up_capacity * (delivered_by_truck * fraction / total_moved_capacity)
+            survival_in_teu, survival_in_boxes = survival_functions[(ModeOfTransport.truck, picked_up_by)]
+            used_yard_capacity_in_teu += \
+                np.convolve(picked_up_from_truck[::-1], survival_in_teu)[:number_of_time_windows][::-1]
+            used_yard_capacity_in_boxes += \
+                np.convolve(picked_up_from_truck[::-1], survival_in_boxes)[:number_of_time_windows][::-1]
+
+        occupied_time_windows = np.flatnonzero(used_yard_capacity_in_teu > 0)
+        if len(occupied_time_windows) == 0:
+            return UsedYardCapacityOverTime(teu={}, containers={})
+        used_yard_capacity_teu: typing.Dict[datetime.datetime, float] = {}
+        used_yard_capacity_boxes: typing.Dict[datetime.datetime, float] = {}
+        for time_window in range(occupied_time_windows[0], occupied_time_windows[-1] + 1):
+            point_in_time = first_time_window + datetime.timedelta(hours=int(time_window))
+            used_yard_capacity_teu[point_in_time] = float(used_yard_capacity_in_teu[time_window])
+            used_yard_capacity_boxes[point_in_time] = float(used_yard_capacity_in_boxes[time_window])
+        return UsedYardCapacityOverTime(teu=used_yard_capacity_teu, containers=used_yard_capacity_boxes)
@@ -8,18 +8,25 @@ import tempfile
 import typing
 from collections.abc import Iterable
 
-import matplotlib.pyplot as plt
-import plotly.graph_objects
-from matplotlib import image as mpimg
-
 from conflowgen.descriptive_datatypes import VehicleIdentifier
 from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
 from conflowgen.application.repositories.container_flow_generation_properties_repository import \
     ContainerFlowGenerationPropertiesRepository
 from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.tools.profiler import Profiler
+
+if typing.TYPE_CHECKING:
+    import plotly.graph_objects
 
 
 class AbstractReport(abc.ABC):
+    """
+    The common base of all reports.
+    It only covers the text rendering, see :meth:`.get_report_as_text`.
+    The graph rendering is provided by ``AbstractReportWithMatplotlib`` and ``AbstractReportWithPlotly``.
+    As these plotting libraries take long to import, the reports import them on the first graph.
+    Thus, all reports can be obtained as text on systems where no plotting library is set up.
+    """
 
     #: Each report can log to the console
     logger = logging.getLogger("conflowgen")
@@ -97,6 +104,36 @@ class AbstractReport(abc.ABC):
         """
         pass
 
+    def profile(
+            self,
+            output_directory: typing.Optional[str] = None,
+            sampling_interval: typing.Optional[float] = 0.005
+    ) -> Profiler:
+        """
+        Profiles the report while the returned context is entered, e.g.,
+
+        .. code-block:: python
+
+            report = ContainerDwellTimeAnalysisReport()
+            with report.profile():
+                report.get_report_as_text()
+
+        The names of the files start with the name of the database, followed by the name of the report class.
+        See :class:`.Profiler` for details.
+
+        Args:
+            output_directory: The directory to save the profiles in.
+                Defaults to the directory of the current SQLite database.
+            sampling_interval: The number of seconds between two samples of the call stack.
+                If it is :py:obj:`None`, only :mod:`cProfile` is used.
+
+        Returns:
+            The profiler to use as a context manager
+        """
+        return Profiler(
+            self.__class__.__name__, output_directory=output_directory, sampling_interval=sampling_interval
+        )
+
     @staticmethod
     def _get_enum_or_enum_set_representation(enum_or_enum_set: typing.Any, enum_type: typing.Type[enum.Enum]) -> str:
         if enum_or_enum_set is None or enum_or_enum_set == "all":
@@ -136,6 +173,9 @@ class AbstractReport(abc.ABC):
 
 
 class AbstractReportWithMatplotlib(AbstractReport, metaclass=abc.ABCMeta):
+    """
+    The graph of the report is drawn with matplotlib which is only imported once the graph is requested.
+    """
 
     def show_report_as_graph(self, **kwargs) -> None:
 
@@ -144,12 +184,18 @@ class AbstractReportWithMatplotlib(AbstractReport, metaclass=abc.ABCMeta):
         kwargs.pop("static", None)
         kwargs.pop("display_as_ipython_svg", None)
 
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         with plt.style.context('seaborn-colorblind'):
             self.get_report_as_graph(**kwargs)
             plt.show(block=True)
 
 
 class AbstractReportWithPlotly(AbstractReport, metaclass=abc.ABCMeta):
+    """
+    The graph of the report is drawn with plotly which is only imported once the graph is requested.
+    """
+
     def show_report_as_graph(self, **kwargs) -> None:
         """
         Plotly needs quite some libraries loaded in the online documentation so that the figures are actually visible
@@ -187,6 +233,9 @@ class AbstractReportWithPlotly(AbstractReport, metaclass=abc.ABCMeta):
 
     @staticmethod
     def _show_static_fig(fig: plotly.graph_objects.Figure) -> None:
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+        from matplotlib import image as mpimg  # pylint: disable=import-outside-toplevel
+
         png_format_image = fig.to_image(format="png", width=800)
         with tempfile.NamedTemporaryFile() as _file:
             _file.write(png_format_image)
@@ -1,15 +1,21 @@
-import matplotlib.pyplot as plt
+from __future__ import annotations
+
+import typing
+
 import numpy as np
 import pandas as pd
 
 from conflowgen.descriptive_datatypes import TransshipmentAndHinterlandSplit, HinterlandModalSplit
 from conflowgen.reporting.no_data_plot import no_data_text
 
+if typing.TYPE_CHECKING:
+    import matplotlib.axes
+
 
 def _plt_modal_split_instance(
         modal_split: HinterlandModalSplit,
         name: str,
-        ax: plt.axis
+        ax: matplotlib.axes.Axes
 ) -> None:
     series_modal_split = pd.Series({
         "train": modal_split.train_capacity,
@@ -34,7 +40,9 @@ def plot_modal_splits(
         modal_split_in_hinterland_both_directions: HinterlandModalSplit,
         modal_split_in_hinterland_inbound_traffic: HinterlandModalSplit,
         modal_split_in_hinterland_outbound_traffic: HinterlandModalSplit
-) -> plt.Axes:
+) -> matplotlib.axes.Axes:
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
     fig, axes = plt.subplots(2, 2)
 
     series_hinterland_and_transshipment = pd.Series({
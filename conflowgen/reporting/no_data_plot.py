@@ -1,11 +1,14 @@
-from typing import Optional, Tuple
+from __future__ import annotations
 
-from matplotlib import pyplot as plt
-import matplotlib.axes
-import matplotlib.figure
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import matplotlib.axes
+    import matplotlib.figure
 
 
 def no_data_graph() -> Tuple[matplotlib.figure.Figure, matplotlib.axes.Axes]:
+    from matplotlib import pyplot as plt  # pylint: disable=import-outside-toplevel
     fig, ax = plt.subplots()
     no_data_text(ax)
     return fig, ax
@@ -13,6 +16,7 @@ def no_data_graph() -> Tuple[matplotlib.figure.Figure, matplotlib.axes.Axes]:
 
 def no_data_text(ax: Optional[matplotlib.axes.Axes] = None) -> matplotlib.axes.Axes:
     if ax is None:
+        from matplotlib import pyplot as plt  # pylint: disable=import-outside-toplevel
         ax = plt.gca()
     ax.text(0.1, 0.1, 'No data')
     return ax
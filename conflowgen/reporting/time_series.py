@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import datetime
+from typing import Dict, Optional, TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import matplotlib.axes
+
+#: The aggregation windows that are tried one after another if none is given for a graph.
+#: The first one that leads to at most :data:`MAXIMUM_NUMBER_OF_POINTS_IN_GRAPH` points is used.
+AGGREGATION_WINDOW_CANDIDATES = (
+    datetime.timedelta(hours=1),
+    datetime.timedelta(hours=6),
+    datetime.timedelta(days=1),
+    datetime.timedelta(weeks=1),
+)
+
+#: Up to this number of points, a graph shows each value of the time series.
+#: Longer time series are aggregated so that the figures stay responsive and the exported files stay small.
+MAXIMUM_NUMBER_OF_POINTS_IN_GRAPH = 1000
+
+
+def _to_series(time_series: Dict[datetime.datetime, float]) -> pd.Series:
+    series = pd.Series(time_series, dtype=float)
+    series.index = pd.DatetimeIndex(series.index)
+    return series.sort_index()
+
+
+def _validate_aggregation_window(aggregation_window: datetime.timedelta) -> None:
+    if aggregation_window <= datetime.timedelta(0):
+        raise ValueError(f"The aggregation window must be positive but {aggregation_window} has been provided")
+
+
+def choose_aggregation_window(
+        time_series: Dict[datetime.datetime, float],
+        maximum_number_of_points: int = MAXIMUM_NUMBER_OF_POINTS_IN_GRAPH
+) -> datetime.timedelta:
+    """
+    Args:
+        time_series: The hourly values
+        maximum_number_of_points: The maximum number of aggregation windows
+
+    Returns:
+        The shortest of the :data:`AGGREGATION_WINDOW_CANDIDATES` that splits the time series into at most
+        ``maximum_number_of_points`` windows, or the longest one if all of them lead to more windows.
+    """
+    if len(time_series) == 0:
+        return AGGREGATION_WINDOW_CANDIDATES[0]
+    duration = max(time_series) - min(time_series)
+    for aggregation_window in AGGREGATION_WINDOW_CANDIDATES:
+        if duration // aggregation_window + 1 <= maximum_number_of_points:
+            return aggregation_window
+    return AGGREGATION_WINDOW_CANDIDATES[-1]
+
+
+def get_envelope(
+        time_series: Dict[datetime.datetime, float],
+        aggregation_window: datetime.timedelta
+) -> pd.DataFrame:
+    """
+    Aggregates the hourly values per window.
+    In contrast to only averaging them, the minimum and maximum keep the peaks of the time series visible.
+
+    Args:
+        time_series: The hourly values
+        aggregation_window: The length of each window.
+            The windows start at midnight of the first day of the time series.
+
+    Returns:
+        One row per window, indexed by its start, with the columns ``minimum``, ``average``, and ``maximum``.
+    """
+    _validate_aggregation_window(aggregation_window)
+    resampler = _to_series(time_series).resample(pd.Timedelta(aggregation_window), origin="start_day")
+    return pd.DataFrame({
+        "minimum": resampler.min(),
+        "average": resampler.mean(),
+        "maximum": resampler.max(),
+    }).dropna()
+
+
+def plot_time_series(
+        time_series: Dict[datetime.datetime, float],
+        ax: Optional[matplotlib.axes.Axes] = None,
+        aggregation_window: Optional[datetime.timedelta] = None
+) -> matplotlib.axes.Axes:
+    """
+    Plots hourly values as a line.
+    If the values are aggregated, the average of each window is plotted as a line and the range between the minimum
+    and the maximum of each window is shaded.
+
+    Args:
+        time_series: The hourly values
+        ax: The axes to plot on, defaults to the current axes
+        aggregation_window: The length of each window.
+            Defaults to the result of :func:`choose_aggregation_window`.
+
+    Returns:
+        The axes that have been plotted on
+    """
+    if aggregation_window is None:
+        aggregation_window = choose_aggregation_window(time_series)
+    _validate_aggregation_window(aggregation_window)
+
+    if aggregation_window <= datetime.timedelta(hours=1):
+        series = _to_series(time_series)
+        if ax is None:
+            return series.plot()
+        series.plot(ax=ax)
+        return ax
+
+    from matplotlib import pyplot as plt  # pylint: disable=import-outside-toplevel
+    if ax is None:
+        ax = plt.gca()
+    envelope = get_envelope(time_series, aggregation_window)
+    window_starts = envelope.index.to_pydatetime()
+    line, = ax.plot(window_starts, envelope["average"], label=f"average per {aggregation_window}")
+    ax.fill_between(
+        window_starts, envelope["minimum"], envelope["maximum"], color=line.get_color(), alpha=0.3, linewidth=0,
+        label=f"minimum to maximum per {aggregation_window}"
+    )
+    ax.legend()
+    return ax
+
+
+def get_envelope_as_text(
+        time_series: Dict[datetime.datetime, float],
+        aggregation_window: datetime.timedelta
+) -> str:
+    """
+    Args:
+        time_series: The hourly values
+        aggregation_window: The length of each window, see :func:`get_envelope`
+
+    Returns:
+        A table with the minimum, average, and maximum of each window
+    """
+    envelope = get_envelope(time_series, aggregation_window)
+    table = f"aggregated per {aggregation_window}\n"
+    table += f"{'window start':<19} {'minimum':>10} {'average':>10} {'maximum':>10}\n"
+    for window_start, row in envelope.iterrows():
+        table += f"{window_start.isoformat(timespec='minutes'):<19} "
+        table += f"{row['minimum']:>10.1f} {row['average']:>10.1f} {row['maximum']:>10.1f}\n"
+    return table
@@ -7,6 +7,7 @@ from conflowgen.application.models.container_flow_generation_properties import C
 from conflowgen.database_connection.create_tables import create_tables
 from conflowgen.domain_models.distribution_seeders import seed_all_distributions
 from conflowgen.tests.autoclose_matplotlib import UnitTestCaseWithMatplotlib
+from conflowgen.tests.loaded_plotting_libraries import get_plotting_libraries_loaded_by
 from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
 
 
@@ -30,3 +31,6 @@ class TestRunAllAnalyses(UnitTestCaseWithMatplotlib):
             with self.assertLogs('conflowgen', level='INFO') as context:
                 run_all_analyses(as_text=False, as_graph=True, static_graphs=True)
         self.assertEqual(len(context.output), 27)
+
+    def test_text_reports_do_not_load_plotting_libraries(self):
+        self.assertListEqual(get_plotting_libraries_loaded_by("conflowgen.analyses", "run_all_analyses"), [])
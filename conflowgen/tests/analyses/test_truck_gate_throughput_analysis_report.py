@@ -183,3 +183,16 @@ standard deviation:                                 -1.0
         setup_feeder_data()
         graph = self.analysis.get_report_as_graph()
         self.assertIsNotNone(graph)
+
+    def test_with_two_trucks_aggregated_per_day(self):
+        setup_feeder_data()
+        actual_report = self.analysis.get_report_as_text(aggregation_window=datetime.timedelta(days=1))
+        statistics, aggregated = actual_report.split("\n\n")
+        self.assertEqual(statistics + "\n", self.analysis.get_report_as_text())
+        self.assertTrue(aggregated.startswith("aggregated per 1 day, 0:00:00\n"))
+        self.assertEqual(max(float(line.split()[-1]) for line in aggregated.splitlines()[2:]), 1)
+
+    def test_graph_with_two_trucks_aggregated(self):
+        setup_feeder_data()
+        graph = self.analysis.get_report_as_graph(aggregation_window=datetime.timedelta(hours=6))
+        self.assertEqual(len(graph.collections), 1)
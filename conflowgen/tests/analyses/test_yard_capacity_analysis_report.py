@@ -133,3 +133,16 @@ standard deviation:                                1.1
         setup_feeder_data()
         graph = self.analysis.get_report_as_graph()
         self.assertIsNotNone(graph)
+
+    def test_inbound_with_single_feeder_aggregated_per_day(self):
+        setup_feeder_data()
+        actual_report = self.analysis.get_report_as_text(aggregation_window=datetime.timedelta(days=1))
+        statistics, aggregated = actual_report.split("\n\n")
+        self.assertEqual(statistics + "\n", self.analysis.get_report_as_text())
+        self.assertTrue(aggregated.startswith("aggregated per 1 day, 0:00:00\n"))
+        self.assertIn("3.0\n", aggregated)
+
+    def test_graph_with_single_feeder_aggregated(self):
+        setup_feeder_data()
+        graph = self.analysis.get_report_as_graph(aggregation_window=datetime.timedelta(hours=6))
+        self.assertEqual(len(graph.collections), 1)
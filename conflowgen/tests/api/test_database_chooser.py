@@ -1,7 +1,11 @@
+import datetime
+import tempfile
 import unittest
 import unittest.mock
 
-from conflowgen import DatabaseChooser
+from conflowgen import DatabaseChooser, ContainerFlowGenerationManager, PortCallManager, ModeOfTransport
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
 from conflowgen.api.database_chooser import NoCurrentConnectionException
 from conflowgen.domain_models.distribution_models.mode_of_transport_distribution import ModeOfTransportDistribution
 from conflowgen.domain_models.distribution_seeders import mode_of_transport_distribution_seeder
@@ -57,3 +61,42 @@ class TestDatabaseChooser(unittest.TestCase):
     def test_close_current_connection_without_connection(self):
         with self.assertRaises(NoCurrentConnectionException):
             self.database_chooser.close_current_connection()
+
+    def test_clone_sqlite_database_with_and_without_flow(self):
+        with tempfile.TemporaryDirectory() as sqlite_databases_directory:
+            database_chooser = DatabaseChooser(sqlite_databases_directory=sqlite_databases_directory)
+            database_chooser.create_new_sqlite_database("source.sqlite")
+            container_flow_generation_manager = ContainerFlowGenerationManager()
+            container_flow_generation_manager.set_properties(
+                start_date=datetime.date(2021, 7, 1),
+                end_date=datetime.date(2021, 7, 15),
+                name="source scenario"
+            )
+            PortCallManager().add_vehicle(
+                vehicle_type=ModeOfTransport.feeder,
+                service_name="TestFeeder",
+                vehicle_arrives_at=datetime.date(2021, 7, 9),
+                vehicle_arrives_at_time=datetime.time(11),
+                average_vehicle_capacity=800,
+                average_moved_capacity=100,
+                next_destinations=None
+            )
+            container_flow_generation_manager.generate()
+            number_containers = Container.select().count()
+            self.assertGreater(number_containers, 0)
+
+            database_chooser.clone_sqlite_database("source.sqlite", "with-flow.sqlite", include_flow=True)
+            database_chooser.clone_sqlite_database("source.sqlite", "without-flow.sqlite")
+            database_chooser.close_current_connection()
+
+            database_chooser.load_existing_sqlite_database("with-flow.sqlite")
+            self.assertEqual(Container.select().count(), number_containers)
+            database_chooser.close_current_connection()
+
+            database_chooser.load_existing_sqlite_database("without-flow.sqlite")
+            self.assertEqual(Container.select().count(), 0)
+            self.assertEqual(Schedule.select().count(), 1)
+            self.assertEqual(ContainerFlowGenerationManager().get_properties()["name"], "source scenario")
+            ContainerFlowGenerationManager().generate()
+            self.assertGreater(Container.select().count(), 0)
+            database_chooser.close_current_connection()
@@ -0,0 +1,170 @@
+import datetime
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import matplotlib
+
+from conflowgen.analyses.inbound_and_outbound_vehicle_capacity_analysis_report import \
+    InboundAndOutboundVehicleCapacityAnalysisReport
+from conflowgen.analyses.yard_capacity_analysis_report import YardCapacityAnalysisReport
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.database_chooser import DatabaseChooser
+from conflowgen.api.export_reports_manager import ExportReportsManager
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.application.data_types.report_file_format import ReportFileFormat
+from conflowgen.application.services import export_reports_service
+from conflowgen.application.services.export_container_flow_service import \
+    ExportOnlyAllowedToNotExistingFolderException
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.previews.modal_split_preview_report import ModalSplitPreviewReport
+
+
+class FailingReport(ModalSplitPreviewReport):
+    """A report that cannot be determined, defined at module level so that the worker processes can import it"""
+
+    def get_report_as_text(self, **kwargs) -> str:
+        raise RuntimeError("The report cannot be determined")
+
+
+class TestExportReportsManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.database_chooser = DatabaseChooser(sqlite_databases_directory=self.temporary_directory.name)
+        self.database_chooser.create_new_sqlite_database("reports.sqlite")
+        container_flow_generation_manager = ContainerFlowGenerationManager()
+        container_flow_generation_manager.set_properties(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 15)
+        )
+        PortCallManager().add_vehicle(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeeder",
+            vehicle_arrives_at=datetime.date(2021, 7, 9),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=800,
+            average_moved_capacity=100,
+            next_destinations=None
+        )
+        container_flow_generation_manager.generate()
+        self.path_to_export_folder = os.path.join(self.temporary_directory.name, "exports")
+        self.manager = ExportReportsManager()
+
+    def tearDown(self) -> None:
+        self.database_chooser.close_current_connection()
+        self.temporary_directory.cleanup()
+
+    def test_export_all_reports_as_html(self):
+        path_to_index = self.manager.export(
+            "all", path_to_export_folder=self.path_to_export_folder, file_format=ReportFileFormat.html
+        )
+        path_to_folder = os.path.join(self.path_to_export_folder, "all")
+        self.assertEqual(path_to_index, os.path.join(path_to_folder, "index.html"))
+        with open(path_to_index, encoding="utf-8") as index_file:
+            index = index_file.read()
+        for report_name in ("ModalSplitPreviewReport", "YardCapacityAnalysisReport"):
+            self.assertTrue(os.path.isfile(os.path.join(path_to_folder, report_name + ".txt")))
+            self.assertTrue(os.path.isfile(os.path.join(path_to_folder, report_name + ".html")))
+            self.assertIn(f'id="{report_name}"', index)
+
+    def test_export_selected_reports_as_png(self):
+        reports = [ModalSplitPreviewReport, YardCapacityAnalysisReport]
+        self.manager.export("selected", path_to_export_folder=self.path_to_export_folder, reports=reports)
+        self.assertListEqual(
+            sorted(os.listdir(os.path.join(self.path_to_export_folder, "selected"))),
+            [
+                "ModalSplitPreviewReport.png",
+                "ModalSplitPreviewReport.txt",
+                "YardCapacityAnalysisReport.png",
+                "YardCapacityAnalysisReport.txt",
+                "index.html",
+            ]
+        )
+
+    def test_export_with_several_workers_yields_same_text(self):
+        reports = [InboundAndOutboundVehicleCapacityAnalysisReport, YardCapacityAnalysisReport]
+        for folder_name, max_workers in (("serial", 1), ("parallel", 2)):
+            self.manager.export(
+                folder_name, path_to_export_folder=self.path_to_export_folder, reports=reports,
+                max_workers=max_workers
+            )
+        for report in reports:
+            texts = []
+            for folder_name in ("serial", "parallel"):
+                path_to_file = os.path.join(self.path_to_export_folder, folder_name, report.__name__ + ".txt")
+                with open(path_to_file, encoding="utf-8") as text_file:
+                    texts.append(text_file.read())
+            self.assertEqual(texts[0], texts[1])
+            self.assertTrue(os.path.isfile(
+                os.path.join(self.path_to_export_folder, "parallel", report.__name__ + ".png")
+            ))
+
+    def test_failing_report_does_not_stop_the_others(self):
+        reports = [FailingReport, ModalSplitPreviewReport]
+        for folder_name, max_workers in (("serial", 1), ("parallel", 2)):
+            path_to_index = self.manager.export(
+                folder_name, path_to_export_folder=self.path_to_export_folder, reports=reports,
+                max_workers=max_workers
+            )
+            with open(path_to_index, encoding="utf-8") as index_file:
+                self.assertIn("RuntimeError: The report cannot be determined", index_file.read())
+            path_to_folder = os.path.join(self.path_to_export_folder, folder_name)
+            self.assertFalse(os.path.isfile(os.path.join(path_to_folder, "FailingReport.png")))
+            self.assertTrue(os.path.isfile(os.path.join(path_to_folder, "ModalSplitPreviewReport.png")))
+
+    def test_container_times_are_cached_before_rendering(self):
+        Container.update(cached_arrival_time=None, cached_departure_time=None).execute()
+        self.manager.export("cached", path_to_export_folder=self.path_to_export_folder, reports=[])
+        self.assertEqual(
+            Container.select().where(
+                Container.cached_arrival_time.is_null() | Container.cached_departure_time.is_null()
+            ).count(),
+            0
+        )
+        for container in Container.select():
+            if container.picked_up_by_truck is not None:
+                expected_departure_time = \
+                    container.picked_up_by_truck.truck_arrival_information_for_pickup.realized_container_pickup_time
+            else:
+                expected_departure_time = container.picked_up_by_large_scheduled_vehicle.scheduled_arrival
+            self.assertEqual(container.cached_departure_time, expected_departure_time)
+            if container.delivered_by_truck is not None:
+                expected_arrival_time = \
+                    container.delivered_by_truck.truck_arrival_information_for_delivery.realized_container_delivery_time
+            else:
+                expected_arrival_time = container.delivered_by_large_scheduled_vehicle.scheduled_arrival
+            self.assertEqual(container.cached_arrival_time, expected_arrival_time)
+
+    def test_serial_export_draws_without_display(self):
+        used_backends = []
+
+        def render_report(*args):
+            used_backends.append(matplotlib.get_backend().lower())
+            return original_render_report(*args)
+
+        original_render_report = export_reports_service._render_report  # pylint: disable=protected-access
+        previous_backend = matplotlib.get_backend()
+        matplotlib.use("pdf")
+        try:
+            with unittest.mock.patch.object(export_reports_service, "_render_report", side_effect=render_report):
+                self.manager.export(
+                    "serial", path_to_export_folder=self.path_to_export_folder, reports=[ModalSplitPreviewReport]
+                )
+            self.assertListEqual(used_backends, ["agg"])
+            self.assertEqual(matplotlib.get_backend().lower(), "pdf")
+        finally:
+            matplotlib.use(previous_backend)
+
+    def test_do_not_overwrite_by_default(self):
+        reports = [ModalSplitPreviewReport]
+        self.manager.export("once", path_to_export_folder=self.path_to_export_folder, reports=reports)
+        with self.assertRaises(ExportOnlyAllowedToNotExistingFolderException):
+            self.manager.export("once", path_to_export_folder=self.path_to_export_folder, reports=reports)
+        self.manager.export("once", path_to_export_folder=self.path_to_export_folder, reports=reports, overwrite=True)
+
+    def test_reject_no_workers(self):
+        with self.assertRaises(ValueError):
+            self.manager.export("none", path_to_export_folder=self.path_to_export_folder, max_workers=0)
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+import unittest
+
+import conflowgen
+import conflowgen.analyses
+import conflowgen.previews
+
+
+class TestLazyAttributes(unittest.TestCase):
+
+    def test_import_does_not_load_plotting_libraries(self):
+        code = "import sys\nimport conflowgen\nprint(sorted(set(sys.modules) & {'matplotlib', 'plotly', 'scipy'}))"
+        loaded_modules = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        self.assertEqual(loaded_modules, "[]")
+
+    def test_reports_are_resolved_on_access(self):
+        # pylint: disable=import-outside-toplevel
+        from conflowgen.analyses.yard_capacity_analysis_report import YardCapacityAnalysisReport
+        from conflowgen.previews.modal_split_preview_report import ModalSplitPreviewReport
+        self.assertIs(conflowgen.YardCapacityAnalysisReport, YardCapacityAnalysisReport)
+        self.assertIs(conflowgen.ModalSplitPreviewReport, ModalSplitPreviewReport)
+        self.assertIn("YardCapacityAnalysisReport", dir(conflowgen))
+
+    def test_reports_keep_their_order(self):
+        self.assertEqual(len(conflowgen.previews.reports), 5)
+        self.assertEqual(len(conflowgen.analyses.reports), 11)
+        self.assertEqual(conflowgen.analyses.reports[0].__name__, "InboundAndOutboundVehicleCapacityAnalysisReport")
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            getattr(conflowgen, "NotExistingReport")
+        with self.assertRaises(AttributeError):
+            getattr(conflowgen.previews, "NotExistingReport")
@@ -0,0 +1,112 @@
+import datetime
+import unittest
+
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.mode_of_transport_distribution_manager import ModeOfTransportDistributionManager
+from conflowgen.application.services.mode_of_transport_distribution_calibration_service import \
+    NoFeasibleModeOfTransportDistributionException
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.previews.modal_split_preview import ModalSplitPreview
+from conflowgen.previews.vehicle_capacity_exceeded_preview import VehicleCapacityExceededPreview
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestModeOfTransportDistributionManager__Calibrate(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        self.start_date = datetime.date(2021, 7, 1)
+        self.end_date = datetime.date(2021, 7, 29)
+        ContainerFlowGenerationManager().set_properties(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            transportation_buffer=0.2
+        )
+        for vehicle_type, average_vehicle_capacity, average_moved_capacity in (
+                (ModeOfTransport.deep_sea_vessel, 12000, 1500),
+                (ModeOfTransport.feeder, 1000, 600),
+                (ModeOfTransport.barge, 300, 200),
+                (ModeOfTransport.train, 400, 300),
+        ):
+            Schedule.create(
+                vehicle_type=vehicle_type,
+                service_name=f"Test{vehicle_type.value}",
+                vehicle_arrives_at=self.start_date,
+                vehicle_arrives_at_time=datetime.time(11),
+                average_vehicle_capacity=average_vehicle_capacity,
+                average_moved_capacity=average_moved_capacity,
+                vehicle_arrives_every_k_days=7
+            )
+        self.manager = ModeOfTransportDistributionManager()
+
+    def test_calibrate_to_targets(self):
+        hinterland_modal_split = {
+            ModeOfTransport.train: 0.2,
+            ModeOfTransport.barge: 0.1,
+            ModeOfTransport.truck: 0.7
+        }
+        calibrated_distribution = self.manager.calibrate_mode_of_transport_distribution(
+            hinterland_modal_split=hinterland_modal_split,
+            transshipment_share=0.3,
+            tolerance=0.01
+        )
+        self.manager.set_mode_of_transport_distribution(calibrated_distribution)
+
+        comparison = VehicleCapacityExceededPreview(self.start_date, self.end_date, 0.2).compare()
+        for vehicle_type, required_and_maximum_capacity in comparison.items():
+            self.assertFalse(required_and_maximum_capacity.exceeded, vehicle_type)
+
+        modal_split_preview = ModalSplitPreview(self.start_date, self.end_date, 0.2)
+        modal_split = modal_split_preview.get_modal_split_for_hinterland(inbound=True, outbound=True)
+        hinterland_volume = sum(modal_split)
+        self.assertAlmostEqual(modal_split.train_capacity / hinterland_volume, 0.2, delta=0.01)
+        self.assertAlmostEqual(modal_split.barge_capacity / hinterland_volume, 0.1, delta=0.01)
+        self.assertAlmostEqual(modal_split.truck_capacity / hinterland_volume, 0.7, delta=0.01)
+        split = modal_split_preview.get_transshipment_and_hinterland_split()
+        self.assertAlmostEqual(
+            split.transshipment_capacity / (split.transshipment_capacity + split.hinterland_capacity), 0.3, delta=0.01
+        )
+
+    def test_keep_zero_entries(self):
+        current_distribution = self.manager.get_mode_of_transport_distribution()
+        calibrated_distribution = self.manager.calibrate_mode_of_transport_distribution(transshipment_share=0.3)
+        for inbound_vehicle_type, distribution_of_inbound_vehicle_type in current_distribution.items():
+            for outbound_vehicle_type, fraction in distribution_of_inbound_vehicle_type.items():
+                if fraction == 0:
+                    self.assertEqual(calibrated_distribution[inbound_vehicle_type][outbound_vehicle_type], 0)
+            self.assertAlmostEqual(sum(calibrated_distribution[inbound_vehicle_type].values()), 1)
+
+    def test_resolve_exceeded_capacity_without_targets(self):
+        comparison = VehicleCapacityExceededPreview(self.start_date, self.end_date, 0.2).compare()
+        self.assertTrue(comparison[ModeOfTransport.train].exceeded)
+        self.assertTrue(comparison[ModeOfTransport.feeder].exceeded)
+
+        self.manager.set_mode_of_transport_distribution(self.manager.calibrate_mode_of_transport_distribution())
+        comparison = VehicleCapacityExceededPreview(self.start_date, self.end_date, 0.2).compare()
+        for vehicle_type, required_and_maximum_capacity in comparison.items():
+            self.assertFalse(required_and_maximum_capacity.exceeded, vehicle_type)
+
+    def test_unreachable_target(self):
+        # Containers delivered by barges and trains are never transshipped from vessel to vessel
+        with self.assertRaises(NoFeasibleModeOfTransportDistributionException):
+            self.manager.calibrate_mode_of_transport_distribution(transshipment_share=1)
+
+    def test_invalid_targets(self):
+        with self.assertRaises(ValueError):
+            self.manager.calibrate_mode_of_transport_distribution(
+                hinterland_modal_split={ModeOfTransport.train: 0.5, ModeOfTransport.truck: 0.5}
+            )
+        with self.assertRaises(ValueError):
+            self.manager.calibrate_mode_of_transport_distribution(
+                hinterland_modal_split={
+                    ModeOfTransport.train: 0.5, ModeOfTransport.barge: 0.5, ModeOfTransport.truck: 0.5
+                }
+            )
+        with self.assertRaises(ValueError):
+            self.manager.calibrate_mode_of_transport_distribution(transshipment_share=1.5)
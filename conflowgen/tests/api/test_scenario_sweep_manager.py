@@ -0,0 +1,66 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.database_chooser import DatabaseChooser
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.api.scenario_sweep_manager import ScenarioSweepManager
+from conflowgen.application.services.scenario_sweep_service import UnknownScenarioSettingException
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+
+
+class TestScenarioSweepManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.database_chooser = DatabaseChooser(sqlite_databases_directory=self.temporary_directory.name)
+        self.database_chooser.create_new_sqlite_database("base.sqlite")
+        ContainerFlowGenerationManager().set_properties(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 15)
+        )
+        PortCallManager().add_vehicle(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeeder",
+            vehicle_arrives_at=datetime.date(2021, 7, 9),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=800,
+            average_moved_capacity=100,
+            next_destinations=None
+        )
+        self.database_chooser.close_current_connection()
+        self.manager = ScenarioSweepManager(sqlite_databases_directory=self.temporary_directory.name)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_reject_unknown_setting(self):
+        with self.assertRaises(UnknownScenarioSettingException):
+            self.manager.run("base.sqlite", {"a": {"unknown_setting": 1}})
+
+    def test_run_two_variants(self):
+        results = self.manager.run(
+            "base.sqlite",
+            {
+                "low-buffer": {"transportation_buffer": 0},
+                "high-buffer": {"transportation_buffer": 0.5},
+            },
+            max_workers=2
+        )
+        self.assertListEqual(list(results.keys()), ["low-buffer", "high-buffer"])
+        for variant_name, result in results.items():
+            self.assertEqual(result.variant_name, variant_name)
+            self.assertEqual(result.file_name, f"base__{variant_name}.sqlite")
+            self.assertTrue(os.path.isfile(os.path.join(self.temporary_directory.name, result.file_name)))
+            self.assertGreater(result.transshipment_and_hinterland_split.hinterland_capacity, 0)
+
+        self.database_chooser.load_existing_sqlite_database("base__high-buffer.sqlite")
+        self.assertEqual(ContainerFlowGenerationManager().get_properties()["transportation_buffer"], 0.5)
+        self.assertTrue(ContainerFlowGenerationManager().container_flow_data_exists())
+        self.database_chooser.close_current_connection()
+
+        self.database_chooser.load_existing_sqlite_database("base.sqlite")
+        self.assertFalse(ContainerFlowGenerationManager().container_flow_data_exists())
+        self.database_chooser.close_current_connection()
@@ -0,0 +1,79 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
+from conflowgen.benchmarks import BenchmarkScenario, run_benchmark, compare_benchmark_results, \
+    save_benchmark_results, load_benchmark_results, add_scenario_to_current_database, measure_import_time
+from conflowgen.benchmarks.__main__ import main
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestBenchmark(unittest.TestCase):
+
+    scenario = BenchmarkScenario(name="test", days=3, number_of_services=2)
+
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_scenario_spreads_services_over_vehicle_types(self):
+        sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(sqlite_db)
+        seed_all_distributions()
+        add_scenario_to_current_database(BenchmarkScenario(name="test", days=7, number_of_services=10))
+        self.assertEqual(Schedule.select().count(), 10)
+        self.assertSetEqual(
+            {schedule.vehicle_type for schedule in Schedule.select()},
+            {ModeOfTransport.deep_sea_vessel, ModeOfTransport.feeder, ModeOfTransport.barge, ModeOfTransport.train}
+        )
+        for schedule in Schedule.select():
+            self.assertLessEqual(schedule.average_moved_capacity, schedule.average_vehicle_capacity)
+
+    def test_run_and_compare(self):
+        results = run_benchmark(self.scenario, sqlite_databases_directory=self.temporary_directory.name)
+        self.assertGreater(results["counts"]["containers"], 0)
+        self.assertSetEqual(
+            set(results["durations"]["generation"]["phases"].keys()),
+            {phase.value for phase in ContainerFlowGenerationPhase}
+        )
+        self.assertIn("ContainerDwellTimeAnalysisReport", results["durations"]["analyses"])
+        self.assertSetEqual(set(results["durations"]["export"].keys()), {"csv", "sqlite"})
+        self.assertSetEqual(set(results["durations"]["import"].keys()), {"conflowgen", "reports"})
+
+        path_to_results = os.path.join(self.temporary_directory.name, "results.json")
+        save_benchmark_results(results, path_to_results)
+        loaded_results = load_benchmark_results(path_to_results)
+        self.assertEqual(json.dumps(results, sort_keys=True), json.dumps(loaded_results, sort_keys=True))
+        comparison = compare_benchmark_results(loaded_results, results)
+        self.assertIn("generation.phases.fleet_creation", comparison)
+        self.assertIn("1.00", comparison)
+
+    def test_measure_import_time(self):
+        durations = measure_import_time(repetitions=1)
+        self.assertSetEqual(set(durations.keys()), {"conflowgen", "reports"})
+        for duration in durations.values():
+            self.assertGreater(duration, 0)
+
+    def test_command_line_interface(self):
+        path_to_results = os.path.join(self.temporary_directory.name, "results.json")
+        with unittest.mock.patch("conflowgen.benchmarks.__main__.run_benchmark") as mock_run_benchmark:
+            mock_run_benchmark.return_value = {
+                "scenario": {"name": "tiny-custom"}, "counts": {}, "durations": {"generation": {"total": 1.0}}
+            }
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                main(["--days", "3", "--services", "1", "--output", path_to_results])
+        scenario = mock_run_benchmark.call_args.args[0]
+        self.assertEqual(scenario, BenchmarkScenario(name="tiny-custom", days=3, number_of_services=1))
+        self.assertIn("generation.total", output.getvalue())
+        self.assertEqual(load_benchmark_results(path_to_results)["scenario"]["name"], "tiny-custom")
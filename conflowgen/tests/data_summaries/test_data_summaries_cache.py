@@ -516,3 +516,18 @@ class TestDataSummariesCache(unittest.TestCase):
         self.assertTrue(4 in list(DataSummariesCache.cached_results.values()), "Both results should be cached")
         # pylint: disable=protected-access
         self.assertEqual(DataSummariesCache._hit_counter['method'], 3)
+
+    def test_lookup_statistics_survive_reset(self):
+        @DataSummariesCache.cache_result
+        def double(number):
+            return number * 2
+
+        lookups_before, misses_before = DataSummariesCache.get_lookup_statistics()
+        double(1)
+        double(1)
+        double(2)
+        DataSummariesCache.reset_cache()
+        double(1)
+        lookups, misses = DataSummariesCache.get_lookup_statistics()
+        self.assertEqual(lookups - lookups_before, 4)
+        self.assertEqual(misses - misses_before, 3)
@@ -0,0 +1,24 @@
+import os
+import tempfile
+import unittest
+
+from peewee import SqliteDatabase
+
+from conflowgen.database_connection.current_database import get_path_to_current_database
+from conflowgen.domain_models.base_model import database_proxy
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestCurrentDatabase(unittest.TestCase):
+
+    def test_database_in_memory(self):
+        setup_sqlite_in_memory_db()
+        self.assertIsNone(get_path_to_current_database())
+
+    def test_database_on_disk(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path_to_database = os.path.join(temporary_directory, "test.sqlite")
+            sqlite_db = SqliteDatabase(path_to_database)
+            database_proxy.initialize(sqlite_db)
+            self.assertEqual(get_path_to_current_database(), path_to_database)
+            sqlite_db.close()
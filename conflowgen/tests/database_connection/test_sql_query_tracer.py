@@ -0,0 +1,90 @@
+import datetime
+import unittest
+
+from conflowgen.api.database_chooser import DatabaseChooser, NoCurrentConnectionException
+from conflowgen.database_connection.sql_query_tracer import SqlQueryTracer, normalize_sql
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestSqlQueryTracer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        self.sqlite_db.create_tables([Schedule])
+        for i in range(5):
+            Schedule.create(
+                vehicle_type=ModeOfTransport.feeder,
+                service_name=f"TestFeederService{i}",
+                vehicle_arrives_at=datetime.date(2021, 7, 9),
+                vehicle_arrives_at_time=datetime.time(11),
+                average_vehicle_capacity=300,
+                average_moved_capacity=250
+            )
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            normalize_sql('SELECT  "t1"."id"\n FROM "schedule" AS "t1" WHERE ("t1"."id" IN (?, ?, ?)) LIMIT 1'),
+            'SELECT "t1"."id" FROM "schedule" AS "t1" WHERE ("t1"."id" IN (...)) LIMIT ?'
+        )
+        self.assertEqual(
+            normalize_sql("SELECT * FROM \"schedule\" WHERE \"service_name\" = 'a''b' AND \"id\" IN (?, ?)"),
+            normalize_sql("SELECT * FROM \"schedule\" WHERE \"service_name\" = 'c' AND \"id\" IN (?, ?, ?, ?)")
+        )
+        self.assertEqual(
+            normalize_sql('INSERT INTO "schedule" ("a", "b") VALUES (?, ?), (?, ?), (?, ?)'),
+            'INSERT INTO "schedule" ("a", "b") VALUES (...), ...'
+        )
+
+    def test_detect_n_plus_one_pattern(self):
+        with SqlQueryTracer(self.sqlite_db) as tracer:
+            schedule_ids = [schedule.id for schedule in Schedule.select()]
+            for schedule_id in schedule_ids:
+                Schedule.get_by_id(schedule_id)
+        statistics = tracer.get_statistics(order_by="count")
+        self.assertEqual(len(statistics), 2)
+        most_frequent_statement = statistics[0]
+        self.assertEqual(most_frequent_statement.count, 5)
+        self.assertIn('FROM "schedule"', most_frequent_statement.normalized_sql)
+        self.assertGreaterEqual(most_frequent_statement.total_time, 0)
+        self.assertEqual(len(most_frequent_statement.locations), 1)
+        location, count = most_frequent_statement.locations[0]
+        self.assertIn("test_sql_query_tracer.py", location)
+        self.assertIn("test_detect_n_plus_one_pattern", location)
+        self.assertEqual(count, 5)
+
+    def test_stop_restores_database(self):
+        tracer = SqlQueryTracer(self.sqlite_db)
+        tracer.start()
+        self.assertTrue(tracer.is_active)
+        Schedule.select().count()
+        tracer.stop()
+        self.assertFalse(tracer.is_active)
+        self.assertNotIn("execute_sql", vars(self.sqlite_db))
+        Schedule.select().count()
+        self.assertEqual(sum(query_statistics.count for query_statistics in tracer.get_statistics()), 1)
+        tracer.reset()
+        self.assertListEqual(tracer.get_statistics(), [])
+
+    def test_parameters_are_passed_on(self):
+        with SqlQueryTracer(self.sqlite_db) as tracer:
+            self.assertEqual(self.sqlite_db.execute_sql("SELECT ?", (1, )).fetchone(), (1, ))
+            self.assertEqual(self.sqlite_db.execute_sql("SELECT ? + 1", params=(1, )).fetchone(), (2, ))
+        self.assertEqual(sum(query_statistics.count for query_statistics in tracer.get_statistics()), 2)
+
+    def test_report(self):
+        with SqlQueryTracer(self.sqlite_db) as tracer:
+            for schedule in Schedule.select():
+                Schedule.get_by_id(schedule.id)
+        report = tracer.get_report(top_n=1, order_by="count")
+        self.assertTrue(report.startswith("6 statements (2 distinct)"), report)
+        self.assertIn("top 1 by count", report)
+        self.assertIn("5x from", report)
+        with self.assertRaises(ValueError):
+            tracer.get_report(order_by="mean")
+
+    def test_database_chooser_requires_connection(self):
+        with self.assertRaises(NoCurrentConnectionException):
+            DatabaseChooser().trace_queries()
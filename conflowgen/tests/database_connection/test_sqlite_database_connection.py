@@ -1,7 +1,8 @@
 import unittest
 
 from conflowgen.database_connection.sqlite_database_connection import SqliteDatabaseConnection, \
-    SqliteDatabaseIsMissingException
+    SqliteDatabaseIsMissingException, SqliteDatabaseAlreadyExistsException
+from conflowgen.domain_models.distribution_models.mode_of_transport_distribution import ModeOfTransportDistribution
 
 
 class TestSqliteDatabaseConnection(unittest.TestCase):
@@ -70,3 +71,36 @@ class TestSqliteDatabaseConnection(unittest.TestCase):
         successfully_closed_2 = sqlite_db_connection_2.close()
         self.assertTrue(successfully_closed_2)
         self.sqlite_database_connection.delete_database(test_database_name)
+
+    def test_copy_database(self):
+        source_database_name = "testing-existent--test_copy_database.sqlite"
+        target_database_name = "testing-existent--test_copy_database--copy.sqlite"
+        for database_name in (source_database_name, target_database_name):
+            if database_name in self.sqlite_database_connection.list_all_sqlite_databases():
+                self.sqlite_database_connection.delete_database(database_name)
+        sqlite_db_connection_1 = self.sqlite_database_connection.choose_database(
+            source_database_name,
+            create=True,
+            reset=False
+        )
+        number_entries = ModeOfTransportDistribution.select().count()
+        self.assertGreater(number_entries, 0)
+
+        self.sqlite_database_connection.copy_database(source_database_name, target_database_name)
+        with self.assertRaises(SqliteDatabaseAlreadyExistsException):
+            self.sqlite_database_connection.copy_database(source_database_name, target_database_name)
+        sqlite_db_connection_1.close()
+
+        sqlite_db_connection_2 = self.sqlite_database_connection.choose_database(
+            target_database_name,
+            create=False,
+            reset=False
+        )
+        self.assertEqual(ModeOfTransportDistribution.select().count(), number_entries)
+        sqlite_db_connection_2.close()
+        self.sqlite_database_connection.delete_database(source_database_name)
+        self.sqlite_database_connection.delete_database(target_database_name)
+
+    def test_reject_copy_of_missing_database(self):
+        with self.assertRaises(SqliteDatabaseIsMissingException):
+            self.sqlite_database_connection.copy_database("not-existent.sqlite", "not-existent-copy.sqlite")
@@ -0,0 +1,72 @@
+import unittest
+
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.database_connection.sql_query_tracer import SqlQueryTracer
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.container_dwell_time_distribution_repository import \
+    ContainerDwellTimeDistributionRepository
+from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
+    ContainerLengthDistributionRepository
+from conflowgen.domain_models.distribution_repositories.distribution_cache import DistributionCache
+from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
+    ModeOfTransportDistributionRepository
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestDistributionCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+
+    def test_each_distribution_is_loaded_with_one_query(self):
+        DistributionCache.invalidate()
+        with SqlQueryTracer(self.sqlite_db) as tracer:
+            ModeOfTransportDistributionRepository.get_distribution()
+            ContainerDwellTimeDistributionRepository.get_distributions()
+        self.assertEqual(sum(query_statistics.count for query_statistics in tracer.get_statistics()), 2)
+
+        tracer.reset()
+        with tracer:
+            ModeOfTransportDistributionRepository.get_distribution()
+            ContainerDwellTimeDistributionRepository.get_distributions()
+        self.assertListEqual(tracer.get_statistics(), [])
+
+    def test_setter_invalidates_cache(self):
+        version = DistributionCache.version
+        ContainerLengthDistributionRepository.get_distribution()
+        ContainerLengthDistributionRepository.set_distribution({
+            ContainerLength.twenty_feet: 1,
+            ContainerLength.forty_feet: 0,
+            ContainerLength.forty_five_feet: 0,
+            ContainerLength.other: 0
+        })
+        self.assertGreater(DistributionCache.version, version)
+        self.assertEqual(ContainerLengthDistributionRepository.get_distribution()[ContainerLength.twenty_feet], 1)
+        self.assertEqual(ContainerLengthDistributionRepository.get_teu_factor(), 1)
+
+    def test_callers_receive_copies(self):
+        distribution = ModeOfTransportDistributionRepository.get_distribution()
+        distribution[ModeOfTransport.truck][ModeOfTransport.feeder] = 42
+        self.assertNotEqual(
+            ModeOfTransportDistributionRepository.get_distribution()[ModeOfTransport.truck][ModeOfTransport.feeder],
+            42
+        )
+
+    def test_other_database_is_not_answered_from_cache(self):
+        ContainerLengthDistributionRepository.set_distribution({
+            ContainerLength.twenty_feet: 1,
+            ContainerLength.forty_feet: 0,
+            ContainerLength.forty_five_feet: 0,
+            ContainerLength.other: 0
+        })
+        self.assertEqual(ContainerLengthDistributionRepository.get_teu_factor(), 1)
+
+        other_sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(other_sqlite_db)
+        seed_all_distributions()
+        self.assertGreater(ContainerLengthDistributionRepository.get_teu_factor(), 1)
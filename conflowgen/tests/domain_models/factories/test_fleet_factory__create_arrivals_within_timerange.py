@@ -3,9 +3,14 @@ Check if time ranges are working
 """
 
 import datetime
+import itertools
 import unittest
 
-from conflowgen.domain_models.factories.fleet_factory import create_arrivals_within_time_range
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.factories.fleet_factory import create_arrivals_within_time_range, \
+    create_arrivals_of_schedules
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
 
 
 class TestVehicleFactory__create_arrivals_within_time_range(unittest.TestCase):  # pylint: disable=invalid-name
@@ -96,3 +101,126 @@ class TestVehicleFactory__create_arrivals_within_time_range(unittest.TestCase):
             datetime.time(15, 0)
         )
         self.assertEqual(len(arrivals), 0)
+
+    def test_create_time_range_with_daily_vehicle(self) -> None:
+        arrivals = create_arrivals_within_time_range(
+            datetime.date(2021, 7, 7),
+            datetime.date(2021, 7, 1),
+            datetime.date(2021, 7, 10),
+            1,
+            datetime.time(15, 0)
+        )
+        self.assertListEqual(
+            arrivals,
+            [datetime.datetime(2021, 7, day, 15) for day in range(7, 11)]
+        )
+
+    def test_create_time_range_with_invalid_interval(self) -> None:
+        # Before, these intervals silently led to no arrivals at all
+        for vehicle_arrives_every_k_days in (0, -2, -7):
+            with self.subTest(vehicle_arrives_every_k_days=vehicle_arrives_every_k_days):
+                with self.assertRaises(ValueError):
+                    create_arrivals_within_time_range(
+                        datetime.date(2021, 7, 7),
+                        datetime.date(2021, 7, 8),
+                        datetime.date(2021, 7, 18),
+                        vehicle_arrives_every_k_days,
+                        datetime.time(15, 0)
+                    )
+
+
+class TestVehicleFactory__create_arrivals_of_schedules(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        self.sqlite_db.create_tables([Schedule])
+
+    def test_same_arrivals_as_for_single_schedule(self) -> None:
+        range_starts_at = datetime.date(2021, 7, 7)
+        range_ends_at = datetime.date(2021, 7, 30)
+        fixed_arrivals = [datetime.date(2021, 6, 20), datetime.date(2021, 7, 7), datetime.date(2021, 7, 15),
+                          datetime.date(2021, 7, 30), datetime.date(2021, 8, 10)]
+        intervals = [-1, 1, 3, 7, 10, 30]
+        for i, (vehicle_arrives_at, vehicle_arrives_every_k_days) in enumerate(
+                itertools.product(fixed_arrivals, intervals)
+        ):
+            Schedule.create(
+                vehicle_type=ModeOfTransport.feeder,
+                service_name=f"TestService{i}",
+                vehicle_arrives_at=vehicle_arrives_at,
+                vehicle_arrives_at_time=datetime.time(i % 24, 30),
+                average_vehicle_capacity=800,
+                average_moved_capacity=300,
+                vehicle_arrives_every_k_days=vehicle_arrives_every_k_days
+            )
+
+        arrivals_of_schedules = create_arrivals_of_schedules(range_starts_at, range_ends_at)
+
+        schedule: Schedule
+        for schedule in Schedule.select():
+            expected_arrivals = create_arrivals_within_time_range(
+                range_starts_at,
+                schedule.vehicle_arrives_at,
+                range_ends_at,
+                schedule.vehicle_arrives_every_k_days,
+                schedule.vehicle_arrives_at_time
+            )
+            with self.subTest(schedule=schedule.service_name):
+                self.assertEqual(arrivals_of_schedules.get_number_of_arrivals(schedule.id), len(expected_arrivals))
+                self.assertListEqual(arrivals_of_schedules.get_arrivals(schedule.id), expected_arrivals)
+
+    def test_result_is_cached_per_schedules_and_time_range(self) -> None:
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestService",
+            vehicle_arrives_at=datetime.date(2021, 7, 8),
+            vehicle_arrives_at_time=datetime.time(15),
+            average_vehicle_capacity=800,
+            average_moved_capacity=300,
+            vehicle_arrives_every_k_days=7
+        )
+        range_starts_at = datetime.date(2021, 7, 7)
+        range_ends_at = datetime.date(2021, 7, 30)
+        arrivals_of_schedules = create_arrivals_of_schedules(range_starts_at, range_ends_at)
+        self.assertIs(create_arrivals_of_schedules(range_starts_at, range_ends_at), arrivals_of_schedules)
+        self.assertEqual(arrivals_of_schedules.get_number_of_arrivals(schedule.id), 4)
+
+        schedule.vehicle_arrives_every_k_days = 3
+        schedule.save()
+        self.assertEqual(
+            create_arrivals_of_schedules(range_starts_at, range_ends_at).get_number_of_arrivals(schedule.id), 8
+        )
+        self.assertEqual(
+            create_arrivals_of_schedules(range_starts_at, datetime.date(2021, 7, 9)).get_number_of_arrivals(
+                schedule.id), 1
+        )
+
+    def _create_schedule(self, vehicle_arrives_every_k_days: int) -> Schedule:
+        return Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestService",
+            vehicle_arrives_at=datetime.date(2021, 7, 1),
+            vehicle_arrives_at_time=datetime.time(15),
+            average_vehicle_capacity=800,
+            average_moved_capacity=300,
+            vehicle_arrives_every_k_days=vehicle_arrives_every_k_days
+        )
+
+    def test_daily_schedule(self) -> None:
+        schedule = self._create_schedule(1)
+        arrivals_of_schedules = create_arrivals_of_schedules(datetime.date(2021, 7, 7), datetime.date(2021, 7, 10))
+        self.assertListEqual(
+            arrivals_of_schedules.get_arrivals(schedule.id),
+            [datetime.datetime(2021, 7, day, 15) for day in range(7, 11)]
+        )
+
+    def test_schedule_with_invalid_interval(self) -> None:
+        self._create_schedule(0)
+        with self.assertRaises(ValueError):
+            create_arrivals_of_schedules(datetime.date(2021, 7, 7), datetime.date(2021, 7, 10))
+
+    def test_unknown_schedule(self) -> None:
+        arrivals_of_schedules = create_arrivals_of_schedules(datetime.date(2021, 7, 7), datetime.date(2021, 7, 30))
+        with self.assertRaises(KeyError):
+            arrivals_of_schedules.get_number_of_arrivals(1)
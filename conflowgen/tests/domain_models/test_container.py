@@ -2,6 +2,7 @@
 Check if containers can be stored in the database, i.e., the ORM model is working.
 """
 
+import datetime
 import unittest
 from dataclasses import dataclass
 
@@ -150,3 +151,21 @@ class TestContainer(unittest.TestCase):
 
         with self.assertRaises(NoPickupVehicleException):
             container.get_departure_time()
+
+    def test_cached_times_are_used(self):
+        cached_arrival_time = datetime.datetime(2021, 7, 1, 10)
+        cached_departure_time = datetime.datetime(2021, 7, 5, 12)
+        container = Container.create(
+            weight=10,
+            delivered_by=ModeOfTransport.truck,
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.feeder,
+            length=ContainerLength.forty_feet,
+            storage_requirement=StorageRequirement.standard,
+            cached_arrival_time=cached_arrival_time,
+            cached_departure_time=cached_departure_time
+        )
+
+        # Neither the truck nor the feeder exist, thus the points in time can only be taken from the cache
+        self.assertEqual(container.get_arrival_time(), cached_arrival_time)
+        self.assertEqual(container.get_departure_time(), cached_departure_time)
@@ -0,0 +1,181 @@
+import datetime
+import unittest
+import unittest.mock
+
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
+from conflowgen.application.models.container_flow_generation_checkpoint import ContainerFlowGenerationCheckpoint
+from conflowgen.application.repositories.container_flow_generation_checkpoint_repository import \
+    ContainerFlowGenerationCheckpointRepository
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck
+from conflowgen.flow_generator.container_flow_generation_service import ContainerFlowGenerationService, \
+    MissingCheckpointException
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerFlowGeneratorService__Checkpoints(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        ContainerFlowGenerationManager().set_properties(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 20)
+        )
+        port_call_manager = PortCallManager()
+        for vehicle_type, service_name in (
+                (ModeOfTransport.feeder, "TestFeeder"),
+                (ModeOfTransport.deep_sea_vessel, "TestDeepSeaVessel")
+        ):
+            port_call_manager.add_vehicle(
+                vehicle_type=vehicle_type,
+                service_name=service_name,
+                vehicle_arrives_at=datetime.date(2021, 7, 9),
+                vehicle_arrives_at_time=datetime.time(11),
+                average_vehicle_capacity=800,
+                average_moved_capacity=100,
+                next_destinations=None
+            )
+        self.service = ContainerFlowGenerationService()
+        self.checkpoint_repository = ContainerFlowGenerationCheckpointRepository()
+
+    def _count_rows(self):
+        return {
+            "containers": Container.select().count(),
+            "trucks": Truck.select().count(),
+            "pickups": TruckArrivalInformationForPickup.select().count(),
+            "deliveries": TruckArrivalInformationForDelivery.select().count(),
+        }
+
+    def test_checkpoint_for_each_phase(self):
+        self.service.generate()
+        self.assertEqual(
+            ContainerFlowGenerationCheckpoint.select().count(),
+            len(ContainerFlowGenerationPhase)
+        )
+        self.assertEqual(
+            self.checkpoint_repository.get_last_completed_phase(),
+            ContainerFlowGenerationPhase.destination_assignment
+        )
+
+    def test_resume_after_interruption(self):
+        with unittest.mock.patch.dict(
+                self.service.phase_runners,
+                {ContainerFlowGenerationPhase.containers_delivered_by_truck: unittest.mock.Mock(
+                    side_effect=RuntimeError("interrupted")
+                )}
+        ):
+            with self.assertRaises(RuntimeError):
+                self.service.generate()
+        self.assertEqual(
+            self.checkpoint_repository.get_last_completed_phase(),
+            ContainerFlowGenerationPhase.trucks_for_import_containers
+        )
+        self.assertEqual(Container.select().where(Container.delivered_by == ModeOfTransport.truck).count(), 0)
+
+        self.service.generate(resume=True)
+        self.assertEqual(
+            self.checkpoint_repository.get_last_completed_phase(),
+            ContainerFlowGenerationPhase.destination_assignment
+        )
+        self.assertGreater(Container.select().where(Container.delivered_by == ModeOfTransport.truck).count(), 0)
+
+    def test_resume_after_interruption_while_removing_previous_data(self):
+        self.service.generate()
+        with unittest.mock.patch.object(
+                self.service, 'clear_previous_container_flow', side_effect=RuntimeError("interrupted")
+        ):
+            with self.assertRaises(RuntimeError):
+                self.service.generate()
+        self.assertIsNone(self.checkpoint_repository.get_last_completed_phase())
+
+        self.service.generate(resume=True)
+        self.assertEqual(
+            self.checkpoint_repository.get_last_completed_phase(),
+            ContainerFlowGenerationPhase.destination_assignment
+        )
+
+    def test_resume_with_nothing_left_to_do(self):
+        self.service.generate()
+        rows_before = self._count_rows()
+        with unittest.mock.patch.object(self.service, 'run_phase') as mock_run_phase:
+            self.service.generate(resume=True)
+        mock_run_phase.assert_not_called()
+        self.assertDictEqual(rows_before, self._count_rows())
+
+    def test_rerun_from_phase_keeps_upstream_data(self):
+        self.service.generate()
+        rows_before = self._count_rows()
+        container_ids_delivered_by_vessel = [
+            container.id for container in
+            Container.select().where(Container.delivered_by != ModeOfTransport.truck).order_by(Container.id)
+        ]
+        self.service.generate(from_phase=ContainerFlowGenerationPhase.trucks_for_import_containers)
+        self.assertDictEqual(rows_before, self._count_rows())
+        self.assertListEqual(
+            container_ids_delivered_by_vessel,
+            [
+                container.id for container in
+                Container.select().where(Container.delivered_by != ModeOfTransport.truck).order_by(Container.id)
+            ]
+        )
+        self.assertEqual(Container.select().where(
+            (Container.picked_up_by == ModeOfTransport.truck) & Container.picked_up_by_truck.is_null()
+        ).count(), 0)
+        self.assertEqual(Container.select().where(
+            (Container.delivered_by == ModeOfTransport.truck) & Container.delivered_by_truck.is_null()
+        ).count(), 0)
+
+    def test_rerun_from_phase_resets_capacity_flags(self):
+        def get_capacity_flags():
+            return {
+                large_scheduled_vehicle.id: (
+                    large_scheduled_vehicle.capacity_exhausted_while_determining_onward_transportation,
+                    large_scheduled_vehicle.capacity_exhausted_while_allocating_space_for_export_containers
+                )
+                for large_scheduled_vehicle in LargeScheduledVehicle.select()
+            }
+
+        self.service.generate()
+        capacity_flags_before = get_capacity_flags()
+        LargeScheduledVehicle.update(
+            capacity_exhausted_while_determining_onward_transportation=True,
+            capacity_exhausted_while_allocating_space_for_export_containers=True
+        ).execute()
+        self.service.generate(from_phase=ContainerFlowGenerationPhase.onward_transportation_assignment)
+        self.assertDictEqual(capacity_flags_before, get_capacity_flags())
+
+    def test_rerun_from_phase_requires_preceding_checkpoint(self):
+        with self.assertRaises(MissingCheckpointException):
+            self.service.generate(from_phase=ContainerFlowGenerationPhase.trucks_for_export_containers)
+
+    def test_reject_resume_and_from_phase_together(self):
+        with self.assertRaises(ValueError):
+            self.service.generate(resume=True, from_phase=ContainerFlowGenerationPhase.fleet_creation)
+
+    def test_checkpoint_table_is_created_for_older_databases(self):
+        ContainerFlowGenerationCheckpoint.drop_table()
+        self.assertIsNone(self.checkpoint_repository.get_last_completed_phase())
+        self.service.generate(resume=True)
+        self.assertEqual(
+            self.checkpoint_repository.get_last_completed_phase(),
+            ContainerFlowGenerationPhase.destination_assignment
+        )
+
+    def test_checkpoint_table_is_only_created_once_per_database(self):
+        with unittest.mock.patch.object(
+                ContainerFlowGenerationCheckpoint, "create_table",
+                wraps=ContainerFlowGenerationCheckpoint.create_table
+        ) as create_table:
+            self.service.generate()
+            self.checkpoint_repository.get_last_completed_phase()
+        create_table.assert_called_once()
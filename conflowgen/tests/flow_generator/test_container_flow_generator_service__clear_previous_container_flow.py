@@ -0,0 +1,91 @@
+import datetime
+import unittest
+
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForDelivery, \
+    TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.domain_models.vehicle import Truck, LargeScheduledVehicle, Feeder, DeepSeaVessel
+from conflowgen.flow_generator.container_flow_generation_service import ContainerFlowGenerationService, \
+    VacuumWithinTransactionException
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerFlowGeneratorService__ClearPreviousContainerFlow(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        ContainerFlowGenerationManager().set_properties(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 20)
+        )
+        port_call_manager = PortCallManager()
+        for vehicle_type, service_name in (
+                (ModeOfTransport.feeder, "TestFeeder"),
+                (ModeOfTransport.deep_sea_vessel, "TestDeepSeaVessel")
+        ):
+            port_call_manager.add_vehicle(
+                vehicle_type=vehicle_type,
+                service_name=service_name,
+                vehicle_arrives_at=datetime.date(2021, 7, 9),
+                vehicle_arrives_at_time=datetime.time(11),
+                average_vehicle_capacity=800,
+                average_moved_capacity=100,
+                next_destinations=None
+            )
+        self.service = ContainerFlowGenerationService()
+
+    def _assert_container_flow_is_empty(self):
+        for model in (
+                Container, LargeScheduledVehicle, Feeder, DeepSeaVessel, Truck,
+                TruckArrivalInformationForPickup, TruckArrivalInformationForDelivery
+        ):
+            self.assertEqual(model.select().count(), 0, f"Table of {model.__name__} is not empty")
+        self.assertEqual(Schedule.select().count(), 2)
+
+    def test_clear_previous_container_flow(self):
+        self.service.generate()
+        self.assertGreater(TruckArrivalInformationForPickup.select().count(), 0)
+        self.service.clear_previous_container_flow()
+        self._assert_container_flow_is_empty()
+        self.assertEqual(self.sqlite_db.pragma("foreign_keys"), 1)
+
+    def test_clear_previous_container_flow_with_vacuum(self):
+        self.service.generate()
+        self.service.clear_previous_container_flow(vacuum=True)
+        self._assert_container_flow_is_empty()
+
+    def test_vacuum_within_transaction_is_rejected(self):
+        self.service.generate()
+        number_of_containers = Container.select().count()
+        with self.sqlite_db.atomic():
+            with self.assertRaises(VacuumWithinTransactionException):
+                self.service.clear_previous_container_flow(vacuum=True)
+        self.assertEqual(Container.select().count(), number_of_containers)
+
+    def test_clear_previous_container_flow_within_transaction(self):
+        self.service.generate()
+        with self.sqlite_db.atomic():
+            self.service.clear_previous_container_flow()
+        self._assert_container_flow_is_empty()
+        self.assertEqual(self.sqlite_db.pragma("foreign_keys"), 1)
+
+    def test_generate_twice_leaves_no_orphans(self):
+        self.service.generate()
+        self.service.generate()
+        self.assertEqual(
+            TruckArrivalInformationForPickup.select().count(),
+            Truck.select().where(Truck.picks_up_container).count()
+        )
+        self.assertEqual(
+            TruckArrivalInformationForDelivery.select().count(),
+            Truck.select().where(Truck.delivers_container).count()
+        )
@@ -0,0 +1,95 @@
+import datetime
+import unittest
+
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.database_connection.sql_query_tracer import SqlQueryTracer
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.flow_generator.generation_statistics import GenerationStats, PhaseStats
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerFlowGeneratorService__GenerationStats(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        self.manager = ContainerFlowGenerationManager()
+        self.manager.set_properties(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 15)
+        )
+        PortCallManager().add_vehicle(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeeder",
+            vehicle_arrives_at=datetime.date(2021, 7, 9),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=800,
+            average_moved_capacity=100,
+            next_destinations=None
+        )
+
+    def test_stats_for_each_phase(self):
+        completed_phases = []
+        stats = self.manager.generate(on_phase_completed=completed_phases.append)
+        self.assertIsInstance(stats, GenerationStats)
+        self.assertListEqual(list(stats.phases.keys()), list(ContainerFlowGenerationPhase))
+        self.assertListEqual(completed_phases, list(stats.phases.values()))
+        for phase, phase_stats in stats.phases.items():
+            self.assertIsInstance(phase_stats, PhaseStats)
+            self.assertEqual(phase_stats.phase, phase)
+            self.assertGreater(phase_stats.wall_time, 0)
+            self.assertGreaterEqual(phase_stats.cpu_time, 0)
+            self.assertGreater(phase_stats.sql_statements, 0)
+            self.assertGreaterEqual(phase_stats.cache_lookups, phase_stats.cache_hits)
+            if phase_stats.peak_rss_increase is not None:
+                self.assertGreaterEqual(phase_stats.peak_rss_increase, 0)
+        self.assertGreaterEqual(stats.wall_time, sum(phase_stats.wall_time for phase_stats in stats.phases.values()))
+
+        fleet_creation = stats.phases[ContainerFlowGenerationPhase.fleet_creation]
+        self.assertGreaterEqual(fleet_creation.changed_rows, Container.select().where(
+            Container.delivered_by == ModeOfTransport.feeder
+        ).count())
+
+        containers_delivered_by_truck = stats.phases[ContainerFlowGenerationPhase.containers_delivered_by_truck]
+        self.assertGreater(containers_delivered_by_truck.cache_hits, 0, "The distributions are loaded from the cache")
+
+    def test_trace_callback_and_tracer_are_kept(self):
+        traced_statements = []
+        self.sqlite_db.connection().set_trace_callback(traced_statements.append)
+        with SqlQueryTracer(self.sqlite_db) as tracer:
+            stats = self.manager.generate()
+            self.assertTrue(tracer.is_active)
+        number_of_statements_of_phases = sum(phase_stats.sql_statements for phase_stats in stats.phases.values())
+        self.assertGreaterEqual(
+            sum(query_statistics.count for query_statistics in tracer.get_statistics()), number_of_statements_of_phases
+        )
+        self.assertNotIn("execute_sql", vars(self.sqlite_db))
+
+        number_of_traced_statements = len(traced_statements)
+        self.assertGreaterEqual(number_of_traced_statements, number_of_statements_of_phases)
+        Container.select().count()
+        self.assertGreater(len(traced_statements), number_of_traced_statements)
+
+    def test_stats_when_nothing_is_left_to_do(self):
+        self.manager.generate()
+        stats = self.manager.generate(resume=True)
+        self.assertDictEqual(stats.phases, {})
+
+    def test_no_stats_when_generation_is_skipped(self):
+        self.manager.generate()
+        self.assertIsNone(self.manager.generate(overwrite=False))
+
+    def test_cache_hit_rate(self):
+        phase_stats = PhaseStats(
+            phase=ContainerFlowGenerationPhase.fleet_creation, wall_time=1, cpu_time=1, sql_statements=1,
+            changed_rows=0, peak_rss_increase=None, cache_lookups=4, cache_hits=3
+        )
+        self.assertEqual(phase_stats.cache_hit_rate, 0.75)
+        self.assertIsNone(phase_stats._replace(cache_lookups=0, cache_hits=0).cache_hit_rate)
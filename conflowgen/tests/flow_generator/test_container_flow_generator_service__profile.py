@@ -0,0 +1,63 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from conflowgen.analyses.quay_side_throughput_analysis_report import QuaySideThroughputAnalysisReport
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.application.data_types.container_flow_generation_phase import ContainerFlowGenerationPhase
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerFlowGeneratorService__Profile(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        self.manager = ContainerFlowGenerationManager()
+        self.manager.set_properties(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 15)
+        )
+        PortCallManager().add_vehicle(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeeder",
+            vehicle_arrives_at=datetime.date(2021, 7, 9),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=800,
+            average_moved_capacity=100,
+            next_destinations=None
+        )
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_profile_each_phase(self):
+        self.manager.generate(profile=True, profile_directory=self.temporary_directory.name)
+        expected_file_names = set()
+        for phase in ContainerFlowGenerationPhase:
+            expected_file_names.add(f"generation_{phase.value}.pstats")
+            expected_file_names.add(f"generation_{phase.value}.collapsed")
+        self.assertSetEqual(set(os.listdir(self.temporary_directory.name)), expected_file_names)
+
+    def test_no_profile_by_default(self):
+        self.manager.generate(profile_directory=self.temporary_directory.name)
+        self.assertListEqual(os.listdir(self.temporary_directory.name), [])
+
+    def test_profile_report(self):
+        self.manager.generate()
+        report = QuaySideThroughputAnalysisReport()
+        with report.profile(output_directory=self.temporary_directory.name) as profiler:
+            report.get_report_as_text()
+        self.assertEqual(
+            os.path.basename(profiler.path_to_pstats), "QuaySideThroughputAnalysisReport.pstats"
+        )
+        self.assertTrue(os.path.isfile(profiler.path_to_pstats))
+        self.assertTrue(os.path.isfile(profiler.path_to_collapsed_stacks))
@@ -0,0 +1,72 @@
+import datetime
+import unittest
+
+from conflowgen.api.container_flow_generation_manager import ContainerFlowGenerationManager
+from conflowgen.api.port_call_manager import PortCallManager
+from conflowgen.api.truck_arrival_distribution_manager import TruckArrivalDistributionManager
+from conflowgen.application.repositories.container_flow_generation_checkpoint_repository import \
+    ContainerFlowGenerationCheckpointRepository
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.vehicle import Truck
+from conflowgen.flow_generator.container_flow_generation_service import ContainerFlowGenerationService, \
+    MissingCheckpointException
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestContainerFlowGeneratorService__RegenerateTruckArrivals(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        ContainerFlowGenerationManager().set_properties(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 20)
+        )
+        port_call_manager = PortCallManager()
+        for vehicle_type, service_name in (
+                (ModeOfTransport.feeder, "TestFeeder"),
+                (ModeOfTransport.deep_sea_vessel, "TestDeepSeaVessel")
+        ):
+            port_call_manager.add_vehicle(
+                vehicle_type=vehicle_type,
+                service_name=service_name,
+                vehicle_arrives_at=datetime.date(2021, 7, 9),
+                vehicle_arrives_at_time=datetime.time(11),
+                average_vehicle_capacity=800,
+                average_moved_capacity=100,
+                next_destinations=None
+            )
+        self.service = ContainerFlowGenerationService()
+        self.checkpoint_repository = ContainerFlowGenerationCheckpointRepository()
+
+    def test_regenerate_truck_arrivals(self):
+        self.service.generate()
+        container_ids = [container.id for container in Container.select().order_by(Container.id)]
+        number_trucks = Truck.select().count()
+        self.assertGreater(number_trucks, 0)
+
+        # All trucks arrive on Tuesday
+        TruckArrivalDistributionManager().set_truck_arrival_distribution({
+            hour: (1 if hour == 24 + 10 else 0) for hour in range(24 * 7)
+        })
+        self.service.regenerate_truck_arrivals()
+
+        self.assertListEqual(container_ids, [container.id for container in Container.select().order_by(Container.id)])
+        self.assertEqual(Truck.select().count(), number_trucks)
+        self.assertEqual(
+            TruckArrivalInformationForPickup.select().count(),
+            Container.select().where(Container.picked_up_by == ModeOfTransport.truck).count()
+        )
+        for truck_arrival_information in TruckArrivalInformationForPickup.select():
+            self.assertEqual(truck_arrival_information.realized_container_pickup_time.weekday(), 1)
+
+    def test_regenerate_requires_generated_containers(self):
+        with self.assertRaises(MissingCheckpointException):
+            self.service.regenerate_truck_arrivals()
+        self.assertEqual(Truck.select().count(), 0)
@@ -0,0 +1,80 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from conflowgen.application.data_types.export_file_format import ExportFileFormat
+from conflowgen.application.services.export_container_flow_service import ExportContainerFlowService
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.vehicle import Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestExportContainerFlowService__Chunks(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        for i in range(5):
+            # only some trucks have an arrival information so that some chunks contain missing values
+            truck = Truck.create(
+                delivers_container=False,
+                picks_up_container=True,
+                truck_arrival_information_for_pickup=TruckArrivalInformationForPickup.create(
+                    realized_container_pickup_time=datetime.datetime(2021, 7, 9, 12, i)
+                ) if i % 2 else None
+            )
+            Container.create(
+                weight=10 + i,
+                delivered_by=ModeOfTransport.feeder,
+                picked_up_by=ModeOfTransport.truck,
+                picked_up_by_initial=ModeOfTransport.truck,
+                picked_up_by_truck=truck,
+                length=ContainerLength.twenty_feet,
+                storage_requirement=StorageRequirement.standard
+            )
+        self.service = ExportContainerFlowService()
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_chunks_are_bounded_by_chunk_size(self):
+        chunks = list(self.service._read_table_in_chunks(Container, 2))  # pylint: disable=protected-access
+        self.assertListEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertTrue(all(chunk.index.name == "id" for chunk in chunks))
+
+    def test_empty_table_yields_one_empty_chunk(self):
+        Container.delete().execute()
+        chunks = list(self.service._read_table_in_chunks(Container, 2))  # pylint: disable=protected-access
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(len(chunks[0]), 0)
+
+    def test_chunked_csv_equals_csv_read_at_once(self):
+        path_to_full_export = self.service.export(
+            "full", self.temporary_directory.name, ExportFileFormat.csv, overwrite=False
+        )
+        path_to_chunked_export = self.service.export(
+            "chunked", self.temporary_directory.name, ExportFileFormat.csv, overwrite=False, chunk_size=2
+        )
+        self.assertListEqual(
+            sorted(os.listdir(path_to_full_export)),
+            sorted(os.listdir(path_to_chunked_export))
+        )
+        for file_name in os.listdir(path_to_full_export):
+            if file_name == self.service.manifest_file_name:
+                continue
+            with open(os.path.join(path_to_full_export, file_name), encoding="utf-8") as full_file, \
+                    open(os.path.join(path_to_chunked_export, file_name), encoding="utf-8") as chunked_file:
+                self.assertEqual(full_file.read(), chunked_file.read(), f"The file {file_name} differs")
+
+    def test_chunks_only_for_csv(self):
+        with self.assertRaises(ValueError):
+            self.service.export(
+                "export", self.temporary_directory.name, ExportFileFormat.xlsx, overwrite=False, chunk_size=2
+            )
@@ -0,0 +1,105 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import pandas as pd
+
+from conflowgen.application.data_types.export_file_format import ExportFileFormat
+from conflowgen.application.services.export_container_flow_service import ExportContainerFlowService, \
+    MissingExportDependencyException
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.vehicle import Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+PYARROW_IS_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestExportContainerFlowService__FileFormats(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        truck = Truck.create(delivers_container=True, picks_up_container=False)
+        Container.create(
+            weight=20,
+            delivered_by=ModeOfTransport.truck,
+            delivered_by_truck=truck,
+            picked_up_by=ModeOfTransport.deep_sea_vessel,
+            picked_up_by_initial=ModeOfTransport.deep_sea_vessel,
+            length=ContainerLength.forty_feet,
+            storage_requirement=StorageRequirement.reefer
+        )
+        self.service = ExportContainerFlowService()
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_enums_as_categorical_columns(self):
+        df_container = self.service._convert_table_to_pandas_dataframe(  # pylint: disable=protected-access
+            Container, typed_columns=True
+        )
+        self.assertIsInstance(df_container["delivered_by"].dtype, pd.CategoricalDtype)
+        self.assertListEqual(
+            list(df_container["delivered_by"].cat.categories),
+            [mode_of_transport.value for mode_of_transport in ModeOfTransport]
+        )
+        self.assertListEqual(
+            list(df_container["length"].cat.categories),
+            [container_length.value for container_length in ContainerLength]
+        )
+        container_df_entry = df_container.iloc[0]
+        self.assertEqual(container_df_entry.delivered_by, "truck")
+        self.assertEqual(container_df_entry.length, 40)
+        self.assertEqual(container_df_entry.storage_requirement, "reefer")
+        self.assertEqual(df_container["weight"].dtype, "int64")
+        self.assertEqual(df_container["picked_up_by_truck"].dtype, "Int64")
+
+    def test_enums_stay_plain_by_default(self):
+        df_container = self.service._convert_table_to_pandas_dataframe(  # pylint: disable=protected-access
+            Container
+        )
+        self.assertNotIsInstance(df_container["delivered_by"].dtype, pd.CategoricalDtype)
+
+    def test_compression_is_rejected_for_csv(self):
+        with self.assertRaises(ValueError):
+            self.service.export(
+                "export", self.temporary_directory.name, ExportFileFormat.csv, overwrite=False, compression="gzip"
+            )
+
+    def test_missing_pyarrow(self):
+        with unittest.mock.patch("importlib.util.find_spec", return_value=None):
+            with self.assertRaises(MissingExportDependencyException):
+                self.service.export("export", self.temporary_directory.name, ExportFileFormat.parquet, False)
+        self.assertFalse(os.path.isdir(os.path.join(self.temporary_directory.name, "export")))
+
+    @unittest.skipUnless(PYARROW_IS_AVAILABLE, "pyarrow is not installed")
+    def test_export_as_parquet_keeps_column_types(self):
+        path_to_folder = self.service.export(
+            "export", self.temporary_directory.name, ExportFileFormat.parquet, overwrite=False,
+            compression="zstd", row_group_size=1000
+        )
+        df_container = pd.read_parquet(os.path.join(path_to_folder, "containers.parquet"))
+        self.assertEqual(df_container.index.name, "id")
+        self.assertIsInstance(df_container["storage_requirement"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df_container["picked_up_by_truck"].dtype, "Int64")
+        self.assertEqual(df_container.iloc[0].storage_requirement, "reefer")
+        df_trucks = pd.read_parquet(os.path.join(path_to_folder, "trucks.parquet"))
+        self.assertEqual(df_trucks["delivers_container"].dtype, bool)
+
+    @unittest.skipUnless(PYARROW_IS_AVAILABLE, "pyarrow is not installed")
+    def test_export_as_uncompressed_feather(self):
+        path_to_folder = self.service.export(
+            "export", self.temporary_directory.name, ExportFileFormat.feather, overwrite=False,
+            compression="uncompressed"
+        )
+        df_container = pd.read_feather(os.path.join(path_to_folder, "containers.feather"))
+        self.assertIn("id", df_container.columns)
+        self.assertIsInstance(df_container["delivered_by"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df_container.iloc[0].delivered_by, "truck")
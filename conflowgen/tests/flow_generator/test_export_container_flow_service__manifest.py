@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+
+from conflowgen.application.data_types.export_file_format import ExportFileFormat
+from conflowgen.application.services.export_container_flow_service import ExportContainerFlowService
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.vehicle import Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestExportContainerFlowService__Manifest(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        for i in range(3):
+            Container.create(
+                weight=10 + i,
+                delivered_by=ModeOfTransport.truck,
+                delivered_by_truck=Truck.create(delivers_container=True, picks_up_container=False),
+                picked_up_by=ModeOfTransport.feeder,
+                picked_up_by_initial=ModeOfTransport.feeder,
+                length=ContainerLength.twenty_feet,
+                storage_requirement=StorageRequirement.standard
+            )
+        self.service = ExportContainerFlowService()
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def _export(self, **kwargs) -> str:
+        return self.service.export("export", self.temporary_directory.name, ExportFileFormat.csv, **kwargs)
+
+    def _load_manifest(self, path_to_export: str) -> dict:
+        with open(os.path.join(path_to_export, self.service.manifest_file_name), encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+
+    def test_manifest_is_written(self):
+        path_to_export = self._export(overwrite=False)
+        manifest = self._load_manifest(path_to_export)
+        self.assertIsNotNone(manifest["generated_at"])
+        self.assertEqual(manifest["export_settings"]["file_format"], "csv")
+        self.assertSetEqual(set(manifest["tables"].keys()), set(self.service.tables_to_export.keys()))
+        self.assertEqual(manifest["tables"]["containers"]["rows"], 3)
+        self.assertEqual(manifest["tables"]["containers"]["file_name"], "containers.csv")
+        self.assertEqual(manifest["tables"]["feeders"]["rows"], 0)
+
+    def test_unchanged_tables_are_skipped(self):
+        self._export(overwrite=False)
+        Truck.create(delivers_container=False, picks_up_container=True)
+        with self.assertLogs("conflowgen", level="INFO") as logs:
+            path_to_export = self._export(overwrite=True)
+        self.assertTrue(any("Skipped containers.csv" in message for message in logs.output))
+        self.assertTrue(any("Exported trucks.csv" in message for message in logs.output))
+        self.assertEqual(self._load_manifest(path_to_export)["tables"]["trucks"]["rows"], 4)
+
+    def test_changed_content_is_exported_again(self):
+        self._export(overwrite=False)
+        Container.update(weight=30).where(Container.weight == 10).execute()
+        with self.assertLogs("conflowgen", level="INFO") as logs:
+            path_to_export = self._export(overwrite=True)
+        self.assertTrue(any("Exported containers.csv" in message for message in logs.output))
+        with open(os.path.join(path_to_export, "containers.csv"), encoding="utf-8") as containers_file:
+            self.assertIn(",30,", containers_file.read())
+
+    def test_deleted_file_is_exported_again(self):
+        path_to_export = self._export(overwrite=False)
+        os.remove(os.path.join(path_to_export, "containers.csv"))
+        self._export(overwrite=True)
+        self.assertTrue(os.path.isfile(os.path.join(path_to_export, "containers.csv")))
+
+    def test_chunked_export_skips_unchanged_tables(self):
+        self._export(overwrite=False, chunk_size=2)
+        with self.assertLogs("conflowgen", level="INFO") as logs:
+            self._export(overwrite=True, chunk_size=2)
+        self.assertTrue(any("Skipped containers.csv" in message for message in logs.output))
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from conflowgen.api.database_chooser import DatabaseChooser
+from conflowgen.application.data_types.export_file_format import ExportFileFormat
+from conflowgen.application.services.export_container_flow_service import ExportContainerFlowService
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.vehicle import Truck
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+def _add_containers():
+    for i in range(5):
+        Container.create(
+            weight=10 + i,
+            delivered_by=ModeOfTransport.truck,
+            delivered_by_truck=Truck.create(delivers_container=True, picks_up_container=False),
+            picked_up_by=ModeOfTransport.feeder,
+            picked_up_by_initial=ModeOfTransport.feeder,
+            length=ContainerLength.forty_feet,
+            storage_requirement=StorageRequirement.empty
+        )
+
+
+class TestExportContainerFlowService__Parallel(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.service = ExportContainerFlowService()
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_parallel_export_equals_serial_export(self):
+        database_chooser = DatabaseChooser(sqlite_databases_directory=self.temporary_directory.name)
+        database_chooser.create_new_sqlite_database("export.sqlite")
+        _add_containers()
+        try:
+            path_to_serial_export = self.service.export(
+                "serial", self.temporary_directory.name, ExportFileFormat.csv, overwrite=False
+            )
+            with self.assertLogs("conflowgen", level="INFO") as logs:
+                path_to_parallel_export = self.service.export(
+                    "parallel", self.temporary_directory.name, ExportFileFormat.csv, overwrite=False, max_workers=3
+                )
+        finally:
+            database_chooser.close_current_connection()
+
+        self.assertTrue(any("with 3 threads" in message for message in logs.output))
+        for file_name in self.service.tables_to_export.keys():
+            self.assertTrue(
+                any(f"Exported {file_name}.csv in" in message for message in logs.output),
+                f"No timing reported for {file_name}"
+            )
+        for file_name in os.listdir(path_to_serial_export):
+            if file_name == self.service.manifest_file_name:
+                continue
+            with open(os.path.join(path_to_serial_export, file_name), encoding="utf-8") as serial_file, \
+                    open(os.path.join(path_to_parallel_export, file_name), encoding="utf-8") as parallel_file:
+                self.assertEqual(serial_file.read(), parallel_file.read(), f"The file {file_name} differs")
+
+    def test_database_in_memory_is_exported_serially(self):
+        sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(sqlite_db)
+        _add_containers()
+        with self.assertLogs("conflowgen", level="INFO") as logs:
+            path_to_export = self.service.export(
+                "export", self.temporary_directory.name, ExportFileFormat.csv, overwrite=False, max_workers=3
+            )
+        self.assertTrue(any("exported one after another" in message for message in logs.output))
+        self.assertTrue(os.path.isfile(os.path.join(path_to_export, "containers.csv")))
+
+    def test_reject_no_workers(self):
+        with self.assertRaises(ValueError):
+            self.service.export(
+                "export", self.temporary_directory.name, ExportFileFormat.csv, overwrite=False, max_workers=0
+            )
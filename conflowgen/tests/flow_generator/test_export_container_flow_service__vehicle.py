@@ -0,0 +1,137 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup, \
+    TruckArrivalInformationForDelivery
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck, Feeder
+from conflowgen.application.services.export_container_flow_service import \
+    ExportContainerFlowService
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestExportContainerFlowService__Vehicle(unittest.TestCase):  # pylint: disable=invalid-name
+
+    def setUp(self) -> None:
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        self.sqlite_db.create_tables([
+            Schedule,
+            LargeScheduledVehicle,
+            Feeder,
+            Truck,
+            TruckArrivalInformationForPickup,
+            TruckArrivalInformationForDelivery
+        ])
+        self.service = ExportContainerFlowService()
+
+    def test_convert_table_to_pandas_dataframe_with_feeder(self):
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(2021, 7, 9),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=300,
+            average_moved_capacity=250,
+            vehicle_arrives_every_k_days=-1
+        )
+        # This vehicle is not a feeder and must not show up
+        LargeScheduledVehicle.create(
+            vehicle_name="TestOtherVehicle",
+            capacity_in_teu=100,
+            moved_capacity=50,
+            scheduled_arrival=datetime.datetime(2021, 7, 8, 11),
+            schedule=schedule
+        )
+        large_scheduled_vehicle = LargeScheduledVehicle.create(
+            vehicle_name="TestFeeder1",
+            capacity_in_teu=300,
+            moved_capacity=250,
+            scheduled_arrival=datetime.datetime(2021, 7, 9, 11),
+            realized_arrival=datetime.datetime(2021, 7, 9, 12, 30),
+            schedule=schedule
+        )
+        Feeder.create(large_scheduled_vehicle=large_scheduled_vehicle)
+
+        df_feeder = self.service._convert_table_to_pandas_dataframe(Feeder)  # pylint: disable=protected-access
+        self.assertEqual(len(df_feeder), 1)
+        self.assertEqual(df_feeder.index.name, "id")
+        self.assertSetEqual(
+            set(df_feeder.columns),
+            {"vehicle_name", "capacity_in_teu", "moved_capacity", "realized_arrival"}
+        )
+        feeder_df_entry = df_feeder.loc[large_scheduled_vehicle.id]
+        self.assertEqual(feeder_df_entry.vehicle_name, "TestFeeder1")
+        self.assertEqual(feeder_df_entry.capacity_in_teu, 300)
+        self.assertEqual(feeder_df_entry.moved_capacity, 250)
+        self.assertEqual(feeder_df_entry.realized_arrival, pd.Timestamp(2021, 7, 9, 12, 30))
+
+    def test_convert_table_to_pandas_dataframe_with_trucks(self):
+        pickup_time = datetime.datetime(2021, 7, 9, 12, 30, 15, 123456)
+        delivery_time = datetime.datetime(2021, 7, 10, 8)
+        Truck.create(
+            delivers_container=False,
+            picks_up_container=True,
+            truck_arrival_information_for_pickup=TruckArrivalInformationForPickup.create(
+                realized_container_pickup_time=pickup_time
+            )
+        )
+        Truck.create(
+            delivers_container=True,
+            picks_up_container=False,
+            truck_arrival_information_for_delivery=TruckArrivalInformationForDelivery.create(
+                realized_container_delivery_time=delivery_time
+            )
+        )
+
+        df_truck = self.service._convert_table_to_pandas_dataframe(Truck)  # pylint: disable=protected-access
+        self.assertEqual(len(df_truck), 2)
+        self.assertSetEqual(
+            set(df_truck.columns),
+            {
+                "delivers_container", "picks_up_container",
+                "realized_container_pickup_time", "realized_container_delivery_time"
+            }
+        )
+        self.assertEqual(df_truck["delivers_container"].dtype, bool)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df_truck["realized_container_pickup_time"]))
+        self.assertEqual(df_truck.iloc[0].realized_container_pickup_time, pd.Timestamp(pickup_time))
+        self.assertTrue(pd.isna(df_truck.iloc[0].realized_container_delivery_time))
+        self.assertEqual(df_truck.iloc[1].realized_container_delivery_time, pd.Timestamp(delivery_time))
+
+    def test_header_of_trucks(self):
+        Truck.create(
+            delivers_container=True,
+            picks_up_container=False,
+            truck_arrival_information_for_delivery=TruckArrivalInformationForDelivery.create(
+                realized_container_delivery_time=datetime.datetime(2021, 7, 10, 8)
+            )
+        )
+        Truck.create(
+            delivers_container=False,
+            picks_up_container=True,
+            truck_arrival_information_for_pickup=TruckArrivalInformationForPickup.create(
+                realized_container_pickup_time=datetime.datetime(2021, 7, 9, 12, 30)
+            )
+        )
+
+        df_truck = self.service._convert_table_to_pandas_dataframe(Truck)  # pylint: disable=protected-access
+        with tempfile.TemporaryDirectory() as path_to_folder:
+            path_to_file = os.path.join(path_to_folder, "trucks.csv")
+            self.service._save_as_csv(df_truck, path_to_file)  # pylint: disable=protected-access
+            with open(path_to_file, encoding="utf-8") as csv_file:
+                header = csv_file.readline().strip()
+        self.assertEqual(
+            header,
+            "id,delivers_container,picks_up_container,realized_container_pickup_time,realized_container_delivery_time"
+        )
+
+    def test_convert_empty_table_keeps_columns(self):
+        df_truck = self.service._convert_table_to_pandas_dataframe(Truck)  # pylint: disable=protected-access
+        self.assertEqual(len(df_truck), 0)
+        self.assertEqual(df_truck.index.name, "id")
+        self.assertSetEqual(set(df_truck.columns), {"delivers_container", "picks_up_container"})
@@ -0,0 +1,108 @@
+import datetime
+import sqlite3
+import tempfile
+import unittest
+
+from conflowgen.application.services.export_container_flow_to_sqlite_service import \
+    ExportContainerFlowToSqliteService, ExportOnlyAllowedToNotExistingFileException
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.arrival_information import TruckArrivalInformationForPickup
+from conflowgen.domain_models.container import Container
+from conflowgen.domain_models.data_types.container_length import ContainerLength
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.domain_models.vehicle import LargeScheduledVehicle, Truck, Feeder
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestExportContainerFlowToSqliteService(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        schedule = Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(2021, 7, 9),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=300,
+            average_moved_capacity=250,
+            vehicle_arrives_every_k_days=-1
+        )
+        large_scheduled_vehicle = LargeScheduledVehicle.create(
+            vehicle_name="TestFeeder1",
+            capacity_in_teu=300,
+            moved_capacity=250,
+            scheduled_arrival=datetime.datetime(2021, 7, 9, 11),
+            realized_arrival=datetime.datetime(2021, 7, 9, 11),
+            schedule=schedule
+        )
+        Feeder.create(large_scheduled_vehicle=large_scheduled_vehicle)
+        truck = Truck.create(
+            delivers_container=False,
+            picks_up_container=True,
+            truck_arrival_information_for_pickup=TruckArrivalInformationForPickup.create(
+                realized_container_pickup_time=datetime.datetime(2021, 7, 12, 8, 30)
+            )
+        )
+        self.container = Container.create(
+            weight=20,
+            delivered_by=ModeOfTransport.feeder,
+            delivered_by_large_scheduled_vehicle=large_scheduled_vehicle,
+            picked_up_by=ModeOfTransport.truck,
+            picked_up_by_initial=ModeOfTransport.truck,
+            picked_up_by_truck=truck,
+            length=ContainerLength.forty_feet,
+            storage_requirement=StorageRequirement.reefer
+        )
+        self.service = ExportContainerFlowToSqliteService()
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def _export(self, overwrite: bool = False) -> sqlite3.Connection:
+        path_to_file = self.service.export("flow", self.temporary_directory.name, overwrite=overwrite)
+        self.assertTrue(path_to_file.endswith("flow.sqlite"))
+        connection = sqlite3.connect(path_to_file)
+        self.addCleanup(connection.close)
+        return connection
+
+    def test_export_denormalized_tables(self):
+        connection = self._export()
+        self.assertListEqual(
+            connection.execute("SELECT id, vehicle_type, service_name, vehicle_name FROM vehicles").fetchall(),
+            [(1, "feeder", "TestFeederService", "TestFeeder1")]
+        )
+        self.assertListEqual(
+            connection.execute(
+                "SELECT delivers_container, picks_up_container, realized_container_delivery_time, "
+                "realized_container_pickup_time FROM trucks"
+            ).fetchall(),
+            [(0, 1, None, "2021-07-12 08:30:00")]
+        )
+        self.assertListEqual(
+            connection.execute(
+                "SELECT length, storage_requirement, delivered_by_vehicle, delivered_by_vehicle_name, "
+                "picked_up_by_truck, arrival_time, departure_time FROM containers"
+            ).fetchall(),
+            [(40, "reefer", 1, "TestFeeder1", 1, "2021-07-09 11:00:00", "2021-07-12 08:30:00")]
+        )
+
+    def test_arrival_and_departure_match_container(self):
+        connection = self._export()
+        arrival_time, departure_time = connection.execute(
+            "SELECT arrival_time, departure_time FROM containers WHERE id = ?", (self.container.id,)
+        ).fetchone()
+        self.assertEqual(arrival_time, str(self.container.get_arrival_time()))
+        self.assertEqual(departure_time, str(self.container.get_departure_time()))
+
+    def test_overwrite(self):
+        self._export().close()
+        with self.assertRaises(ExportOnlyAllowedToNotExistingFileException):
+            self._export()
+        Container.delete().execute()
+        connection = self._export(overwrite=True)
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM containers").fetchone()[0], 0)
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM vehicles").fetchone()[0], 1)
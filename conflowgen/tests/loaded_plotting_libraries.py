@@ -0,0 +1,34 @@
+import json
+import subprocess
+import sys
+from typing import List
+
+
+def get_plotting_libraries_loaded_by(module_name: str, function_name: str) -> List[str]:
+    """
+    Runs the function with ``as_text=True`` on an empty in-memory database in a fresh interpreter, e.g.,
+    ``run_all_previews`` of the module ``conflowgen.previews``.
+
+    Returns:
+        The plotting libraries that have been imported meanwhile
+    """
+    code = "\n".join([
+        "import datetime",
+        "import json",
+        "import sys",
+        f"from {module_name} import {function_name}",
+        "from conflowgen.application.models.container_flow_generation_properties import \\",
+        "    ContainerFlowGenerationProperties",
+        "from conflowgen.database_connection.create_tables import create_tables",
+        "from conflowgen.domain_models.distribution_seeders import seed_all_distributions",
+        "from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db",
+        "create_tables(setup_sqlite_in_memory_db())",
+        "seed_all_distributions()",
+        "ContainerFlowGenerationProperties.create(",
+        "    start_date=datetime.date(2021, 12, 1), end_date=datetime.date(2021, 12, 6)",
+        ")",
+        f"{function_name}(as_text=True, display_text_func=lambda text: None)",
+        "print(json.dumps(sorted({module.split('.')[0] for module in sys.modules} & {'matplotlib', 'plotly'})))",
+    ])
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
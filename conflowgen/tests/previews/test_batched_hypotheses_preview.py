@@ -0,0 +1,131 @@
+import datetime
+import unittest
+
+import numpy as np
+
+from conflowgen.data_summaries.data_summaries_cache import DataSummariesCache
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
+    ModeOfTransportDistributionRepository
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.distribution_validators import DistributionProbabilitiesUnequalOne, \
+    DistributionProbabilityOutOfRange
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.previews.batched_hypotheses_preview import BatchedHypothesesPreview
+from conflowgen.previews.container_flow_by_vehicle_type_preview import ContainerFlowByVehicleTypePreview
+from conflowgen.previews.modal_split_preview import ModalSplitPreview
+from conflowgen.previews.truck_gate_throughput_preview import TruckGateThroughputPreview
+from conflowgen.previews.vehicle_capacity_exceeded_preview import VehicleCapacityExceededPreview
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestBatchedHypothesesPreview(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        DataSummariesCache.reset_cache()
+        self.start_date = datetime.date(2021, 7, 1)
+        self.end_date = datetime.date(2021, 7, 29)
+        for vehicle_type, average_vehicle_capacity, average_moved_capacity in (
+                (ModeOfTransport.deep_sea_vessel, 10000, 1000),
+                (ModeOfTransport.feeder, 1000, 300),
+                (ModeOfTransport.barge, 100, 70),
+                (ModeOfTransport.train, 90, 80),
+        ):
+            Schedule.create(
+                vehicle_type=vehicle_type,
+                service_name=f"Test{vehicle_type.value}",
+                vehicle_arrives_at=self.start_date,
+                vehicle_arrives_at_time=datetime.time(11),
+                average_vehicle_capacity=average_vehicle_capacity,
+                average_moved_capacity=average_moved_capacity,
+                vehicle_arrives_every_k_days=7
+            )
+        self.preview = BatchedHypothesesPreview(self.start_date, self.end_date, transportation_buffer=0.2)
+
+    def _as_distribution(self, candidate: np.ndarray):
+        return {
+            inbound_vehicle_type: {
+                outbound_vehicle_type: candidate[i, j]
+                for j, outbound_vehicle_type in enumerate(BatchedHypothesesPreview.vehicle_types)
+            }
+            for i, inbound_vehicle_type in enumerate(BatchedHypothesesPreview.vehicle_types)
+        }
+
+    def test_same_results_as_single_previews(self):
+        candidates = np.random.default_rng(1).dirichlet(np.ones(5), size=(4, 5))
+        metrics = self.preview.evaluate(candidates)
+        self.assertEqual(metrics.inbound_to_outbound_flow.shape, (4, 5, 5))
+
+        truck = BatchedHypothesesPreview.vehicle_types.index(ModeOfTransport.truck)
+        for n, candidate in enumerate(candidates):
+            # The single previews take the truck capacity from the distribution stored in the database
+            ModeOfTransportDistributionRepository().set_mode_of_transport_distributions(
+                self._as_distribution(candidate)
+            )
+            DataSummariesCache.reset_cache()
+            arguments = (self.start_date, self.end_date, 0.2)
+
+            flow = ContainerFlowByVehicleTypePreview(*arguments).get_inbound_to_outbound_flow()
+            for i, inbound_vehicle_type in enumerate(BatchedHypothesesPreview.vehicle_types):
+                for j, outbound_vehicle_type in enumerate(BatchedHypothesesPreview.vehicle_types):
+                    self.assertAlmostEqual(
+                        metrics.inbound_to_outbound_flow[n, i, j], flow[inbound_vehicle_type][outbound_vehicle_type]
+                    )
+
+            comparison = VehicleCapacityExceededPreview(*arguments).compare()
+            for j, vehicle_type in enumerate(BatchedHypothesesPreview.vehicle_types):
+                self.assertAlmostEqual(
+                    metrics.required_outbound_capacity_in_teu[n, j], comparison[vehicle_type].currently_planned
+                )
+                self.assertEqual(metrics.outbound_capacity_exceeded[n, j], comparison[vehicle_type].exceeded)
+                if j != truck:
+                    self.assertAlmostEqual(
+                        metrics.maximum_outbound_capacity_in_teu[n, j], comparison[vehicle_type].maximum
+                    )
+
+            modal_split_preview = ModalSplitPreview(*arguments)
+            split = modal_split_preview.get_transshipment_and_hinterland_split()
+            self.assertAlmostEqual(metrics.transshipment_capacity[n], split.transshipment_capacity)
+            self.assertAlmostEqual(metrics.hinterland_capacity[n], split.hinterland_capacity)
+            for inbound, outbound, modal_split in (
+                    (True, False, metrics.hinterland_modal_split_inbound),
+                    (False, True, metrics.hinterland_modal_split_outbound),
+                    (True, True, metrics.hinterland_modal_split_inbound_and_outbound),
+            ):
+                np.testing.assert_allclose(
+                    modal_split[n], modal_split_preview.get_modal_split_for_hinterland(inbound, outbound)
+                )
+
+            weekly_truck_arrivals = TruckGateThroughputPreview(*arguments).get_weekly_truck_arrivals(True, True)
+            self.assertListEqual(metrics.hours_of_the_week.tolist(), list(weekly_truck_arrivals.keys()))
+            self.assertListEqual(metrics.weekly_truck_arrivals[n].tolist(), list(weekly_truck_arrivals.values()))
+
+    def test_to_array(self):
+        distribution = ModeOfTransportDistributionRepository().get_distribution()
+        array = BatchedHypothesesPreview.to_array([distribution, distribution])
+        self.assertEqual(array.shape, (2, 5, 5))
+        self.assertDictEqual(self._as_distribution(array[1]), distribution)
+
+    def test_hypothesize_with_single_distribution(self):
+        distribution = ModeOfTransportDistributionRepository().get_distribution()
+        self.preview.hypothesize_with_mode_of_transport_distribution(distribution)
+        metrics = self.preview.evaluate()
+        np.testing.assert_allclose(metrics.inbound_to_outbound_flow.sum(axis=2), metrics.inbound_capacity_in_teu)
+
+    def test_invalid_candidates(self):
+        with self.assertRaises(ValueError):
+            self.preview.evaluate()
+        with self.assertRaises(ValueError):
+            self.preview.evaluate(np.full((2, 4, 5), 0.25))
+        candidates = np.full((3, 5, 5), 0.2)
+        candidates[2, 1] = [1.2, -0.2, 0, 0, 0]
+        with self.assertRaises(DistributionProbabilityOutOfRange):
+            self.preview.evaluate(candidates)
+        candidates[2, 1] = [0.5, 0.5, 0.5, 0, 0]
+        with self.assertRaises(DistributionProbabilitiesUnequalOne):
+            self.preview.evaluate(candidates)
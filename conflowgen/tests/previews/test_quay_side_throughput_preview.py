@@ -0,0 +1,83 @@
+import datetime
+import unittest
+
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
+    ContainerLengthDistributionRepository
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.previews.quay_side_throughput_preview import QuaySideThroughputPreview
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestQuaySideThroughputPreview(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        self.preview = QuaySideThroughputPreview(
+            start_date=datetime.date(2021, 7, 1),
+            end_date=datetime.date(2021, 7, 29),
+            transportation_buffer=0.2
+        )
+        self.teu_factor = ContainerLengthDistributionRepository.get_teu_factor()
+
+    def _add_schedule(self, vehicle_type: ModeOfTransport, average_moved_capacity: int = 300) -> None:
+        Schedule.create(
+            vehicle_type=vehicle_type,
+            service_name=f"Test{vehicle_type}Service",
+            vehicle_arrives_at=datetime.date(2021, 7, 5),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=800,
+            average_moved_capacity=average_moved_capacity,
+            vehicle_arrives_every_k_days=7
+        )
+
+    def test_no_schedules(self):
+        self.assertDictEqual(self.preview.get_throughput_over_time(), {})
+
+    def test_hinterland_vehicles_are_ignored(self):
+        self._add_schedule(ModeOfTransport.barge)
+        self._add_schedule(ModeOfTransport.train)
+        self.assertDictEqual(self.preview.get_throughput_over_time(), {})
+
+    def test_inbound_throughput_of_weekly_feeder(self):
+        self._add_schedule(ModeOfTransport.feeder)
+        throughput = self.preview.get_throughput_over_time(inbound=True, outbound=False)
+        self.assertListEqual(
+            list(throughput),
+            [datetime.date(2021, 7, 5), datetime.date(2021, 7, 12), datetime.date(2021, 7, 19),
+             datetime.date(2021, 7, 26)]
+        )
+        for boxes in throughput.values():
+            self.assertAlmostEqual(boxes, 300 / self.teu_factor)
+
+    def test_outbound_throughput_is_capped(self):
+        self._add_schedule(ModeOfTransport.feeder, average_moved_capacity=100)
+        self._add_schedule(ModeOfTransport.deep_sea_vessel, average_moved_capacity=800)
+        only_to_feeders = {
+            inbound_vehicle: {
+                outbound_vehicle: float(outbound_vehicle == ModeOfTransport.feeder)
+                for outbound_vehicle in ModeOfTransport
+            }
+            for inbound_vehicle in ModeOfTransport
+        }
+        self.preview.hypothesize_with_mode_of_transport_distribution(only_to_feeders)
+        throughput = self.preview.get_throughput_over_time(inbound=False, outbound=True)
+
+        # The deep sea vessels take nothing and the feeders are loaded up to the transportation buffer
+        for boxes in throughput.values():
+            self.assertAlmostEqual(boxes, 100 * 1.2 / self.teu_factor)
+
+    def test_inbound_and_outbound_add_up(self):
+        self._add_schedule(ModeOfTransport.feeder)
+        self._add_schedule(ModeOfTransport.deep_sea_vessel, average_moved_capacity=600)
+        inbound = self.preview.get_throughput_over_time(inbound=True, outbound=False)
+        outbound = self.preview.get_throughput_over_time(inbound=False, outbound=True)
+        both = self.preview.get_throughput_over_time(inbound=True, outbound=True)
+        self.assertListEqual(list(both), list(inbound))
+        for week, boxes in both.items():
+            self.assertAlmostEqual(boxes, inbound[week] + outbound[week])
@@ -0,0 +1,109 @@
+import datetime
+import unittest
+
+from conflowgen.database_connection.create_tables import create_tables
+from conflowgen.domain_models.data_types.mode_of_transport import ModeOfTransport
+from conflowgen.domain_models.data_types.storage_requirement import StorageRequirement
+from conflowgen.domain_models.distribution_repositories.container_length_distribution_repository import \
+    ContainerLengthDistributionRepository
+from conflowgen.domain_models.distribution_repositories.mode_of_transport_distribution_repository import \
+    ModeOfTransportDistributionRepository
+from conflowgen.domain_models.distribution_seeders import seed_all_distributions
+from conflowgen.domain_models.large_vehicle_schedule import Schedule
+from conflowgen.previews.yard_capacity_preview import YardCapacityPreview
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+
+
+class TestYardCapacityPreview(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create container database in memory"""
+        self.sqlite_db = setup_sqlite_in_memory_db()
+        create_tables(self.sqlite_db)
+        seed_all_distributions()
+        self.start_date = datetime.date(2021, 7, 1)
+        self.end_date = datetime.date(2021, 7, 29)
+        self.preview = YardCapacityPreview(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            transportation_buffer=0.2
+        )
+
+    def _add_feeder_schedule(self) -> None:
+        Schedule.create(
+            vehicle_type=ModeOfTransport.feeder,
+            service_name="TestFeederService",
+            vehicle_arrives_at=datetime.date(2021, 7, 5),
+            vehicle_arrives_at_time=datetime.time(11),
+            average_vehicle_capacity=800,
+            average_moved_capacity=300,
+            vehicle_arrives_every_k_days=7
+        )
+
+    def test_no_schedules(self):
+        used_yard_capacity = self.preview.get_used_yard_capacity_over_time()
+        self.assertDictEqual(used_yard_capacity.teu, {})
+        self.assertDictEqual(used_yard_capacity.containers, {})
+
+    def test_with_single_feeder(self):
+        self._add_feeder_schedule()
+        used_yard_capacity = self.preview.get_used_yard_capacity_over_time()
+        self.assertGreater(len(used_yard_capacity.teu), 0)
+        self.assertListEqual(list(used_yard_capacity.teu), list(used_yard_capacity.containers))
+        self.assertTrue(all(teu >= 0 for teu in used_yard_capacity.teu.values()))
+        self.assertEqual(list(used_yard_capacity.teu), sorted(used_yard_capacity.teu))
+
+        # Right after the first arrival, all containers that are delivered by the feeder are in the yard together with
+        # some of the containers that trucks deliver for the feeders
+        first_arrival = datetime.datetime(2021, 7, 5, 11)
+        mode_of_transport_distribution = ModeOfTransportDistributionRepository().get_distribution()
+        exported_by_truck_in_total = 4 * 300 \
+            * mode_of_transport_distribution[ModeOfTransport.feeder][ModeOfTransport.truck] \
+            * mode_of_transport_distribution[ModeOfTransport.truck][ModeOfTransport.feeder]
+        self.assertGreaterEqual(used_yard_capacity.teu[first_arrival], 300)
+        self.assertLessEqual(used_yard_capacity.teu[first_arrival], 300 + exported_by_truck_in_total + 1e-6)
+
+        # The yard is occupied in the weeks around the arrivals only
+        self.assertLess(min(used_yard_capacity.teu), first_arrival)
+        self.assertGreater(max(used_yard_capacity.teu), datetime.datetime(2021, 7, 26, 11))
+
+        teu_factor = ContainerLengthDistributionRepository.get_teu_factor()
+        for point_in_time, teu in used_yard_capacity.teu.items():
+            self.assertAlmostEqual(used_yard_capacity.containers[point_in_time], teu / teu_factor, places=6)
+
+    def test_storage_requirements_add_up(self):
+        self._add_feeder_schedule()
+        used_yard_capacity = self.preview.get_used_yard_capacity_over_time()
+        used_yard_capacity_per_storage_requirement = [
+            self.preview.get_used_yard_capacity_over_time(storage_requirement=storage_requirement)
+            for storage_requirement in StorageRequirement
+        ]
+        for point_in_time, teu in used_yard_capacity.teu.items():
+            self.assertAlmostEqual(
+                teu,
+                sum(
+                    used_yard_capacity_of_storage_requirement.teu.get(point_in_time, 0)
+                    for used_yard_capacity_of_storage_requirement in used_yard_capacity_per_storage_requirement
+                ),
+                places=6
+            )
+
+        used_yard_capacity_of_two = self.preview.get_used_yard_capacity_over_time(
+            storage_requirement=[StorageRequirement.standard, StorageRequirement.empty]
+        )
+        self.assertLess(max(used_yard_capacity_of_two.teu.values()), max(used_yard_capacity.teu.values()))
+
+    def test_with_hypothesized_mode_of_transport_distribution(self):
+        self._add_feeder_schedule()
+        only_to_deep_sea_vessels = {
+            inbound_vehicle: {
+                outbound_vehicle: float(outbound_vehicle == ModeOfTransport.deep_sea_vessel)
+                for outbound_vehicle in ModeOfTransport
+            }
+            for inbound_vehicle in ModeOfTransport
+        }
+        self.preview.hypothesize_with_mode_of_transport_distribution(only_to_deep_sea_vessels)
+        used_yard_capacity = self.preview.get_used_yard_capacity_over_time()
+
+        # Without a deep sea vessel schedule, each container stays until the end of its dwell time
+        self.assertAlmostEqual(used_yard_capacity.teu[datetime.datetime(2021, 7, 5, 11)], 300)
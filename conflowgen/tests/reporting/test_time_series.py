@@ -0,0 +1,62 @@
+import datetime
+
+from conflowgen.reporting.time_series import choose_aggregation_window, get_envelope, get_envelope_as_text, \
+    plot_time_series
+from conflowgen.tests.autoclose_matplotlib import UnitTestCaseWithMatplotlib
+
+
+def hourly_time_series(number_of_hours: int) -> dict:
+    start = datetime.datetime(2021, 7, 1)
+    return {
+        start + datetime.timedelta(hours=hour): float(hour % 24)
+        for hour in range(number_of_hours)
+    }
+
+
+class TestTimeSeries(UnitTestCaseWithMatplotlib):
+
+    def test_short_time_series_is_not_aggregated(self):
+        self.assertEqual(choose_aggregation_window(hourly_time_series(14 * 24)), datetime.timedelta(hours=1))
+
+    def test_year_is_aggregated_per_day(self):
+        self.assertEqual(choose_aggregation_window(hourly_time_series(365 * 24)), datetime.timedelta(days=1))
+
+    def test_empty_time_series(self):
+        self.assertEqual(choose_aggregation_window({}), datetime.timedelta(hours=1))
+
+    def test_envelope_keeps_peaks(self):
+        time_series = hourly_time_series(3 * 24)
+        time_series[datetime.datetime(2021, 7, 2, 5)] = 100
+        envelope = get_envelope(time_series, datetime.timedelta(days=1))
+        self.assertListEqual(list(envelope["minimum"]), [0, 0, 0])
+        self.assertListEqual(list(envelope["maximum"]), [23, 100, 23])
+        self.assertAlmostEqual(envelope["average"].iloc[0], 11.5)
+        self.assertEqual(envelope.index[1], datetime.datetime(2021, 7, 2))
+
+    def test_reject_non_positive_aggregation_window(self):
+        with self.assertRaises(ValueError):
+            get_envelope(hourly_time_series(24), datetime.timedelta(0))
+
+    def test_envelope_as_text(self):
+        text = get_envelope_as_text(hourly_time_series(2 * 24), datetime.timedelta(days=1))
+        self.assertEqual(text, """aggregated per 1 day, 0:00:00
+window start           minimum    average    maximum
+2021-07-01T00:00           0.0       11.5       23.0
+2021-07-02T00:00           0.0       11.5       23.0
+""")
+
+    def test_header_is_aligned_with_values(self):
+        header, first_row = get_envelope_as_text(hourly_time_series(24), datetime.timedelta(hours=7)).splitlines()[1:3]
+        self.assertEqual(len(header), len(first_row))
+        for column_title, value in zip(header.split()[2:], first_row.split()[1:]):
+            self.assertEqual(header.index(column_title) + len(column_title), first_row.index(value) + len(value))
+
+    def test_plot_hourly_values(self):
+        ax = plot_time_series(hourly_time_series(14 * 24))
+        self.assertEqual(len(ax.lines[0].get_xdata()), 14 * 24)
+
+    def test_plot_envelope(self):
+        ax = plot_time_series(hourly_time_series(365 * 24))
+        self.assertEqual(len(ax.lines), 1)
+        self.assertEqual(len(ax.lines[0].get_xdata()), 365)
+        self.assertEqual(len(ax.collections), 1)
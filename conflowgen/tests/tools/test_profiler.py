@@ -0,0 +1,68 @@
+import os
+import pstats
+import tempfile
+import time
+import unittest
+
+from conflowgen.api.database_chooser import DatabaseChooser
+from conflowgen.tests.substitute_peewee_database import setup_sqlite_in_memory_db
+from conflowgen.tools.profiler import Profiler
+
+
+def busy_function_to_profile(seconds: float) -> None:
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        sum(range(1000))
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        setup_sqlite_in_memory_db()
+        self.temporary_directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_save_pstats_and_collapsed_stacks(self):
+        with Profiler("busy", output_directory=self.temporary_directory.name, sampling_interval=0.001) as profiler:
+            busy_function_to_profile(0.1)
+        self.assertEqual(profiler.path_to_pstats, os.path.join(self.temporary_directory.name, "busy.pstats"))
+        self.assertEqual(
+            profiler.path_to_collapsed_stacks, os.path.join(self.temporary_directory.name, "busy.collapsed")
+        )
+
+        stats = pstats.Stats(profiler.path_to_pstats)
+        profiled_function_names = {function_name for (_, _, function_name) in stats.stats.keys()}
+        self.assertIn("busy_function_to_profile", profiled_function_names)
+
+        with open(profiler.path_to_collapsed_stacks, encoding="utf-8") as collapsed_stacks_file:
+            lines = collapsed_stacks_file.read().splitlines()
+        self.assertGreater(len(lines), 0)
+        for line in lines:
+            stack, number_of_samples = line.rsplit(" ", 1)
+            self.assertGreater(int(number_of_samples), 0)
+            self.assertIn("test_save_pstats_and_collapsed_stacks", stack)
+        self.assertTrue(any("busy_function_to_profile" in line for line in lines))
+
+    def test_without_sampling(self):
+        with Profiler("busy", output_directory=self.temporary_directory.name, sampling_interval=None) as profiler:
+            busy_function_to_profile(0.01)
+        self.assertTrue(os.path.isfile(profiler.path_to_pstats))
+        self.assertIsNone(profiler.path_to_collapsed_stacks)
+        self.assertListEqual(os.listdir(self.temporary_directory.name), ["busy.pstats"])
+
+    def test_invalid_sampling_interval(self):
+        with self.assertRaises(ValueError):
+            Profiler("busy", sampling_interval=0)
+
+    def test_save_next_to_database(self):
+        database_chooser = DatabaseChooser(sqlite_databases_directory=self.temporary_directory.name)
+        database_chooser.create_new_sqlite_database("my_database.sqlite")
+        self.addCleanup(database_chooser.close_current_connection)
+        with Profiler("busy") as profiler:
+            busy_function_to_profile(0.01)
+        self.assertEqual(
+            profiler.path_to_pstats, os.path.join(self.temporary_directory.name, "my_database_busy.pstats")
+        )
+        self.assertTrue(os.path.isfile(profiler.path_to_collapsed_stacks))
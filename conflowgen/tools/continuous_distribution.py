@@ -5,11 +5,13 @@ import math
 import typing
 
 import numpy as np
-import scipy.stats
 
 from conflowgen.domain_models.distribution_models.container_dwell_time_distribution import \
     ContainerDwellTimeDistributionInterface
 
+if typing.TYPE_CHECKING:
+    import scipy.stats
+
 
 class ContinuousDistribution(abc.ABC):
 
@@ -141,7 +143,10 @@ class ClippedLogNormal(ContinuousDistribution, short_name="lognormal"):
         scipy_shape = sigma2 ** 0.5
         scipy_scale = math.exp(mu)
 
-        frozen_lognorm = scipy.stats.lognorm(s=scipy_shape, scale=scipy_scale, loc=self.minimum)
+        # scipy.stats is only imported once a distribution is created as it takes long to import
+        from scipy import stats  # pylint: disable=import-outside-toplevel
+
+        frozen_lognorm = stats.lognorm(s=scipy_shape, scale=scipy_scale, loc=self.minimum)
 
         return frozen_lognorm
 
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import collections
+import cProfile
+import logging
+import os
+import sys
+import threading
+import typing
+
+from conflowgen.database_connection.current_database import get_path_to_current_database
+
+
+class Profiler:
+    """
+    Profiles the code run within the context in two ways at once:
+
+    - The deterministic profiler :mod:`cProfile` records each function call.
+      Its statistics are saved as a ``.pstats`` file which can be inspected with :mod:`pstats`, ``snakeviz``, or
+      similar tools.
+    - A sampling profiler looks up the call stack of the profiled thread at a fixed interval.
+      The stacks are saved in the collapsed format, i.e., one line per distinct stack with the frames separated by
+      semicolons, followed by the number of samples.
+      This is the format that ``py-spy`` emits with ``--format raw`` and that ``flamegraph.pl`` and speedscope read.
+
+    Only the thread that enters the context is profiled.
+    By default, the files are saved next to the SQLite database that is currently opened and their names start with
+    the name of the database.
+
+    .. code-block:: python
+
+        with Profiler("my_experiment"):
+            ContainerFlowGenerationManager().generate()
+    """
+
+    logger = logging.getLogger("conflowgen")
+
+    def __init__(
+            self,
+            name: str,
+            output_directory: typing.Optional[str] = None,
+            sampling_interval: typing.Optional[float] = 0.005
+    ):
+        """
+        Args:
+            name: The name of the profiled step, it is part of the file names
+            output_directory: The directory to save the files in.
+                Defaults to the directory of the current SQLite database.
+                If the database only exists in memory, the current working directory is used.
+            sampling_interval: The number of seconds between two samples of the call stack.
+                If it is :py:obj:`None`, only :mod:`cProfile` is used.
+        """
+        if sampling_interval is not None and sampling_interval <= 0:
+            raise ValueError(f"The sampling interval must be positive but it is {sampling_interval}")
+        path_to_database = get_path_to_current_database()
+        if output_directory is None:
+            output_directory = os.path.dirname(path_to_database) if path_to_database is not None else os.getcwd()
+        if path_to_database is not None:
+            name = f"{os.path.splitext(os.path.basename(path_to_database))[0]}_{name}"
+
+        #: The path to the statistics of :mod:`cProfile`
+        self.path_to_pstats = os.path.join(output_directory, f"{name}.pstats")
+
+        #: The path to the collapsed stacks of the sampling profiler, :py:obj:`None` if no samples are taken
+        self.path_to_collapsed_stacks = None if sampling_interval is None else \
+            os.path.join(output_directory, f"{name}.collapsed")
+
+        self.sampling_interval = sampling_interval
+        self._profile: typing.Optional[cProfile.Profile] = None
+        self._samples: typing.Counter[str] = collections.Counter()
+        self._stop_sampling = threading.Event()
+        self._sampling_thread: typing.Optional[threading.Thread] = None
+
+    @staticmethod
+    def _collapse_stack(frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def _sample(self, thread_id: int) -> None:
+        while not self._stop_sampling.wait(self.sampling_interval):
+            frame = sys._current_frames().get(thread_id)  # pylint: disable=protected-access
+            if frame is not None:
+                self._samples[self._collapse_stack(frame)] += 1
+
+    def __enter__(self) -> Profiler:
+        os.makedirs(os.path.dirname(self.path_to_pstats), exist_ok=True)
+        self._samples.clear()
+        if self.sampling_interval is not None:
+            self._stop_sampling.clear()
+            self._sampling_thread = threading.Thread(
+                target=self._sample, args=(threading.get_ident(), ), name="conflowgen-sampling-profiler", daemon=True
+            )
+            self._sampling_thread.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._profile.disable()
+        if self._sampling_thread is not None:
+            self._stop_sampling.set()
+            self._sampling_thread.join()
+            self._sampling_thread = None
+        self._profile.dump_stats(self.path_to_pstats)
+        self.logger.info(f"Saved the profile to {self.path_to_pstats}")
+        if self.path_to_collapsed_stacks is not None:
+            with open(self.path_to_collapsed_stacks, "w", encoding="utf-8") as collapsed_stacks_file:
+                for stack, number_of_samples in sorted(self._samples.items()):
+                    collapsed_stacks_file.write(f"{stack} {number_of_samples}\n")
+            self.logger.info(f"Saved {sum(self._samples.values())} samples of the call stack to "
+                             f"{self.path_to_collapsed_stacks}")
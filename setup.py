@@ -53,6 +53,7 @@ setup(
             'seaborn',  # some visuals in unittests are generated by seaborn
             'nbformat',
             'nbconvert',
+            'pyarrow',  # test the export to Parquet and Feather
 
             # build documentation
             'sphinx',  # build the documentation
@@ -74,6 +75,10 @@ setup(
             'wheel',  # use command 'bdist_wheel'
             'twine',  # check and upload package to PyPI
         ],
+        # export the container flow as Parquet or Feather files
+        'arrow': [
+            'pyarrow',
+        ],
         # a collection of nice-to-haves for working on Jupyter Notebooks - just a favorites list of the authors
         'jupyterlab': [
             "jupyterlab-spellchecker",